@@ -0,0 +1,208 @@
+import argparse
+import datetime
+
+import numpy as np
+import pandas as pd
+
+import config
+from CalcModelSpread import WIN_PAYOUT, calc_model_spread, edge_mask
+from KenPomAPI import KenPomAPI
+from KenPomIngest import read_archive
+from RatingsStore import list_snapshots, load_snapshot
+
+
+# Rename map from the KenPom game_results payload to the backtest's columns.
+# KenPomAPI.get_game_results is still a placeholder endpoint; adjust these if
+# the field names differ.
+GAME_RESULT_COLUMNS = {
+    "GameDate": "Date",
+    "Visitor": "Away Team",
+    "Home": "Home Team",
+    "VisitorScore": "Away Score",
+    "HomeScore": "Home Score",
+}
+
+REQUIRED_COLUMNS = ["Date", "Away Team", "Home Team", "Away Score", "Home Score", "Spread"]
+RATING_COLUMNS = ["AdjEM", "AdjTempo"]
+# Site values (game results or closing lines) that mark a neutral-site game
+NEUTRAL_SITES = {"N", "NEUTRAL"}
+
+
+def load_game_results(season):
+    """
+    Game results for a season, renamed to backtest columns: from the local
+    archive (KenPomIngest.py) when the season is there, else the KenPom API.
+    """
+    games = read_archive("game_results", seasons=[season])
+    if games.empty:
+        games = KenPomAPI(config.KENPOM_API_KEY).get_game_results(season=season)
+    games = games.rename(columns=GAME_RESULT_COLUMNS)
+    games["Date"] = pd.to_datetime(games["Date"])
+    return games
+
+
+def attach_closing_lines(games, lines):
+    """
+    Joins closing lines onto game results. `lines` needs Date, Away Team,
+    Home Team and Spread, with Spread signed like RunDanPom's: positive when
+    the home team is favored.
+    """
+    # A neutral-site flag in the lines is kept when the results don't have one
+    site_cols = [c for c in ("Neutral", "Site") if c in lines.columns and c not in games.columns]
+    lines = lines[["Date", "Away Team", "Home Team", "Spread", *site_cols]].copy()
+    lines["Date"] = pd.to_datetime(lines["Date"])
+    return games.merge(lines, on=["Date", "Away Team", "Home Team"], how="inner")
+
+
+def neutral_flags(games):
+    """
+    Per-game neutral-site flag from a Neutral column (bool) or a Site column
+    ('N' / 'Neutral'); every game is a home game when there is neither.
+    """
+    if "Neutral" in games.columns:
+        return games["Neutral"].fillna(False).astype(bool).to_numpy()
+    if "Site" in games.columns:
+        return games["Site"].astype("string").str.strip().str.upper().isin(NEUTRAL_SITES).fillna(False).to_numpy(bool)
+    return np.zeros(len(games), dtype=bool)
+
+
+class RatingsPanel:
+    """
+    Every ratings snapshot of a season stacked into (snapshot x team) arrays,
+    so point-in-time ratings for any number of games are a single gather.
+
+    A season with no snapshots (one from before they were taken) falls back
+    to its ratings in the KenPomIngest archive. That is a single frame
+    (ratings as of the backfill) used for every game, so it carries the
+    season's later results into earlier games.
+    """
+
+    def __init__(self, season):
+        snapshots = list_snapshots(season)
+        if snapshots:
+            times = [t for t, _ in snapshots]
+            frames = [load_snapshot(path) for _, path in snapshots]
+        else:
+            archived = read_archive("ratings", seasons=[season], columns=["TeamName", *RATING_COLUMNS])
+            if archived.empty:
+                raise RuntimeError(f"No KenPom snapshots or archived ratings for season {season}")
+            print(f"⚠ No KenPom snapshots for season {season}; using its archived ratings for every game")
+            # Before any game of the season (which starts in the previous calendar year)
+            times = [datetime.datetime(season - 1, 7, 1)]
+            frames = [archived]
+
+        self.times = np.array(times, dtype="datetime64[ns]")
+        self.teams = pd.Index(sorted(set().union(*(f["TeamName"] for f in frames))))
+
+        self.values = {}
+        for col in RATING_COLUMNS:
+            panel = np.full((len(frames), len(self.teams)), np.nan)
+            for i, frame in enumerate(frames):
+                panel[i, self.teams.get_indexer(frame["TeamName"])] = frame[col].to_numpy(dtype=float)
+            self.values[col] = panel
+
+    def lookup(self, dates, team_names):
+        """
+        Ratings for each (date, team) pair from the newest snapshot taken at or
+        before that date. Missing snapshots or teams come back as NaN.
+
+        Returns:
+            dict: rating column -> np.ndarray aligned with the inputs
+        """
+        snap_idx = np.searchsorted(self.times, np.asarray(dates, dtype="datetime64[ns]"), side="right") - 1
+        team_idx = self.teams.get_indexer(team_names)
+        valid = (snap_idx >= 0) & (team_idx >= 0)
+
+        out = {}
+        for col, panel in self.values.items():
+            values = np.full(len(team_idx), np.nan)
+            values[valid] = panel[snap_idx[valid], team_idx[valid]]
+            out[col] = values
+        return out
+
+
+def run_backtest(games, panel, tourney_gm=False):
+    """
+    Applies the DanPom model and edge rule to historical games.
+
+    Parameters:
+        games (pd.DataFrame): Game results with closing lines (REQUIRED_COLUMNS)
+        panel (RatingsPanel): Point-in-time KenPom ratings for the season
+        tourney_gm (bool): Drop the home court adjustment for every game, as
+            in RunDanPom; otherwise only neutral-site games (neutral_flags) go without it
+
+    Returns:
+        pd.DataFrame: games with model spread, bet side (1 home, -1 away,
+                      0 no bet), ATS result (1 win, -1 loss, 0 push/no bet)
+                      and units won per game
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in games.columns]
+    if missing:
+        raise KeyError(f"Backtest games are missing columns: {missing}")
+
+    df = games.reset_index(drop=True).copy()
+    # Ratings as of the start of game day
+    dates = pd.to_datetime(df["Date"]).dt.normalize().to_numpy()
+    for side in ("Away", "Home"):
+        ratings = panel.lookup(dates, df[f"{side} Team"])
+        for col in RATING_COLUMNS:
+            df[f"{col}_{side}"] = ratings[col]
+
+    # Home court per game, as in the live model: calc_model_spread goes
+    # through home_court(df, tourney_gm), which reads Neutral
+    df["Neutral"] = neutral_flags(df)
+    df["Model_Spread"] = calc_model_spread(df, tourney_gm)
+
+    model = df["Model_Spread"].to_numpy()
+    spread = df["Spread"].to_numpy(dtype=float)
+    adjem_home = df["AdjEM_Home"].to_numpy()
+    adjem_away = df["AdjEM_Away"].to_numpy()
+    margin = df["Home Score"].to_numpy(dtype=float) - df["Away Score"].to_numpy(dtype=float)
+
+    edge = edge_mask(model, spread, adjem_home, adjem_away)
+    bet_side = np.where(edge, np.sign(model - spread), 0).astype(np.int8)
+    # Home covers when the home margin beats the line; away when it falls short
+    cover = np.sign(np.nan_to_num(margin - spread))
+    result = (bet_side * cover).astype(np.int8)
+
+    df["Edge"] = edge
+    df["Bet_Side"] = bet_side
+    df["ATS_Result"] = result
+    df["Units"] = np.select([result > 0, result < 0], [WIN_PAYOUT, -1.0], 0.0)
+    return df
+
+
+def summarize(results):
+    """Record, units and ROI for a run_backtest result frame."""
+    bets = results["Bet_Side"] != 0
+    wins = int((results["ATS_Result"] > 0).sum())
+    losses = int((results["ATS_Result"] < 0).sum())
+    pushes = int(bets.sum()) - wins - losses
+    units = float(results["Units"].sum())
+    return {
+        "games": len(results),
+        "bets": int(bets.sum()),
+        "wins": wins,
+        "losses": losses,
+        "pushes": pushes,
+        "win_pct": wins / (wins + losses) if wins + losses else np.nan,
+        "units": units,
+        "roi": units / bets.sum() if bets.sum() else np.nan,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest the DanPom edge rule over a season.")
+    parser.add_argument("--season", type=int, required=True)
+    parser.add_argument("--lines", required=True,
+                        help="CSV of closing lines: Date, Away Team, Home Team, Spread")
+    parser.add_argument("--out", help="Optional CSV path for per-game results")
+    args = parser.parse_args()
+
+    games = attach_closing_lines(load_game_results(args.season), pd.read_csv(args.lines))
+    results = run_backtest(games, RatingsPanel(args.season), config.TOURNEY_GM)
+    for key, value in summarize(results).items():
+        print(f"{key:>8}: {value:.3f}" if isinstance(value, float) else f"{key:>8}: {value}")
+
+    if args.out:
+        results.to_csv(args.out, index=False)
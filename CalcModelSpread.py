@@ -1,15 +1,40 @@
-import pandas as pd
+import numpy as np
+
+HOME_COURT_ADVANTAGE = 3.5
+
+# Units won on a winning bet at standard -110 juice
+WIN_PAYOUT = 100 / 110
+
+
+def home_court(df, tourney_gm=False, hca=HOME_COURT_ADVANTAGE):
+    """
+    Points of home court advantage for each game: none at neutral sites
+    (df['Neutral'], from the ESPN schedule) or for every game when tourney_gm
+    is set, hca otherwise.
+    """
+    if tourney_gm:
+        return np.zeros(len(df))
+    if 'Neutral' not in df.columns:
+        return np.full(len(df), float(hca))
+    neutral = df['Neutral'].fillna(False).to_numpy(bool)
+    return np.where(neutral, 0.0, hca)
+
 
 def calc_model_spread(df, tourney_gm):
-    home_eff = df['AdjEM_Home'].astype(float)
-    away_eff = df['AdjEM_Away'].astype(float)
-    home_tempo = df['AdjTempo_Home'].astype(float)
-    away_tempo = df['AdjTempo_Away'].astype(float)
-    # Tournament games don't need the 3.5 coefficient
-    if tourney_gm == True:
-        model_odds = ((home_eff - away_eff) * (home_tempo + away_tempo) / 200)
-    else:
-        model_odds = ((home_eff - away_eff)*(home_tempo + away_tempo)/200)+3.5
+    # Ratings arrive as floats (Schemas.apply_schema at ingest, RatingsPanel in backtests)
+    home_eff = df['AdjEM_Home']
+    away_eff = df['AdjEM_Away']
+    home_tempo = df['AdjTempo_Home']
+    away_tempo = df['AdjTempo_Away']
+    # Neutral-site and tournament games don't get the 3.5 coefficient
+    model_odds = ((home_eff - away_eff) * (home_tempo + away_tempo) / 200) + home_court(df, tourney_gm)
     return model_odds
 
 
+def edge_mask(model_spread, spread, adjem_home, adjem_away):
+    # Model likes the home side more than the line and home is above average,
+    # or likes the away side more and away is above average
+    return (
+        ((model_spread > spread) & (adjem_home > 0)) |
+        ((model_spread < spread) & (adjem_away > 0))
+    )
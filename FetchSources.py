@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class FetchSource:
+    """
+    One data source for the report.
+
+    Parameters:
+        name (str): Label used in progress output and as the result key.
+        func (callable): Zero-argument callable returning a DataFrame (or None).
+        timeout (float): Seconds to wait for this source, measured from the
+            moment all sources are started.
+        required (bool): If True a failure or timeout aborts the run; otherwise
+            the source's result is None and the run continues.
+        main_thread (bool): Run in the calling thread instead of the pool. Needed
+            for anything that installs signal handlers (pyppeteer/Chromium).
+    """
+
+    def __init__(self, name, func, timeout=60, required=True, main_thread=False):
+        self.name = name
+        self.func = func
+        self.timeout = timeout
+        self.required = required
+        self.main_thread = main_thread
+
+
+def _run_timed(source):
+    start = time.perf_counter()
+    result = source.func()
+    return result, time.perf_counter() - start
+
+
+def _record_success(source, elapsed, metrics=None):
+    print(f"✓ {source.name} finished in {elapsed:.1f}s")
+    if metrics is not None:
+        metrics.record_time(f"fetch.{source.name}", elapsed)
+
+
+def _handle_failure(source, error, metrics=None, elapsed=0):
+    if metrics is not None:
+        metrics.count("source_failures")
+        metrics.record_time(f"fetch.{source.name}", elapsed, error=str(error))
+    if source.required:
+        raise RuntimeError(f"Required source '{source.name}' failed: {error}") from error
+    print(f"⚠ {source.name} unavailable: {error}")
+    return None
+
+
+def fetch_all_sources(sources, metrics=None):
+    """
+    Start every source at once and wait for all of them.
+
+    Pool sources run in worker threads while any main_thread sources run inline,
+    so the wall-clock time of the fetch stage is set by the slowest source rather
+    than the sum of all of them. With a RunMetrics, each source's time and any
+    failures are recorded as "fetch.<name>" stages and "source_failures".
+
+    Returns:
+        dict: source name -> DataFrame (None for optional sources that failed)
+    """
+    results = {}
+    pool_sources = [s for s in sources if not s.main_thread]
+    inline_sources = [s for s in sources if s.main_thread]
+
+    executor = ThreadPoolExecutor(max_workers=max(len(pool_sources), 1),
+                                  thread_name_prefix="fetch")
+    started = time.perf_counter()
+    futures = {s.name: executor.submit(_run_timed, s) for s in pool_sources}
+
+    try:
+        for source in inline_sources:
+            try:
+                results[source.name], elapsed = _run_timed(source)
+                _record_success(source, elapsed, metrics)
+            except Exception as e:
+                results[source.name] = _handle_failure(source, e, metrics, time.perf_counter() - started)
+
+        for source in pool_sources:
+            remaining = max(source.timeout - (time.perf_counter() - started), 0)
+            try:
+                results[source.name], elapsed = futures[source.name].result(timeout=remaining)
+                _record_success(source, elapsed, metrics)
+            except FutureTimeoutError:
+                error = TimeoutError(f"no result after {source.timeout}s")
+                results[source.name] = _handle_failure(source, error, metrics, time.perf_counter() - started)
+            except Exception as e:
+                results[source.name] = _handle_failure(source, e, metrics, time.perf_counter() - started)
+    finally:
+        # A timed-out worker can't be killed; don't let it hold up the merge step.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    print(f"All sources fetched in {time.perf_counter() - started:.1f}s\n")
+    return results
@@ -1,8 +1,89 @@
 import requests
+import numpy as np
+import orjson
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import argparse
+import base64
 import json
 import os
+import threading
+import time
+
+from HttpCache import cached_get
+from HttpTransport import Transport
+
+
+# Column order of parse_sharp_report_to_df's output
+SHARP_REPORT_COLUMNS = [
+    'Away Team', 'Home Team',
+    # Raw spread percentages (every game)
+    'Spread_Tickets_Away', 'Spread_Money_Away', 'Spread_Tickets_Home', 'Spread_Money_Home',
+    # Money vs tickets differential for spread (key sharp indicator)
+    'Money_Diff_Away', 'Money_Diff_Home',
+    # Raw total percentages (every game)
+    'Total_Line', 'Total_Tickets_Over', 'Total_Money_Over', 'Total_Tickets_Under', 'Total_Money_Under',
+    # Money vs tickets differential for totals
+    'Total_Money_Diff_Over',
+    # PRO flagged signals
+    'Sharp_on_Away', 'Steam_Moves_Away', 'Sharp_on_Home', 'Steam_Moves_Home',
+    'Big_Bets_Flagged_Away', 'Big_Bets_Flagged_Home', 'Power_Edge_Away', 'Power_Edge_Home',
+    'Sharp_on_Over', 'Steam_Moves_Over', 'Sharp_on_Under', 'Steam_Moves_Under',
+    'Start_Time',
+]
+FLAG_COLUMNS = ['Sharp_on_Away', 'Sharp_on_Home', 'Sharp_on_Over', 'Sharp_on_Under',
+                'Big_Bets_Flagged_Away', 'Big_Bets_Flagged_Home']
+STEAM_COLUMNS = ['Steam_Moves_Away', 'Steam_Moves_Home', 'Steam_Moves_Over', 'Steam_Moves_Under']
+FLOAT_COLUMNS = ['Spread_Tickets_Away', 'Spread_Money_Away', 'Spread_Tickets_Home', 'Spread_Money_Home',
+                 'Total_Line', 'Total_Tickets_Over', 'Total_Money_Over', 'Total_Tickets_Under',
+                 'Total_Money_Under', 'Power_Edge_Away', 'Power_Edge_Home']
+
+# (pro_report market, side, column suffix) for the signal scan
+SIGNAL_SIDES = [('spread', 'away', 'Away'), ('spread', 'home', 'Home'),
+                ('total', 'over', 'Over'), ('total', 'under', 'Under')]
+
+CONSENSUS_BOOK_ID = '15'  # DraftKings
+BOOK_IDS = ['15', '30', '1006', '1548', '974', '939', '1005', '972', '1902', '1903', '2194']
+
+# Categories of parse_market_lines_long's Market and Side columns
+MARKETS = ['spread', 'total']
+SIDES = ['away', 'home', 'over', 'under']
+
+# (is spread market, entry side) -> (column prefix, column suffix)
+MARKET_SIDE_PREFIX = {
+    (True, 'away'): ('Spread', 'Away'), (True, 'home'): ('Spread', 'Home'),
+    (False, 'over'): ('Total', 'Over'), (False, 'under'): ('Total', 'Under'),
+}
+
+
+API_URL = "https://api.actionnetwork.com/web"
+
+# Extra pro report parameters per league
+LEAGUE_PARAMS = {
+    'ncaab': {'division': 'D1'},
+}
+
+# Log in again this many seconds before the token's exp claim
+TOKEN_REFRESH_MARGIN = 600
+# After a failed login, keep using the current token this long before retrying
+LOGIN_RETRY_SECONDS = 300
+
+# Concurrent report requests; api.actionnetwork.com is also rate limited by the Transport
+MAX_WORKERS = 8
+
+
+def token_expiry(token):
+    """
+    Unix time of a JWT's exp claim, or None if the token has none (or isn't
+    a JWT). The signature is not checked; this only schedules the next login.
+    """
+    try:
+        payload = token.split('.')[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
 
 
 class ActionNetworkClient:
@@ -13,7 +94,8 @@ class ActionNetworkClient:
     def __init__(self, email, password):
         self.email = email
         self.password = password
-        self.session = requests.Session()
+        # Own Transport: the Authorization header must not leak to other hosts
+        self.session = Transport()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
             'Accept': 'application/json',
@@ -21,13 +103,22 @@ class ActionNetworkClient:
             'Referer': 'https://www.actionnetwork.com/'
         })
         self.token = None
+        self.token_expires_at = None
+        self._token_lock = threading.Lock()
+        self._cache_file_read = False
+        self._next_login_at = 0
+
+    def _set_token(self, token):
+        self.token = token
+        self.token_expires_at = token_expiry(token)
 
     def _load_cached_token(self):
         """Load token from cache file if it exists and is valid."""
+        self._cache_file_read = True
         if os.path.exists(self.TOKEN_CACHE_FILE):
             try:
                 with open(self.TOKEN_CACHE_FILE, 'r') as f:
-                    self.token = f.read().strip()
+                    self._set_token(f.read().strip())
                 return True
             except:
                 return False
@@ -59,7 +150,7 @@ class ActionNetworkClient:
             data = response.json()
 
             if 'token' in data:
-                self.token = data['token']
+                self._set_token(data['token'])
                 self._save_token()
                 print("✓ Successfully logged in to Action Network")
                 return True
@@ -77,92 +168,115 @@ class ActionNetworkClient:
             print(f"Login error: {e}")
             return False
 
-    def get_sharp_report(self, date_str=None):
-        """Fetch sharp money report for NCAAB games."""
-        # Try cached token first
-        if not self.token:
-            if not self._load_cached_token():
-                if not self.login():
-                    raise Exception("Failed to authenticate with Action Network")
+    def _token_expiring(self):
+        return self.token is None or (self.token_expires_at is not None
+                                      and time.time() >= self.token_expires_at - TOKEN_REFRESH_MARGIN)
+
+    def authenticate(self):
+        """
+        Bearer token for the next request. The cached token file is read once
+        per client; when the token is within TOKEN_REFRESH_MARGIN of its exp
+        claim the client logs in again before sending anything. If that login
+        fails (captcha), the current token is kept until LOGIN_RETRY_SECONDS
+        have passed. Safe to call from several threads.
+        """
+        with self._token_lock:
+            if self.token is None and not self._cache_file_read:
+                self._load_cached_token()
+            if self._token_expiring() and time.time() >= self._next_login_at:
+                # A 400 makes login() fall back to the cached token, which is
+                # the expiring one; that is a failed login too
+                if not self.login() or self._token_expiring():
+                    self._next_login_at = time.time() + LOGIN_RETRY_SECONDS
+                    if self.token_expires_at is not None and time.time() >= self.token_expires_at:
+                        print("⚠ Action Network token has expired; PRO signals will be missing")
+            if self.token is None:
+                raise Exception("Failed to authenticate with Action Network")
+            return self.token
+
+    def get_sharp_report(self, date_str=None, league='ncaab', tournament=0):
+        """Fetch the pro (sharp money) report for one league and date."""
+        token = self.authenticate()
 
         if date_str is None:
             date_str = datetime.now().strftime("%Y%m%d")
 
-        url = "https://api.actionnetwork.com/web/v2/scoreboard/proreport/ncaab"
+        url = f"{API_URL}/v2/scoreboard/proreport/{league}"
 
         params = {
-            'bookIds': '15,30,1006,1548,974,939,1005,972,1902,1903,2194',
+            'bookIds': ','.join(BOOK_IDS),
             'date': date_str,
-            'division': 'D1',
+            **LEAGUE_PARAMS.get(league, {}),
             'periods': 'event',
-            'tournament': '0'
+            'tournament': str(tournament)
         }
 
         # Always send the Bearer token — the API returns 200 without it but
-        # silently omits pro_report data (sharp signals, steam moves, etc.)
-        self.session.headers.update({
-            'Authorization': f'Bearer {self.token}'
-        })
-        response = self.session.get(url, params=params)
+        # silently omits pro_report data (sharp signals, steam moves, etc.).
+        # Sent per request so concurrent fetches can't see a half-swapped token.
+        response = cached_get(url, "action_network", params=params,
+                              headers={'Authorization': f'Bearer {token}'}, session=self.session)
 
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
-    @staticmethod
-    def _parse_market_percentages(markets, book_id='15'):
-        """
-        Extract spread and total ticket/money percentages from the markets field.
-        Uses book_id 15 (DraftKings) as the consensus source. Falls back to the
-        first available book if 15 is not present.
+    def get_sharp_reports(self, dates, leagues=('ncaab',), tournament=0, max_workers=MAX_WORKERS):
         """
-        result = {
-            'Spread_Tickets_Away': None, 'Spread_Money_Away': None,
-            'Spread_Tickets_Home': None, 'Spread_Money_Home': None,
-            'Total_Tickets_Over': None, 'Total_Money_Over': None,
-            'Total_Tickets_Under': None, 'Total_Money_Under': None,
-            'Total_Line': None,
-        }
+        Fetch the pro report for every (date, league) pair concurrently over
+        this client's pooled session. Authenticates once up front; a request
+        that fails is reported and left out.
 
-        book_data = markets.get(book_id) or next(iter(markets.values()), {})
-        bets = book_data.get('event', {})
-
-        for bet_type, entries in bets.items():
-            for e in entries:
-                side = e.get('side')
-                tickets_pct = e.get('bet_info', {}).get('tickets', {}).get('percent')
-                money_pct = e.get('bet_info', {}).get('money', {}).get('percent')
-
-                if 'spread' in bet_type:
-                    if side == 'away':
-                        result['Spread_Tickets_Away'] = tickets_pct
-                        result['Spread_Money_Away'] = money_pct
-                    elif side == 'home':
-                        result['Spread_Tickets_Home'] = tickets_pct
-                        result['Spread_Money_Home'] = money_pct
-
-                elif 'team_score' in bet_type or 'total' in bet_type:
-                    if side == 'over':
-                        result['Total_Tickets_Over'] = tickets_pct
-                        result['Total_Money_Over'] = money_pct
-                        result['Total_Line'] = e.get('value')
-                    elif side == 'under':
-                        result['Total_Tickets_Under'] = tickets_pct
-                        result['Total_Money_Under'] = money_pct
-
-        return result
+        Returns:
+            dict: (date_str, league) -> report JSON, in dates x leagues order
+        """
+        self.authenticate()
+        keys = [(date_str, league) for date_str in dates for league in leagues]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="action_network") as executor:
+            futures = {key: executor.submit(self.get_sharp_report, key[0], key[1], tournament) for key in keys}
+            reports = {}
+            for key, future in futures.items():
+                try:
+                    reports[key] = future.result()
+                except Exception as e:
+                    print(f"Error fetching Action Network {key[1]} report for {key[0]}: {e}")
+        return reports
+
+    def get_sharp_report_frame(self, dates, leagues=('ncaab',), tournament=0, max_workers=MAX_WORKERS):
+        """
+        Every (date, league) pro report as one DataFrame: the
+        parse_sharp_report_to_df columns behind Date and League columns.
+        """
+        reports = self.get_sharp_reports(dates, leagues, tournament, max_workers)
+        frames = [self.parse_sharp_report_to_df(data).assign(Date=date_str, League=league)
+                  for (date_str, league), data in reports.items()]
+        if not frames:
+            return pd.DataFrame(columns=['Date', 'League'] + SHARP_REPORT_COLUMNS)
+        df = pd.concat(frames, ignore_index=True)
+        return df[['Date', 'League'] + SHARP_REPORT_COLUMNS]
 
     def parse_sharp_report_to_df(self, data):
-        """Parse sharp report JSON to DataFrame."""
-        games_data = []
+        """
+        Parse sharp report JSON to DataFrame.
 
-        for game in data.get('games', []):
+        Fills one typed array per column in a single pass over the games and
+        builds the frame once: bool for flags, int8 for steam move counts,
+        float32 for percentages, lines and edges (NaN when missing).
+        """
+        games = data.get('games', [])
+        n = len(games)
+
+        away_names = np.empty(n, dtype=object)
+        home_names = np.empty(n, dtype=object)
+        start_times = np.empty(n, dtype=object)
+        flags = {col: np.zeros(n, dtype=bool) for col in FLAG_COLUMNS}
+        steam = {col: np.zeros(n, dtype=np.int8) for col in STEAM_COLUMNS}
+        floats = {col: np.full(n, np.nan, dtype=np.float32) for col in FLOAT_COLUMNS}
+
+        for i, game in enumerate(games):
             # Use away_team_id and home_team_id to correctly identify teams
             away_team_id = game.get('away_team_id')
             home_team_id = game.get('home_team_id')
-
-            # Find the correct team names by matching IDs
-            away_team = None
-            home_team = None
+            away_team = home_team = None
             for team in game['teams']:
                 if team['id'] == away_team_id:
                     away_team = team['display_name']
@@ -174,108 +288,173 @@ class ActionNetworkClient:
                 away_team = game['teams'][0]['display_name']
                 home_team = game['teams'][1]['display_name']
 
-            pro_report = game.get('pro_report', {})
+            away_names[i] = away_team
+            home_names[i] = home_team
+            start_times[i] = game['start_time']
 
             # --- PRO REPORT SIGNALS (flagged by Action Network) ---
-            spread_data = pro_report.get('spread', {})
-            total_data = pro_report.get('total', {})
-
-            sharp_on_away = False
-            sharp_on_home = False
-            steam_moves_away = 0
-            steam_moves_home = 0
-            big_bets_flagged_away = False
-            big_bets_flagged_home = False
-            power_edge_away = 0.0
-            power_edge_home = 0.0
-            sharp_on_over = False
-            sharp_on_under = False
-            steam_moves_over = 0
-            steam_moves_under = 0
-
-            for signal in spread_data.get('away', []):
-                t = signal.get('signal_type')
-                if t == 'sharp_money':
-                    sharp_on_away = True
-                    steam_moves_away = signal.get('meta', {}).get('steam_moves', 0)
-                elif t == 'big_bets':
-                    big_bets_flagged_away = True
-                elif t == 'power_rating_edge':
-                    power_edge_away = signal.get('meta', {}).get('edge', 0.0)
-
-            for signal in spread_data.get('home', []):
-                t = signal.get('signal_type')
-                if t == 'sharp_money':
-                    sharp_on_home = True
-                    steam_moves_home = signal.get('meta', {}).get('steam_moves', 0)
-                elif t == 'big_bets':
-                    big_bets_flagged_home = True
-                elif t == 'power_rating_edge':
-                    power_edge_home = signal.get('meta', {}).get('edge', 0.0)
-
-            for signal in total_data.get('over', []):
-                if signal.get('signal_type') == 'sharp_money':
-                    sharp_on_over = True
-                    steam_moves_over = signal.get('meta', {}).get('steam_moves', 0)
-
-            for signal in total_data.get('under', []):
-                if signal.get('signal_type') == 'sharp_money':
-                    sharp_on_under = True
-                    steam_moves_under = signal.get('meta', {}).get('steam_moves', 0)
+            pro_report = game.get('pro_report') or {}
+            for market, side, suffix in SIGNAL_SIDES:
+                for signal in (pro_report.get(market) or {}).get(side, ()):
+                    t = signal.get('signal_type')
+                    if t == 'sharp_money':
+                        flags[f'Sharp_on_{suffix}'][i] = True
+                        steam[f'Steam_Moves_{suffix}'][i] = min(signal.get('meta', {}).get('steam_moves') or 0, 127)
+                    elif market == 'spread' and t == 'big_bets':
+                        flags[f'Big_Bets_Flagged_{suffix}'][i] = True
+                    elif market == 'spread' and t == 'power_rating_edge':
+                        floats[f'Power_Edge_{suffix}'][i] = signal.get('meta', {}).get('edge') or 0.0
 
             # --- RAW BET/MONEY PERCENTAGES from markets (all games, not just flagged) ---
-            market_pcts = self._parse_market_percentages(game.get('markets', {}))
-
-            # Money differential: positive = more money than tickets (sharp indicator)
-            spread_money_diff_away = (
-                (market_pcts['Spread_Money_Away'] or 0) - (market_pcts['Spread_Tickets_Away'] or 0)
-            )
-            spread_money_diff_home = (
-                (market_pcts['Spread_Money_Home'] or 0) - (market_pcts['Spread_Tickets_Home'] or 0)
-            )
-
-            total_money_diff_over = (
-                (market_pcts['Total_Money_Over'] or 0) - (market_pcts['Total_Tickets_Over'] or 0)
-            )
-
-            game_info = {
-                'Away Team': away_team,
-                'Home Team': home_team,
-                # Raw spread percentages (every game)
-                'Spread_Tickets_Away': market_pcts['Spread_Tickets_Away'],
-                'Spread_Money_Away': market_pcts['Spread_Money_Away'],
-                'Spread_Tickets_Home': market_pcts['Spread_Tickets_Home'],
-                'Spread_Money_Home': market_pcts['Spread_Money_Home'],
-                # Money vs tickets differential for spread (key sharp indicator)
-                'Money_Diff_Away': spread_money_diff_away,
-                'Money_Diff_Home': spread_money_diff_home,
-                # Raw total percentages (every game)
-                'Total_Line': market_pcts['Total_Line'],
-                'Total_Tickets_Over': market_pcts['Total_Tickets_Over'],
-                'Total_Money_Over': market_pcts['Total_Money_Over'],
-                'Total_Tickets_Under': market_pcts['Total_Tickets_Under'],
-                'Total_Money_Under': market_pcts['Total_Money_Under'],
-                # Money vs tickets differential for totals
-                'Total_Money_Diff_Over': total_money_diff_over,
-                # PRO flagged signals
-                'Sharp_on_Away': sharp_on_away,
-                'Steam_Moves_Away': steam_moves_away,
-                'Sharp_on_Home': sharp_on_home,
-                'Steam_Moves_Home': steam_moves_home,
-                'Big_Bets_Flagged_Away': big_bets_flagged_away,
-                'Big_Bets_Flagged_Home': big_bets_flagged_home,
-                'Power_Edge_Away': power_edge_away,
-                'Power_Edge_Home': power_edge_home,
-                'Sharp_on_Over': sharp_on_over,
-                'Steam_Moves_Over': steam_moves_over,
-                'Sharp_on_Under': sharp_on_under,
-                'Steam_Moves_Under': steam_moves_under,
-                'Start_Time': game['start_time']
-            }
-
-            games_data.append(game_info)
-
-        return pd.DataFrame(games_data)
+            # Book 15 (DraftKings) is the consensus source; fall back to the first book
+            markets = game.get('markets') or {}
+            book_data = markets.get(CONSENSUS_BOOK_ID) or next(iter(markets.values()), {})
+            for bet_type, entries in book_data.get('event', {}).items():
+                is_spread = 'spread' in bet_type
+                if not is_spread and 'team_score' not in bet_type and 'total' not in bet_type:
+                    continue
+                for e in entries:
+                    prefix = MARKET_SIDE_PREFIX.get((is_spread, e.get('side')))
+                    if prefix is None:
+                        continue
+                    bet_info = e.get('bet_info', {})
+                    tickets = bet_info.get('tickets', {}).get('percent')
+                    money = bet_info.get('money', {}).get('percent')
+                    floats[f'{prefix[0]}_Tickets_{prefix[1]}'][i] = np.nan if tickets is None else tickets
+                    floats[f'{prefix[0]}_Money_{prefix[1]}'][i] = np.nan if money is None else money
+                    if prefix == ('Total', 'Over'):
+                        value = e.get('value')
+                        floats['Total_Line'][i] = np.nan if value is None else value
+
+        # Power edges default to 0 like the flags; percentages stay NaN when missing
+        floats['Power_Edge_Away'] = np.nan_to_num(floats['Power_Edge_Away'])
+        floats['Power_Edge_Home'] = np.nan_to_num(floats['Power_Edge_Home'])
+
+        # Money differential: positive = more money than tickets (sharp indicator)
+        def diff(money, tickets):
+            return (np.nan_to_num(floats[money]) - np.nan_to_num(floats[tickets])).astype(np.float32)
+
+        floats['Money_Diff_Away'] = diff('Spread_Money_Away', 'Spread_Tickets_Away')
+        floats['Money_Diff_Home'] = diff('Spread_Money_Home', 'Spread_Tickets_Home')
+        floats['Total_Money_Diff_Over'] = diff('Total_Money_Over', 'Total_Tickets_Over')
+
+        columns = {'Away Team': away_names, 'Home Team': home_names, **floats, **flags, **steam,
+                   'Start_Time': start_times}
+        return pd.DataFrame({col: columns[col] for col in SHARP_REPORT_COLUMNS})
+
+    def parse_market_lines_long(self, data):
+        """
+        Every book's spread and total lines with ticket/money percentages, in
+        long format: one row per game x book x market x side. Book, Market and
+        Side are categoricals, numbers are float32 (NaN when missing).
+        """
+        game_idx, books, market_names, sides = [], [], [], []
+        lines, odds, tickets, money = [], [], [], []
+        away_names, home_names, game_ids = [], [], []
+
+        for i, game in enumerate(data.get('games', [])):
+            teams = {team['id']: team['display_name'] for team in game['teams']}
+            away_names.append(teams.get(game.get('away_team_id'), game['teams'][0]['display_name']))
+            home_names.append(teams.get(game.get('home_team_id'), game['teams'][1]['display_name']))
+            game_ids.append(game.get('id', i))
+
+            for book_id, book_data in (game.get('markets') or {}).items():
+                for bet_type, entries in book_data.get('event', {}).items():
+                    market = _market_of(bet_type)
+                    if market is None:
+                        continue
+                    for e in entries:
+                        bet_info = e.get('bet_info', {})
+                        game_idx.append(i)
+                        books.append(book_id)
+                        market_names.append(market)
+                        sides.append(e.get('side'))
+                        lines.append(e.get('value'))
+                        odds.append(e.get('odds'))
+                        tickets.append(bet_info.get('tickets', {}).get('percent'))
+                        money.append(bet_info.get('money', {}).get('percent'))
+
+        game_idx = np.asarray(game_idx, dtype=np.int32)
+
+        def per_row(values):
+            return np.asarray(values, dtype=object)[game_idx]
+
+        def as_float32(values):
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float32)
+
+        return pd.DataFrame({
+            'Game_ID': per_row(game_ids),
+            'Away Team': pd.Categorical(per_row(away_names)),
+            'Home Team': pd.Categorical(per_row(home_names)),
+            'Book': pd.Categorical(books, categories=sorted(set(books) | set(BOOK_IDS), key=int)),
+            'Market': pd.Categorical(market_names, categories=MARKETS),
+            'Side': pd.Categorical(sides, categories=SIDES),
+            'Line': as_float32(lines),
+            'Odds': as_float32(odds),
+            'Tickets_Pct': as_float32(tickets),
+            'Money_Pct': as_float32(money),
+        })
+
+
+def _market_of(bet_type):
+    # Full-game spread and total only; team totals would collide with game totals
+    if 'spread' in bet_type:
+        return 'spread'
+    if 'total' in bet_type and 'team' not in bet_type:
+        return 'total'
+    return None
+
+
+def _decimal_payout(american_odds):
+    odds = np.asarray(american_odds, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 0, 1 + odds / 100, 1 + 100 / -odds)
+
+
+def best_available_lines(lines_df):
+    """
+    The best line on each side of each market across all books: the most
+    points for spreads and unders, the fewest for overs, with better odds
+    breaking ties.
+
+    Parameters:
+        lines_df (pd.DataFrame): Output of parse_market_lines_long
+
+    Returns:
+        pd.DataFrame: one row per game x market x side
+    """
+    df = lines_df.dropna(subset=['Line'])
+    # Higher is better for the bettor once overs are flipped
+    score = np.where(df['Side'] == 'over', -df['Line'], df['Line'])
+    df = df.assign(_score=score, _payout=_decimal_payout(df['Odds']))
+    df = df.sort_values(['Game_ID', 'Market', 'Side', '_score', '_payout'],
+                        ascending=[True, True, True, False, False])
+    best = df.drop_duplicates(['Game_ID', 'Market', 'Side'])
+    return best.drop(columns=['_score', '_payout']).reset_index(drop=True)
+
+
+def consensus_lines(lines_df):
+    """
+    Cross-book consensus for each game x market x side: median line and odds,
+    mean ticket/money percentages, and how many books price it.
+    """
+    grouped = lines_df.groupby(['Game_ID', 'Market', 'Side'], observed=True, sort=False)
+    return grouped.agg(
+        Consensus_Line=('Line', 'median'),
+        Consensus_Odds=('Odds', 'median'),
+        Tickets_Pct=('Tickets_Pct', 'mean'),
+        Money_Pct=('Money_Pct', 'mean'),
+        Books=('Line', 'count'),
+    ).reset_index()
+
+
+def line_shopping_table(lines_df):
+    """Best available line per side next to the cross-book consensus."""
+    best = best_available_lines(lines_df)[['Game_ID', 'Away Team', 'Home Team', 'Market', 'Side',
+                                           'Book', 'Line', 'Odds']]
+    best = best.rename(columns={'Book': 'Best_Book', 'Line': 'Best_Line', 'Odds': 'Best_Odds'})
+    return best.merge(consensus_lines(lines_df), on=['Game_ID', 'Market', 'Side'], how='left')
+
 
 
 def get_action_network_sharp_report(email, password, date_str=None):
@@ -306,6 +485,27 @@ if __name__ == "__main__":
     pd.set_option('display.max_columns', None)
     pd.set_option('display.width', 200)
 
+    parser = argparse.ArgumentParser(description="Fetch Action Network pro reports.")
+    parser.add_argument("--start", help="First date of a backfill (YYYYMMDD)")
+    parser.add_argument("--end", help="Last date of a backfill (YYYYMMDD, defaults to --start)")
+    parser.add_argument("--league", action="append", help="League to fetch (repeatable, default ncaab)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Reports fetched at once")
+    parser.add_argument("--output", help="CSV path for the backfill (default ActionNetwork_<start>_<end>.csv)")
+    args = parser.parse_args()
+
+    if args.start:
+        end = args.end or args.start
+        dates = pd.date_range(args.start, end).strftime("%Y%m%d").tolist()
+        leagues = args.league or ['ncaab']
+        client = ActionNetworkClient(config.ACTION_NETWORK_EMAIL, config.ACTION_NETWORK_PASSWORD)
+        started = time.perf_counter()
+        df = client.get_sharp_report_frame(dates, leagues, max_workers=args.workers)
+        elapsed = time.perf_counter() - started
+        output = args.output or f"ActionNetwork_{args.start}_{end}.csv"
+        df.to_csv(output, index=False)
+        print(f"✓ {len(df)} games from {len(dates)} dates x {len(leagues)} leagues in {elapsed:.1f}s -> {output}")
+        raise SystemExit(0)
+
     df = get_action_network_sharp_report(config.ACTION_NETWORK_EMAIL, config.ACTION_NETWORK_PASSWORD)
 
     if df is not None:
@@ -1,54 +1,185 @@
-from requests_html import HTMLSession
-import pandas as pd
+import asyncio
+import atexit
 import re
+import threading
+import time
+from urllib.parse import urlencode
 
+import pandas as pd
+import requests
+from lxml import etree, html as lxml_html
 
-def scrape_barttorvik_schedule(url: str) -> pd.DataFrame:
-    """
-    Scrapes the BartTorvik schedule page (JavaScript-rendered)
-    and returns a cleaned pandas DataFrame with Away and Home
-    team fields extracted from the Matchup column.
-    """
+from HttpCache import cached_get
 
-    session = HTMLSession()
-    try:
-        response = session.get(url)
-        response.html.render(timeout=30, sleep=2)
 
-        table = response.html.find("table", first=True)
-        if not table:
-            raise RuntimeError("No table found on the page after JS rendering.")
+TORVIK_HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"}
+
+# Compiled once; these run on every scrape.
+_FIND_TABLE = etree.XPath("(//table[.//th])[1]")
+_FIND_HEADERS = etree.XPath(".//tr/th")
+_FIND_ROWS = etree.XPath(".//tr")
+_FIND_CELLS = etree.XPath("./td")
+
+# Rank + Team Name, before at/vs
+AWAY_TEAM_RE = re.compile(r"\d{1,3}\s*([A-Za-z .&'-]+?)\s+(?=(?:at|vs)\b)", re.IGNORECASE)
+# at/vs + Rank + Team Name
+HOME_TEAM_RE = re.compile(r"\b(?:at|vs)\s+\d{1,3}\s*([A-Za-z .&'-]+)", re.IGNORECASE)
+# Broadcast networks Torvik appends after the home team ('7 Louisville ESPN').
+# Matched case-sensitively as whole trailing words, so team acronyms such as
+# UCF or LSU are never mistaken for one.
+TV_NETWORKS = ["ESPN", "ESPN2", "ESPNU", "ESPN+", "ESPN3", "ESPNews", "ABC", "CBS", "CBSSN", "FOX", "FS", "FS1",
+               "FS2", "BTN", "B1G+", "SECN", "SECN+", "ACCN", "ACCNX", "LHN", "P12N", "NBC", "NBCSN", "Peacock",
+               "TNT", "TBS", "truTV", "CW", "MWN", "Stadium", "FloHoops"]
+# Trailing networks of a matchup, possibly several ('ESPN2/ESPN+')
+TV_NETWORK_SUFFIX_RE = re.compile(
+    r"(?:[\s/,]+(?:" + "|".join(re.escape(n) for n in sorted(TV_NETWORKS, key=len, reverse=True)) + r"))+\s*$")
+# Favorite and points from a T-Rank line like 'Duke -3.5, 72-68 (62%)'
+T_RANK_LINE_RE = re.compile(r"^\s*(?P<favorite>.+?)\s+-(?P<points>\d+(?:\.\d+)?)\b")
 
-        # Extract column headers
-        headers = [th.text.strip() for th in table.find("tr th")]
 
-        # Extract row data
-        data = []
-        for row in table.find("tr")[1:]:
-            cells = [td.text.strip() for td in row.find("td")]
+def _text(element):
+    return " ".join(element.text_content().split())
 
-            if not cells:
-                continue
 
-            # Match row length to header length
-            cells = cells[:len(headers)]
+def parse_schedule_html(page_html: str) -> pd.DataFrame:
+    """
+    Parses the schedule table out of a BartTorvik page (raw or rendered HTML).
+    Raises RuntimeError if the page has no schedule table.
+    """
+    tree = lxml_html.fromstring(page_html)
+    tables = _FIND_TABLE(tree)
+    if not tables:
+        raise RuntimeError("No table found on the page.")
+    table = tables[0]
+
+    # Extract column headers
+    headers = [_text(th) for th in _FIND_HEADERS(table)]
+    if "Matchup" not in headers:
+        raise RuntimeError("Schedule table has no 'Matchup' column.")
+
+    # Extract row data, matching row length to header length
+    data = []
+    for row in _FIND_ROWS(table)[1:]:
+        cells = [_text(td) for td in _FIND_CELLS(row)]
+        if cells:
             data.append(dict(zip(headers, cells)))
 
-        df = pd.DataFrame(data)
+    return pd.DataFrame(data, columns=headers)
+
+
+class _WarmRenderer:
+    """
+    Headless Chromium kept alive for the life of the process, so a render
+    fallback doesn't pay for a browser launch each time. Chromium is launched
+    with pyppeteer's signal handlers off and its own event loop, which makes it
+    safe to call from a worker thread; the lock serialises renders.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session = None
+        # Totals for run manifests
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def _start(self):
+        # Only import the Chromium stack once we actually need it.
+        import pyppeteer
+        from requests_html import HTMLSession
+
+        session = HTMLSession()
+        session.loop = asyncio.new_event_loop()
+        session._browser = session.loop.run_until_complete(pyppeteer.launch(
+            headless=True, args=["--no-sandbox"],
+            handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False,
+        ))
+        return session
+
+    def render(self, url: str, timeout: int = 30, sleep: int = 2) -> str:
+        with self._lock:
+            start = time.perf_counter()
+            if self._session is None:
+                self._session = self._start()
+            asyncio.set_event_loop(self._session.loop)
+            response = self._session.get(url)
+            response.html.render(timeout=timeout, sleep=sleep)
+            self.renders += 1
+            self.render_seconds += time.perf_counter() - start
+            return response.html.html
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_renderer = _WarmRenderer()
+atexit.register(_renderer.close)
+
+
+def render_stats():
+    """Chromium renders this process has needed, and their total seconds (including launch)."""
+    return {"renders": _renderer.renders, "render_seconds": round(_renderer.render_seconds, 3)}
+
+
+def _fetch_raw_html(url: str, params=None, session=None) -> str:
+    response = cached_get(url, "torvik", params=params, headers=TORVIK_HEADERS, session=session)
+    response.raise_for_status()
+    return response.text
+
+
+def scrape_barttorvik_schedule(url: str, params=None, session=None) -> pd.DataFrame:
+    """
+    Scrapes the BartTorvik schedule page and returns a cleaned pandas DataFrame
+    with Away and Home team fields extracted from the Matchup column.
+    Pass params={'date': 'YYYYMMDD'} for a day other than today.
 
-    finally:
-        session.close()
+    Tries a plain HTTP fetch of the page first and only falls back to a
+    JavaScript render (warm, reused Chromium) when the raw page has no
+    schedule table.
+    """
+    try:
+        df = parse_schedule_html(_fetch_raw_html(url, params, session))
+    except (requests.RequestException, RuntimeError, etree.ParserError) as e:
+        print(f"Bart Torvik fast path failed ({e}); rendering page...")
+        render_url = f"{url}?{urlencode(params)}" if params else url
+        df = parse_schedule_html(_renderer.render(render_url))
 
+    return add_line_column(add_team_columns(df))
+
+
+def add_team_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds Away Team and Home Team, extracted from the Matchup column."""
     # Ensure Matchup column is usable
     df["Matchup"] = df["Matchup"].fillna("").replace(r"\s+", " ", regex=True)
 
-    # Extract teams
-    df["Away Team"] = df["Matchup"].apply(extract_away_team)
-    df["Home Team"] = df["Matchup"].apply(extract_home_team)
+    # Extract teams; the TV network after the home team ('7 Louisville ESPN') is dropped first
+    teams = df["Matchup"].str.replace(TV_NETWORK_SUFFIX_RE, "", regex=True)
+    df["Away Team"] = teams.str.extract(AWAY_TEAM_RE, expand=False).str.strip()
+    df["Home Team"] = teams.str.extract(HOME_TEAM_RE, expand=False).str.strip()
 
     return df
 
 
+def add_line_column(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds Torvik_Spread: the T-Rank line in points, positive when Torvik's
+    Home Team is favored (NaN if the line or favorite can't be read).
+    Run after add_team_columns.
+    """
+    if "T-Rank Line" not in df.columns:
+        df["Torvik_Spread"] = float("nan")
+        return df
+
+    parts = df["T-Rank Line"].fillna("").str.extract(T_RANK_LINE_RE)
+    points = pd.to_numeric(parts["points"], errors="coerce")
+    favorite = parts["favorite"].str.strip()
+    home_favored = favorite == df["Home Team"]
+    df["Torvik_Spread"] = points.where(home_favored, -points.where(favorite == df["Away Team"]))
+    return df
+
+
 def extract_away_team(matchup: str) -> str | None:
     """
     Extracts the away team name from a matchup like:
@@ -58,11 +189,7 @@ def extract_away_team(matchup: str) -> str | None:
     if not isinstance(matchup, str):
         return None
 
-    matchup = matchup.replace("\n", " ")
-
-    # Rank + Team Name, before at/vs
-    pattern = r"\d{1,3}\s*([A-Za-z .&'-]+?)\s+(?=at|vs)"
-    match = re.search(pattern, matchup, flags=re.IGNORECASE)
+    match = AWAY_TEAM_RE.search(matchup.replace("\n", " "))
 
     return match.group(1).strip() if match else None
 
@@ -76,11 +203,7 @@ def extract_home_team(matchup: str) -> str | None:
     if not isinstance(matchup, str):
         return None
 
-    matchup = matchup.replace("\n", " ")
-
-    # at/vs + Rank + Team Name
-    pattern = r"(?:at|vs)\s+\d{1,3}\s*([A-Za-z .&'-]+)"
-    match = re.search(pattern, matchup, flags=re.IGNORECASE)
+    match = HOME_TEAM_RE.search(TV_NETWORK_SUFFIX_RE.sub("", matchup.replace("\n", " ")))
 
     return match.group(1).strip() if match else None
 
@@ -1,46 +1,122 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+
 import pandas as pd
+from lxml import etree, html as lxml_html
+
+from HttpCache import cached_get
+
+
+# Compiled once; these run on every scrape.
+_FIND_SECTIONS = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' Table ')]"
+)
+_FIND_TITLE = etree.XPath(
+    "preceding::*[contains(concat(' ', normalize-space(@class), ' '), ' Table__Title ')][1]"
+)
+_FIND_HEADERS = etree.XPath(".//thead//th | (.//tr[th])[1]/th")
+_FIND_ROWS = etree.XPath(".//tr[td]")
+_FIND_CELLS = etree.XPath("./td")
+_FIND_HREFS = etree.XPath(".//a/@href")
 
+GAME_ID_RE = re.compile(r"gameId/(\d+)")
+# Optional '@' (home) or 'vs' (neutral site), optional AP rank, team name
+TEAM_CELL_RE = re.compile(r"^(?P<marker>@|vs\.?)?\s*(?P<rank>\d{1,2}(?=\s))?\s*(?P<team>.*)$", re.IGNORECASE)
 
-def scrape_espn_schedule(url):
+# ESPN header text -> output column. The home team column has no header of
+# its own; it is the one right after MATCHUP.
+HEADER_COLUMNS = {
+    "MATCHUP": "Away Team",
+    "TIME": "Time",
+    "TV": "TV",
+    "TICKETS": "Tickets",
+    "LOCATION": "Location",
+    "ODDS BY": "Odds",
+}
+
+TEXT_COLUMNS = ["Away Team", "Home Team", "Time", "TV", "Tickets", "Location", "Odds"]
+
+
+def scrape_espn_schedule(url, session=None):
     """
     Scrapes the ESPN men's college basketball schedule from the given URL and returns a DataFrame
-    with columns: MATCHUP, TIME, TV, Tickets, Location, ODDS BY, Logo ESPN Bet.
+    with columns: Date, Game_ID, Away Team, Home Team, Away_Rank, Home_Rank, Neutral, Time, TV,
+    Tickets, Location, Odds.
+    Pass a session to reuse its connections across several scrapes.
     """
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response = cached_get(url, "espn", headers={"User-Agent": "Mozilla/5.0"}, session=session)
     if response.status_code != 200:
         raise Exception(f"Failed to fetch page: {response.status_code}")
+    return parse_espn_schedule_html(response.text)
+
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    schedule_table = soup.find('table', {'class': 'Table'})
+def _text(element):
+    # Text nodes joined with spaces, so '<span>3</span><a>Duke</a>' reads '3 Duke'
+    return " ".join(" ".join(element.itertext()).split())
 
-    if not schedule_table:
+
+def _column_names(header_cells):
+    """Output column for each header cell (None to skip), spreading colspans."""
+    names = []
+    for th in header_cells:
+        label = _text(th).upper()
+        name = next((col for key, col in HEADER_COLUMNS.items() if label.startswith(key)), None)
+        if name is None and names and names[-1] == "Away Team":
+            name = "Home Team"
+        names.append(name)
+        names.extend([None] * (int(th.get("colspan", 1)) - 1))
+    # MATCHUP spanning both team cells
+    if "Away Team" in names and "Home Team" not in names:
+        names[names.index("Away Team") + 1] = "Home Team"
+    return names
+
+
+def parse_espn_schedule_html(page_html):
+    """
+    Parses every schedule table on an ESPN schedule page (the page is split
+    into one table per day section). Columns are found by header text, and
+    each game keeps its ESPN game ID, its section's date and whether it is at
+    a neutral site ('vs' instead of '@').
+    """
+    tree = lxml_html.fromstring(page_html)
+    tables = _FIND_SECTIONS(tree)
+    if not tables:
         raise Exception("No schedule table found on the page")
 
-    games = []
-    for row in schedule_table.find_all('tr')[1:]:  # Skip header row
-        cols = row.find_all('td')
-        if len(cols) < 6:
-            continue  # Skip rows that don't have enough data
-
-        away_tm = cols[0].text.strip()
-        home_tm = cols[1].text.strip()
-        time = cols[2].text.strip() if len(cols) > 2 else "N/A"
-        tv = cols[3].text.strip() if len(cols) > 3 else "N/A"
-        tickets = cols[4].text.strip() if len(cols) > 4 else "N/A"
-        location = cols[5].text.strip() if len(cols) > 5 else "N/A"
-        odds = cols[6].text.strip() if len(cols) > 6 else "N/A"
-
-        games.append({
-            "Away Team": away_tm,
-            "Home Team": home_tm,
-            "Time": time,
-            "TV": tv,
-            "Tickets": tickets,
-            "Location": location,
-            "Odds": odds,
-            })
-
-    return pd.DataFrame(games)
+    records = {col: [] for col in ["Date", "Game_ID", "Away_Rank", "Home_Rank", "Neutral"] + TEXT_COLUMNS}
+    for table in tables:
+        names = _column_names(_FIND_HEADERS(table))
+        if "Away Team" not in names:
+            continue
+        titles = _FIND_TITLE(table)
+        date = _text(titles[0]) if titles else None
+
+        for row in _FIND_ROWS(table):
+            cells = dict(zip(names, _FIND_CELLS(row)))
+            cells.pop(None, None)
+            if "Away Team" not in cells or "Home Team" not in cells:
+                continue
+
+            away = TEAM_CELL_RE.match(_text(cells["Away Team"]))
+            home = TEAM_CELL_RE.match(_text(cells["Home Team"]))
+            if not away["team"] or not home["team"]:
+                continue
+
+            game_id = next((m.group(1) for m in map(GAME_ID_RE.search, _FIND_HREFS(row)) if m), None)
+            records["Date"].append(date)
+            records["Game_ID"].append(game_id)
+            records["Away Team"].append(away["team"])
+            records["Home Team"].append(home["team"])
+            records["Away_Rank"].append(away["rank"])
+            records["Home_Rank"].append(home["rank"])
+            records["Neutral"].append((home["marker"] or "").lower().startswith("vs"))
+            for col in TEXT_COLUMNS[2:]:
+                cell = cells.get(col)
+                records[col].append(cell.text_content().strip() if cell is not None else None)
 
+    df = pd.DataFrame(records)
+    df["Date"] = pd.to_datetime(df["Date"], format="%A, %B %d, %Y", errors="coerce")
+    df["Game_ID"] = pd.to_numeric(df["Game_ID"]).astype("Int64")
+    df["Away_Rank"] = pd.to_numeric(df["Away_Rank"]).astype("Int8")
+    df["Home_Rank"] = pd.to_numeric(df["Home_Rank"]).astype("Int8")
+    df["Neutral"] = df["Neutral"].astype(bool)
+    return df
@@ -1,8 +1,7 @@
 from kenpompy.utils import login
 import kenpompy.summary, kenpompy.misc as kp
-import os
-import pandas as pd
 import datetime
+from RatingsStore import current_season, load_latest, save_snapshot
 
 def get_kenpom_browser(email, password):
     return login(email, password)
@@ -15,24 +14,27 @@ def get_pomeroy_ratings(browser):
     # Get Main Pomeroy Stats
     return kp.get_pomeroy_ratings(browser)
 
-CACHE_FILE = "pomeroy_ratings_cache.pkl"
 CACHE_EXPIRATION_HOURS = 6 #Tourney
 #CACHE_EXPIRATION_HOURS = 12  # adjust as needed
 
-def get_cached_pomeroy_ratings(email, password):
-    # Check if cache exists and is still fresh.
-    if os.path.exists(CACHE_FILE):
-        mod_time = datetime.datetime.fromtimestamp(os.path.getmtime(CACHE_FILE))
-        if datetime.datetime.now() - mod_time < datetime.timedelta(hours=CACHE_EXPIRATION_HOURS):
+# kenpompy's scraped columns differ from the API's, so keep its snapshots apart.
+SNAPSHOT_NAME = "kenpompy_ratings"
+
+def get_cached_pomeroy_ratings(email, password, season=None):
+    season = season or current_season()
+
+    # Check if a snapshot exists and is still fresh.
+    pomeroy_df, fetched_at = load_latest(season, name=SNAPSHOT_NAME)
+    if pomeroy_df is not None:
+        if datetime.datetime.now() - fetched_at < datetime.timedelta(hours=CACHE_EXPIRATION_HOURS):
             print("Loading cached data...")
-            return pd.read_pickle(CACHE_FILE)
+            return pomeroy_df
 
-    # If cache doesn't exist or is expired, log in and fetch the data.
+    # If no snapshot exists or it is expired, log in and fetch the data.
     print("Fetching new data...")
     browser = get_kenpom_browser(email, password)
     pomeroy_df = get_pomeroy_ratings(browser)
 
-    # Save to cache.
-    pomeroy_df.to_pickle(CACHE_FILE)
+    # Save as a new snapshot.
+    save_snapshot(pomeroy_df, season, name=SNAPSHOT_NAME)
     return pomeroy_df
-
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import config
+from HttpTransport import shared_transport
+
+
+CACHE_DIR = ".http_cache"
+
+# Seconds a cached response is served without asking the server again.
+# Override per source with HTTP_CACHE_TTL in config.py.
+DEFAULT_TTL_SECONDS = {
+    "espn": 300,
+    "torvik": 600,
+    "action_network": 60,
+}
+TTL_SECONDS = {**DEFAULT_TTL_SECONDS, **getattr(config, "HTTP_CACHE_TTL", {})}
+
+# Request headers that change who the response is for; they are part of the
+# cache key, so one token's (or no token's) response is never served to another
+KEY_HEADERS = ["Authorization", "Cookie"]
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response backed by a cache entry."""
+
+    def __init__(self, url, status_code, content, headers, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers)
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        encoding = get_encoding_from_headers(self.headers) or "utf-8"
+        return self.content.decode(encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+def cache_key(url, params=None, headers=None):
+    """Cache key for a URL, its query parameters (order-independent) and its KEY_HEADERS."""
+    query = urlencode(sorted((params or {}).items()))
+    headers = CaseInsensitiveDict(headers or {})
+    identity = "\n".join(f"{name}: {headers[name]}" for name in KEY_HEADERS if name in headers)
+    return hashlib.sha256(f"{url}?{query}\n{identity}".encode()).hexdigest()
+
+
+def _record(source, outcome):
+    with _stats_lock:
+        counts = _stats.setdefault(source, {"hit": 0, "revalidated": 0, "miss": 0})
+        counts[outcome] += 1
+
+
+def _paths(key):
+    return os.path.join(CACHE_DIR, f"{key}.json"), os.path.join(CACHE_DIR, f"{key}.body")
+
+
+def _atomic_write(path, data, mode="wb"):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, mode) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _load_entry(key):
+    meta_path, body_path = _paths(key)
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+
+def _store_entry(key, meta, body=None):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta_path, body_path = _paths(key)
+    if body is not None:
+        _atomic_write(body_path, body)
+    _atomic_write(meta_path, json.dumps(meta), mode="w")
+
+
+def cached_get(url, source, params=None, headers=None, session=None, ttl=None, timeout=None):
+    """
+    GET through the on-disk response cache.
+
+    A cached response younger than the source's TTL is returned without a
+    request. An older one is revalidated with If-None-Match/If-Modified-Since,
+    so an unchanged page costs a 304 instead of a full download. Only 200
+    responses are stored.
+
+    Parameters:
+        url (str): Request URL
+        source (str): Source name; selects the TTL and the stats bucket
+        params (dict): Query parameters (part of the cache key)
+        headers (dict): Extra request headers
+        session: Object with a requests-style get(); defaults to the shared Transport
+        ttl (float): Overrides the source's TTL in seconds
+        timeout: requests timeout; None uses the transport's default
+
+    Returns:
+        CachedResponse
+    """
+    ttl = TTL_SECONDS.get(source, 0) if ttl is None else ttl
+    key = cache_key(url, params, headers)
+    meta, body = _load_entry(key)
+
+    if meta is not None and time.time() - meta["fetched_at"] < ttl:
+        _record(source, "hit")
+        return CachedResponse(url, 200, body, meta["headers"], from_cache=True)
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        if meta["headers"].get("ETag"):
+            request_headers["If-None-Match"] = meta["headers"]["ETag"]
+        if meta["headers"].get("Last-Modified"):
+            request_headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+
+    response = (session or shared_transport()).get(url, params=params, headers=request_headers, timeout=timeout)
+
+    if response.status_code == 304 and meta is not None:
+        meta["fetched_at"] = time.time()
+        _store_entry(key, meta)
+        _record(source, "revalidated")
+        return CachedResponse(url, 200, body, meta["headers"], from_cache=True)
+
+    _record(source, "miss")
+    if response.status_code == 200:
+        stored_headers = {k: response.headers[k] for k in ("Content-Type", "ETag", "Last-Modified")
+                          if k in response.headers}
+        _store_entry(key, {"url": response.url, "fetched_at": time.time(),
+                           "headers": stored_headers}, response.content)
+    return CachedResponse(url, response.status_code, response.content,
+                          response.headers, from_cache=False)
+
+
+def cache_stats():
+    """Hit/revalidated/miss counts per source for this process."""
+    with _stats_lock:
+        return {source: dict(counts) for source, counts in _stats.items()}
+
+
+def format_cache_stats():
+    stats = cache_stats()
+    if not stats:
+        return "HTTP cache: no requests"
+    lines = ["HTTP cache:"]
+    for source, c in sorted(stats.items()):
+        lines.append(f"  {source}: {c['hit']} hits, {c['revalidated']} revalidated (304), {c['miss']} misses")
+    return "\n".join(lines)
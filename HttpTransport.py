@@ -0,0 +1,154 @@
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+
+# (connect, read) seconds; a stalled socket fails instead of hanging the run
+DEFAULT_TIMEOUT = getattr(config, "HTTP_TIMEOUT", (5, 30))
+
+# Keep-alive connections kept per host. Batch mode runs several dates at once,
+# so this should cover max_workers x sources hitting the same host.
+POOL_MAXSIZE = 16
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5       # seconds before the first retry
+BACKOFF_CAP = 20         # longest single wait, including Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Only requests that are safe to send twice are retried
+RETRY_METHODS = {"GET", "HEAD"}
+
+# Requests per second and burst size per host. Override or extend with
+# HTTP_RATE_LIMITS in config.py; hosts not listed are not throttled.
+DEFAULT_RATE_LIMITS = {
+    "www.espn.com": (5, 10),
+    "www.barttorvik.com": (2, 4),
+    "api.actionnetwork.com": (2, 4),
+    "kenpom.com": (1, 2),
+}
+RATE_LIMITS = {**DEFAULT_RATE_LIMITS, **getattr(config, "HTTP_RATE_LIMITS", {})}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `burst` saved up."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) and wait outside the lock
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+_limiters_lock = threading.Lock()
+_limiters = {}
+
+
+def rate_limiter(host):
+    """The process-wide bucket for a host, or None if the host is not throttled."""
+    if host not in RATE_LIMITS:
+        return None
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = TokenBucket(*RATE_LIMITS[host])
+        return _limiters[host]
+
+
+def _retry_after(response):
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, response=None):
+    """Full-jitter exponential backoff, or the server's Retry-After when it sends one."""
+    retry_after = _retry_after(response) if response is not None else None
+    if retry_after is not None:
+        return min(retry_after, BACKOFF_CAP)
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+class Transport(requests.Session):
+    """
+    requests.Session with pooled keep-alive connections, default timeouts,
+    per-host rate limiting and retries.
+
+    GET/HEAD requests that fail to connect, time out or come back 429/5xx are
+    retried up to MAX_RETRIES times with jittered exponential backoff. Every
+    attempt waits for a token from the host's shared bucket, so all Transports
+    in the process together stay under RATE_LIMITS.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_retries=MAX_RETRIES):
+        super().__init__()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        adapter = HTTPAdapter(pool_connections=len(RATE_LIMITS) or 1, pool_maxsize=POOL_MAXSIZE)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        limiter = rate_limiter(urlsplit(url).hostname)
+        retries = self.max_retries if method.upper() in RETRY_METHODS else 0
+
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == retries:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+            delay = backoff_delay(attempt, response)
+            response.close()
+            time.sleep(delay)
+
+
+_shared_lock = threading.Lock()
+_shared = None
+
+
+def shared_transport():
+    """
+    The process-wide Transport used by fetchers that don't need their own
+    session headers (ESPN, Torvik, KenPom API).
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Transport()
+        return _shared
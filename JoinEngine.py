@@ -0,0 +1,189 @@
+"""
+Joins one date's schedule to the KenPom ratings, Torvik lines and Action
+Network signals by team ID in a single pass. Each source frame is indexed
+once by its team key; every game's rows are then found with one vectorized
+lookup per source, and each output column is one positional gather into
+the result frame, which is built once. No intermediate merged frames are
+copied.
+
+Output columns, in order:
+    schedule columns (with Away_ID, Home_ID)
+    every KenPom column as <column>_Away, then as <column>_Home
+    Team_Lo, Team_Hi
+    Torvik columns (Torvik_Spread flipped to the schedule's home team)
+    Action Network columns
+A Torvik or Action Network column whose name is already taken gets
+'_BartTovik' or '_ActionNetwork' appended.
+"""
+import weakref
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+
+from TeamRegistry import UNRESOLVED_ID, game_keys
+
+
+TORVIK_SUFFIX = "_BartTovik"
+ACTION_NETWORK_SUFFIX = "_ActionNetwork"
+
+# (kind, id(source frame)) -> (weakref to the frame, registry, its TeamTable),
+# so batch runs, LineWatch and the report server index the ratings (and a
+# Torvik schedule they reuse) once, not once per date or poll
+_tables = {}
+
+
+def _values(series):
+    # Extension arrays (categoricals, nullable ints) keep their dtype through take
+    return series.array if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) else series.to_numpy()
+
+
+def pair_key(first_ids, second_ids):
+    """One int64 key per (first, second) team ID pair."""
+    return (np.asarray(first_ids, dtype=np.int64) << 32) | (np.asarray(second_ids, dtype=np.int64) & 0xFFFFFFFF)
+
+
+class TeamTable:
+    """
+    A source frame indexed by team key for positional gathers. Rows whose
+    key is unresolved are left out, and only the first row of a repeated
+    key is kept.
+    """
+
+    def __init__(self, df, keys, drop=()):
+        keys = np.asarray(keys, dtype=np.int64)
+        keep = ~pd.Index(keys).duplicated()
+        self.index = pd.Index(keys[keep])
+        skip = set(drop)
+        self.columns = {col: _values(df[col])[keep] for col in df.columns if col not in skip}
+
+    def positions(self, keys):
+        """Row of each key in this table, -1 where it has none."""
+        return self.index.get_indexer(np.asarray(keys, dtype=np.int64))
+
+    def gather(self, positions, out, suffix="", collision_suffix=""):
+        """
+        Adds every column, taken at `positions` (missing rows become NA), to
+        the `out` dict as <column><suffix>, appending collision_suffix to a
+        name already in `out`.
+        """
+        for col, values in self.columns.items():
+            name = f"{col}{suffix}"
+            if name in out:
+                name = f"{name}{collision_suffix}"
+            out[name] = take(values, positions, allow_fill=True)
+
+
+def _cached_table(kind, df, registry, build):
+    # A frame is indexed once while it lives; replace it rather than editing it in place
+    key = (kind, id(df))
+    cached = _tables.get(key)
+    if cached is not None and cached[0]() is df and cached[1] is registry:
+        return cached[2]
+    table = build(df, registry)
+    _tables[key] = (weakref.ref(df, lambda _, key=key: _tables.pop(key, None)), registry, table)
+    return table
+
+
+def _build_ratings_table(kenpom_df, registry):
+    keys = kenpom_df['Team_ID'].to_numpy()
+    return TeamTable(kenpom_df[keys != UNRESOLVED_ID], keys[keys != UNRESOLVED_ID])
+
+
+def _build_torvik_table(df_tovik, registry):
+    away = registry.resolve(df_tovik['Away Team'], 'torvik')
+    home = registry.resolve(df_tovik['Home Team'], 'torvik')
+    lo, hi = game_keys(away, home)
+    resolved = hi != UNRESOLVED_ID
+    # Torvik may list a neutral-site game the other way round; its teams
+    # decide whether Torvik_Spread needs flipping
+    frame = df_tovik[resolved].assign(Torvik_Away_ID=away[resolved], Torvik_Home_ID=home[resolved])
+    return TeamTable(frame, pair_key(lo[resolved], hi[resolved]),
+                     drop=['Away Team', 'Home Team', 'Away_ID', 'Home_ID', 'Team_Lo', 'Team_Hi'])
+
+
+def ratings_table(kenpom_df):
+    """KenPom ratings indexed by Team_ID, built once per ratings frame."""
+    return _cached_table('ratings', kenpom_df, None, _build_ratings_table)
+
+
+def torvik_table(df_tovik, registry):
+    """
+    Torvik games indexed by their unordered (low, high) team pair, built once
+    per Torvik frame. A game with only one resolved team is indexed as
+    (UNRESOLVED_ID, that team), so it still joins on that team alone (a team
+    plays once per date).
+    """
+    return _cached_table('torvik', df_tovik, registry, _build_torvik_table)
+
+
+def torvik_positions(torvik, away, home):
+    """
+    Row of each game in a torvik_table: by its team pair, else by whichever
+    of its teams Torvik's row has as the only resolved one; -1 where neither.
+    """
+    lo, hi = game_keys(away, home)
+    # An unresolved team never matches, even against another unresolved one
+    positions = np.where(lo != UNRESOLVED_ID, torvik.positions(pair_key(lo, hi)), -1)
+    for team in (away, home):
+        single = torvik.positions(pair_key(np.full(len(team), UNRESOLVED_ID), team))
+        positions = np.where((positions < 0) & (team != UNRESOLVED_ID), single, positions)
+    return positions
+
+
+def action_network_table(action_df, registry):
+    """Action Network games indexed by their ordered (away, home) team pair."""
+    away = registry.resolve(action_df['Away Team'], 'action_network')
+    home = registry.resolve(action_df['Home Team'], 'action_network')
+    resolved = (away != UNRESOLVED_ID) & (home != UNRESOLVED_ID)
+    return TeamTable(action_df[resolved], pair_key(away[resolved], home[resolved]),
+                     drop=['Away Team', 'Home Team', 'Away_ID', 'Home_ID'])
+
+
+def join_sources(schedule_df, kenpom_df, df_tovik, action_df, registry):
+    """
+    The merged report frame for one date: one row per scheduled game,
+    left-joined to every source (see the module docstring for the columns).
+
+    Parameters:
+        schedule_df (pd.DataFrame): ESPN schedule (or --matchup games)
+        kenpom_df (pd.DataFrame): Ratings with a Team_ID column
+        df_tovik, action_df (pd.DataFrame): Optional; None when skipped
+        registry (TeamRegistry): Resolves every source's team names
+
+    Returns:
+        pd.DataFrame: With a fresh RangeIndex
+    """
+    away = registry.resolve(schedule_df['Away Team'], 'espn')
+    home = registry.resolve(schedule_df['Home Team'], 'espn')
+
+    out = {col: _values(schedule_df[col]) for col in schedule_df.columns if col not in ('Away_ID', 'Home_ID')}
+    out['Away_ID'], out['Home_ID'] = away, home
+
+    ratings = ratings_table(kenpom_df)
+    ratings.gather(ratings.positions(away), out, suffix='_Away')
+    ratings.gather(ratings.positions(home), out, suffix='_Home')
+
+    lo, hi = game_keys(away, home)
+    out['Team_Lo'], out['Team_Hi'] = lo, hi
+
+    if df_tovik is not None:
+        torvik = torvik_table(df_tovik, registry)
+        positions = torvik_positions(torvik, away, home)
+        torvik.gather(positions, out, collision_suffix=TORVIK_SUFFIX)
+        # Torvik_Spread is from Torvik's home team's side; flip it where Torvik
+        # has the teams the other way round
+        torvik_away, torvik_home = out.pop('Torvik_Away_ID'), out.pop('Torvik_Home_ID')
+        if 'Torvik_Spread' in out:
+            flipped = (positions >= 0) & (((torvik_home == away) & (away != UNRESOLVED_ID)) |
+                                          ((torvik_away == home) & (home != UNRESOLVED_ID)))
+            spread = np.asarray(out['Torvik_Spread'])
+            out['Torvik_Spread'] = np.where(flipped, -spread, spread)
+
+    if action_df is not None:
+        signals = action_network_table(action_df, registry)
+        resolved = (away != UNRESOLVED_ID) & (home != UNRESOLVED_ID)
+        positions = np.where(resolved, signals.positions(pair_key(away, home)), -1)
+        signals.gather(positions, out, collision_suffix=ACTION_NETWORK_SUFFIX)
+
+    return pd.DataFrame(out, index=pd.RangeIndex(len(schedule_df)))
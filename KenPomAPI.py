@@ -1,10 +1,13 @@
 import requests
 import time
 from typing import Dict, Any, Optional
-import os
 import pandas as pd
 import datetime
+import hashlib
+import threading
 import config
+from HttpTransport import shared_transport
+from RatingsStore import current_season, load_latest, read_meta, save_snapshot, write_meta
 
 
 class KenPomAPI:
@@ -15,12 +18,14 @@ class KenPomAPI:
     def _get(self, params: Dict[str, Any]) -> Any:
         """
         Internal helper for GET requests using Bearer token authentication.
+        Goes through the shared transport, so connections are reused and
+        failed requests are retried.
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}"
         }
 
-        resp = requests.get(self.base_url, headers=headers, params=params)
+        resp = shared_transport().get(self.base_url, headers=headers, params=params)
         resp.raise_for_status()
         return resp.json()
 
@@ -51,25 +56,107 @@ class KenPomAPI:
 
 # ---------- CACHE HANDLER ----------
 
-CACHE_FILE = "pomeroy_ratings_cache.pkl"
 CACHE_EXPIRATION_HOURS = 6  # adjust as needed
 
+# One background refresh per process at a time
+_refresh_lock = threading.Lock()
+_refresh_thread = None
 
-def get_cached_pomeroy_ratings():
-    """Fetch and cache KenPom team ratings with 6-hour expiry."""
-    if os.path.exists(CACHE_FILE):
-        mod_time = datetime.datetime.fromtimestamp(os.path.getmtime(CACHE_FILE))
-        if datetime.datetime.now() - mod_time < datetime.timedelta(hours=CACHE_EXPIRATION_HOURS):
-            print("Loading cached data...")
-            return pd.read_pickle(CACHE_FILE)
 
-    print("Fetching new data...")
+def ratings_hash(df: pd.DataFrame) -> str:
+    """Content hash of a ratings frame (column names and values, not the index)."""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
 
-    kp = KenPomAPI(config.KENPOM_API_KEY)
 
+def refresh_ratings(season: int) -> Optional[pd.DataFrame]:
+    """
+    Fetches the season's ratings from the API and stores them. An unchanged
+    response (same content hash as the newest snapshot) only updates the
+    checked time in the sidecar instead of writing another snapshot.
+    Errors propagate; the sidecar keeps the last one.
+
+    Returns:
+        pd.DataFrame: The fetched ratings
+    """
+    meta = read_meta(season)
+    kp = KenPomAPI(config.KENPOM_API_KEY)
     try:
-        ratings = kp.get_team_ratings(season=2026)
+        ratings = kp.get_team_ratings(season=season)
+    except Exception as e:
+        write_meta(season, {**meta, "last_error": f"{type(e).__name__}: {e}",
+                            "last_error_at": datetime.datetime.now().isoformat()})
+        raise
+
+    content_hash = ratings_hash(ratings)
+    if "hash" not in meta:
+        latest, _ = load_latest(season)
+        meta["hash"] = ratings_hash(latest) if latest is not None else None
+    if content_hash != meta["hash"]:
+        save_snapshot(ratings, season)
         print(f"Fetched {len(ratings)} team ratings.")
+    else:
+        print("KenPom ratings unchanged since the last snapshot.")
+    write_meta(season, {"checked_at": datetime.datetime.now().isoformat(), "hash": content_hash})
+    return ratings
+
+
+def _refresh_in_background(season: int, fetched_at: datetime.datetime):
+    def refresh():
+        try:
+            refresh_ratings(season)
+        except Exception as e:
+            age = (datetime.datetime.now() - fetched_at).total_seconds() / 3600
+            print(f"⚠ KenPom refresh failed ({e}); using the last good ratings from "
+                  f"{fetched_at:%Y-%m-%d %H:%M} ({age:.1f}h old)")
+
+    global _refresh_thread
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        # Not a daemon: a short run still finishes the refresh (and saves the
+        # snapshot for the next run) after its report is written
+        _refresh_thread = threading.Thread(target=refresh, name="kenpom-refresh")
+        _refresh_thread.start()
+
+
+def wait_for_refresh(timeout: Optional[float] = None) -> bool:
+    """Blocks until a background refresh started by this process is done. Returns False on timeout."""
+    thread = _refresh_thread
+    if thread is not None:
+        thread.join(timeout)
+        return not thread.is_alive()
+    return True
+
+
+def get_cached_pomeroy_ratings(season: Optional[int] = None) -> pd.DataFrame:
+    """
+    Fetch KenPom team ratings, stale-while-revalidate: the newest snapshot is
+    returned right away, and if the API hasn't been checked for
+    CACHE_EXPIRATION_HOURS a refresh starts in the background for the next
+    caller. Only a season with no snapshot at all waits on the API.
+    Every changed fetch is kept as a new snapshot in RatingsStore, so past
+    ratings remain available via load_as_of.
+    """
+    season = season or current_season()
+
+    ratings, fetched_at = load_latest(season)
+    if ratings is not None:
+        checked_at = read_meta(season).get("checked_at")
+        checked_at = max(fetched_at, datetime.datetime.fromisoformat(checked_at)) if checked_at else fetched_at
+        age = datetime.datetime.now() - checked_at
+        if age < datetime.timedelta(hours=CACHE_EXPIRATION_HOURS):
+            print("Loading cached data...")
+        else:
+            print(f"Loading cached data ({age.total_seconds() / 3600:.1f}h since the last check; "
+                  f"refreshing in the background)...")
+            _refresh_in_background(season, fetched_at)
+        return ratings
+
+    print("Fetching new data...")
+    try:
+        return refresh_ratings(season)
     except requests.HTTPError as e:
         print("HTTP error:", e)
         raise
@@ -77,12 +164,10 @@ def get_cached_pomeroy_ratings():
         print("Unexpected error:", e)
         raise
 
-    ratings.to_pickle(CACHE_FILE)
-    return ratings
-
 
 # ---------- MAIN EXECUTION ----------
 
 if __name__ == "__main__":
     df = get_cached_pomeroy_ratings()
     print(df.head(5))
+    wait_for_refresh()
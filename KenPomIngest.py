@@ -0,0 +1,196 @@
+"""
+Bulk historical ingest from the KenPom API: ratings and game results for a
+range of seasons, fetched by a bounded worker pool through the shared
+transport (so kenpom.com's rate limit and retries apply), written to a
+local Arrow archive:
+
+    kenpom_archive/<endpoint>/season=YYYY.arrow
+
+Every finished (endpoint, season) piece is recorded in
+kenpom_archive/_checkpoint.json as soon as it is written, so an interrupted
+or partly failed backfill picks up where it stopped when rerun.
+
+Usage:
+    python KenPomIngest.py --start 2016 --end 2025 [--endpoints ratings game_results] [--workers 4] [--force]
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import config
+from KenPomAPI import KenPomAPI
+
+
+ARCHIVE_DIR = getattr(config, "KENPOM_ARCHIVE_DIR", "kenpom_archive")
+CHECKPOINT_FILE = "_checkpoint.json"
+
+# endpoint -> KenPomAPI method fetching one season of it
+ENDPOINTS = {
+    "ratings": KenPomAPI.get_team_ratings,
+    "game_results": KenPomAPI.get_game_results,
+}
+
+# Pieces fetched at once; kenpom.com's rate limit in HttpTransport still
+# spaces out the requests themselves
+MAX_WORKERS = 4
+
+
+def _piece_key(endpoint, season):
+    return f"{endpoint}/{season}"
+
+
+def _piece_path(endpoint, season):
+    return os.path.join(ARCHIVE_DIR, endpoint, f"season={season}.arrow")
+
+
+class Checkpoint:
+    """Completed pieces, saved to disk (temp file + rename) after each one."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path) as f:
+                self.done = json.load(f)
+        except (OSError, ValueError):
+            self.done = {}
+
+    def is_done(self, endpoint, season):
+        entry = self.done.get(_piece_key(endpoint, season))
+        return entry is not None and os.path.exists(entry["path"])
+
+    def mark_done(self, endpoint, season, entry):
+        with self._lock:
+            self.done[_piece_key(endpoint, season)] = entry
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.done, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+
+
+def write_piece(df, endpoint, season):
+    """
+    Writes one season of an endpoint as an uncompressed Arrow file, with a
+    Season column. Object columns are written as strings so every season of
+    an endpoint keeps the same schema.
+
+    Returns:
+        str: Path of the written file
+    """
+    frame = df.reset_index(drop=True)
+    for col in frame.select_dtypes(include=["object", "category"]).columns:
+        frame[col] = frame[col].astype("string")
+    if "Season" not in frame.columns:
+        frame["Season"] = season
+
+    path = _piece_path(endpoint, season)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    feather.write_feather(frame, tmp, compression="uncompressed")
+    os.replace(tmp, path)
+    return path
+
+
+def ingest_piece(api, endpoint, season):
+    """Fetches and archives one (endpoint, season); returns its checkpoint entry."""
+    df = ENDPOINTS[endpoint](api, season=season)
+    path = write_piece(df, endpoint, season)
+    return {"path": path, "rows": len(df), "completed_at": datetime.datetime.now().isoformat()}
+
+
+def ingest(seasons, endpoints=tuple(ENDPOINTS), max_workers=MAX_WORKERS, force=False):
+    """
+    Fetches every (endpoint, season) not already in the checkpoint.
+
+    Parameters:
+        seasons (iterable): Season years
+        endpoints (iterable): Names from ENDPOINTS
+        max_workers (int): Pieces fetched at once
+        force (bool): Refetch pieces the checkpoint already has
+
+    Returns:
+        tuple: (pieces written, pieces skipped as done, {piece: error} for failures)
+    """
+    checkpoint = Checkpoint(os.path.join(ARCHIVE_DIR, CHECKPOINT_FILE))
+    pieces = [(endpoint, season) for season in seasons for endpoint in endpoints]
+    todo = [piece for piece in pieces if force or not checkpoint.is_done(*piece)]
+    skipped = len(pieces) - len(todo)
+    if skipped:
+        print(f"Resuming: {skipped} of {len(pieces)} pieces already archived")
+
+    api = KenPomAPI(config.KENPOM_API_KEY)
+    written, failures = 0, {}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kenpom-ingest")
+    try:
+        futures = {executor.submit(ingest_piece, api, *piece): piece for piece in todo}
+        for future in as_completed(futures):
+            endpoint, season = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                failures[_piece_key(endpoint, season)] = str(e)
+                print(f"⚠ {endpoint} {season}: {e}")
+                continue
+            checkpoint.mark_done(endpoint, season, entry)
+            written += 1
+            print(f"✓ {endpoint} {season}: {entry['rows']} rows ({written + len(failures)}/{len(todo)})")
+    finally:
+        # On Ctrl-C, drop the queued pieces; finished ones are already checkpointed
+        executor.shutdown(wait=True, cancel_futures=True)
+    return written, skipped, failures
+
+
+def read_archive(endpoint="ratings", seasons=None, columns=None):
+    """
+    Archived seasons of an endpoint as one DataFrame, memory-mapped and
+    reading only the requested columns (Season always comes along).
+    """
+    endpoint_dir = os.path.join(ARCHIVE_DIR, endpoint)
+    if not os.path.isdir(endpoint_dir):
+        return pd.DataFrame(columns=columns or [])
+    wanted = {int(s) for s in seasons} if seasons is not None else None
+
+    tables = []
+    for filename in sorted(os.listdir(endpoint_dir)):
+        if not (filename.startswith("season=") and filename.endswith(".arrow")):
+            continue
+        season = int(filename[len("season="):-len(".arrow")])
+        if wanted is not None and season not in wanted:
+            continue
+        table = feather.read_table(os.path.join(endpoint_dir, filename), memory_map=True)
+        if columns:
+            table = table.select([c for c in dict.fromkeys(["Season", *columns]) if c in table.schema.names])
+        tables.append(table)
+    if not tables:
+        return pd.DataFrame(columns=columns or [])
+    # Columns can come and go between seasons; missing ones read as null
+    return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill KenPom seasons into the local archive.")
+    parser.add_argument("--start", type=int, required=True, help="First season (e.g. 2016)")
+    parser.add_argument("--end", type=int, help="Last season (defaults to --start)")
+    parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Pieces fetched at once")
+    parser.add_argument("--force", action="store_true", help="Refetch pieces that are already archived")
+    args = parser.parse_args()
+
+    seasons = range(args.start, (args.end or args.start) + 1)
+    started = time.perf_counter()
+    written, skipped, failures = ingest(seasons, args.endpoints, args.workers, args.force)
+    print(f"\nArchived {written} pieces ({skipped} already done, {len(failures)} failed) "
+          f"in {time.perf_counter() - started:.1f}s to {ARCHIVE_DIR}/")
+    if failures:
+        print("Rerun the same command to retry the failed pieces.")
+    sys.exit(1 if failures else 0)
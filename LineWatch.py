@@ -0,0 +1,163 @@
+import argparse
+import time
+from datetime import datetime
+
+import pandas as pd
+
+import config
+import HttpCache
+from HttpTransport import shared_transport
+from GetActionNetworkClean import ActionNetworkClient
+from RunDanPom import (FILTER_COLS, build_report, fetch_action_network, fetch_espn, fetch_kenpom,
+                       fetch_torvik, load_kenpom_and_registry, load_override_dict)
+from TeamRegistry import UNRESOLVED_ID
+
+
+KEY = ['Away_ID', 'Home_ID']
+
+# Inputs whose change means a game has to be recomputed
+ACTION_NETWORK_WATCH_COLUMNS = [
+    'Spread_Tickets_Away', 'Spread_Money_Away', 'Spread_Tickets_Home', 'Spread_Money_Home',
+    'Sharp_on_Away', 'Sharp_on_Home', 'Steam_Moves_Away', 'Steam_Moves_Home',
+    'Big_Bets_Flagged_Away', 'Big_Bets_Flagged_Home', 'Power_Edge_Away', 'Power_Edge_Home',
+]
+
+
+def print_event(event, game):
+    stamp = datetime.now().strftime("%H:%M:%S")
+    arrow = "→ ENTERED" if event == "enter" else "← LEFT"
+    print(f"[{stamp}] {arrow} edge set: {game['Away Team']} at {game['Home Team']} "
+          f"(Spread {game['Spread']}, Model {game['Model_Spread']:.1f}, Abs. Diff {game['Abs. Diff']:.1f})")
+
+
+class LineWatcher:
+    """
+    Polls ESPN odds and the Action Network pro report for one date and keeps
+    the report current.
+
+    KenPom ratings and the Torvik schedule are loaded, and indexed for the
+    join, once. Each poll is diffed per game against the previous one, and
+    only games whose line or sharp signals changed go back through
+    build_report. on_event(event, game) is called with 'enter' or 'leave'
+    when a game joins or drops out of the model-edge set.
+    """
+
+    def __init__(self, date_str=None, on_event=print_event):
+        self.date_str = date_str or datetime.now().strftime("%Y%m%d")
+        self.on_event = on_event
+
+        # A watch is pointless on cached pages: always revalidate (a 304 is still cheap)
+        HttpCache.TTL_SECONDS['espn'] = 0
+        HttpCache.TTL_SECONDS['action_network'] = 0
+
+        self.override_dict = load_override_dict()
+        self.session = shared_transport()
+        self.client = ActionNetworkClient(config.ACTION_NETWORK_EMAIL, config.ACTION_NETWORK_PASSWORD)
+        self.kenpom_df = fetch_kenpom()
+        self.registry = load_kenpom_and_registry(self.kenpom_df)
+        self.df_tovik = fetch_torvik(self.date_str, self.session)
+
+        self.inputs = None        # last poll's watched inputs, indexed by KEY
+        self.games = None         # current report rows, indexed by KEY
+        self.edge_keys = set()
+
+    def _poll_sources(self):
+        espn_df = fetch_espn(self.date_str, self.override_dict, self.session)
+        espn_df['Away_ID'] = self.registry.resolve(espn_df['Away Team'], 'espn')
+        espn_df['Home_ID'] = self.registry.resolve(espn_df['Home Team'], 'espn')
+        espn_df = espn_df[(espn_df['Away_ID'] != UNRESOLVED_ID) & (espn_df['Home_ID'] != UNRESOLVED_ID)]
+        espn_df = espn_df.drop_duplicates(KEY)
+
+        action_df, _ = fetch_action_network(self.date_str, self.client)
+        inputs = espn_df[KEY + ['Odds']]
+        if action_df is not None:
+            signals = action_df[['Away Team', 'Home Team'] + ACTION_NETWORK_WATCH_COLUMNS].copy()
+            signals['Away_ID'] = self.registry.resolve(signals['Away Team'], 'action_network')
+            signals['Home_ID'] = self.registry.resolve(signals['Home Team'], 'action_network')
+            signals = signals.drop(columns=['Away Team', 'Home Team']).drop_duplicates(KEY)
+            inputs = inputs.merge(signals, how='left', on=KEY)
+        return espn_df, action_df, inputs.set_index(KEY)
+
+    def _changed_keys(self, inputs):
+        if self.inputs is None:
+            return inputs.index
+        previous = self.inputs.reindex(index=inputs.index, columns=inputs.columns)
+        differs = (inputs != previous) & ~(inputs.isna() & previous.isna())
+        return inputs.index[differs.any(axis=1)]
+
+    def poll(self):
+        """
+        One tick: fetch, diff, recompute changed games, emit edge events.
+
+        Returns:
+            int: number of games recomputed
+        """
+        espn_df, action_df, inputs = self._poll_sources()
+        changed = self._changed_keys(inputs)
+        removed = self.games.index.difference(inputs.index) if self.games is not None else []
+
+        new_rows = None
+        new_edge = set()
+        if len(changed):
+            espn_changed = espn_df.set_index(KEY).loc[changed].reset_index()
+            # self.df_tovik is the same frame every poll, so its join index is built once
+            new_rows, filtered = build_report(espn_changed, self.kenpom_df, self.df_tovik, action_df, self.registry)
+            new_rows = new_rows.set_index(KEY)
+            new_edge = set(filtered.set_index(KEY).index)
+
+        # Games that tipped off or left the board
+        for key in removed:
+            if key in self.edge_keys:
+                self.edge_keys.discard(key)
+                self.on_event("leave", self.games.loc[key])
+
+        # Games that moved in or out of the edge set
+        for key in changed:
+            was_edge = key in self.edge_keys
+            now_edge = key in new_edge
+            if now_edge and not was_edge:
+                self.edge_keys.add(key)
+                self.on_event("enter", new_rows.loc[key])
+            elif was_edge and not now_edge:
+                self.edge_keys.discard(key)
+                self.on_event("leave", new_rows.loc[key] if key in new_rows.index else self.games.loc[key])
+
+        if self.games is None:
+            self.games = new_rows
+        else:
+            kept = self.games.drop(index=self.games.index.intersection(changed).union(removed))
+            self.games = pd.concat([kept, new_rows]) if new_rows is not None else kept
+        self.inputs = inputs
+        return len(changed)
+
+    def report(self):
+        """Current model-edge games, sorted by Abs. Diff."""
+        if self.games is None:
+            return pd.DataFrame(columns=FILTER_COLS)
+        edge = self.games[self.games.index.isin(list(self.edge_keys))]
+        return edge.reset_index().sort_values('Abs. Diff', ascending=False)[FILTER_COLS]
+
+    def run(self, interval=60):
+        print(f"=== DanPom line watch for {self.date_str}, polling every {interval}s (Ctrl-C to stop) ===\n")
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    recomputed = self.poll()
+                    print(f"[{datetime.now():%H:%M:%S}] {recomputed} games recomputed, "
+                          f"{len(self.edge_keys)} in edge set")
+                except Exception as e:
+                    print(f"⚠ Poll failed: {e}")
+                time.sleep(max(interval - (time.perf_counter() - started), 0))
+        except KeyboardInterrupt:
+            print("\n=== Current edge set ===")
+            print(self.report())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch lines and sharp signals and report edge changes.")
+    parser.add_argument("--date", help="Slate date (YYYYMMDD), defaults to today")
+    parser.add_argument("--interval", type=int, default=60, help="Seconds between polls")
+    args = parser.parse_args()
+
+    LineWatcher(args.date).run(args.interval)
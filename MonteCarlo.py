@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+from CalcModelSpread import HOME_COURT_ADVANTAGE, WIN_PAYOUT, home_court
+
+# D-I average adjusted efficiency (points per 100 possessions); sets the
+# level of simulated totals. build_report passes the current KenPom mean.
+AVG_EFFICIENCY = 106.0
+
+# Spread of a game's possession count around the teams' average tempo
+POSSESSION_SD = 4.0
+# Standard deviation of points scored on a single possession. Points over a
+# game then vary with sqrt(possessions), so fast games carry more variance.
+POINTS_PER_POSSESSION_SD = 1.0
+
+# Simulated values held at once (games x simulations per chunk), ~16 MB per float32 array
+CHUNK_ELEMENTS = 4_000_000
+
+REQUIRED_COLUMNS = ["AdjOE_Home", "AdjDE_Home", "AdjTempo_Home", "AdjOE_Away", "AdjDE_Away", "AdjTempo_Away"]
+
+
+def expected_scoring(df, tourney_gm=False, avg_efficiency=AVG_EFFICIENCY, hca=HOME_COURT_ADVANTAGE):
+    """
+    Per-game expected possessions and points per possession for both teams.
+
+    Efficiencies combine additively (offense + opponent defense - average;
+    the average cancels out of the margin), so the expected margin equals
+    calc_model_spread's: AdjEM difference times average tempo / 100, plus
+    home court (none at neutral sites) split evenly between the two scores.
+
+    Returns:
+        tuple: (possessions, home_ppp, away_ppp) float32 arrays
+    """
+    oe_home, de_home = df["AdjOE_Home"].to_numpy(float), df["AdjDE_Home"].to_numpy(float)
+    oe_away, de_away = df["AdjOE_Away"].to_numpy(float), df["AdjDE_Away"].to_numpy(float)
+    possessions = (df["AdjTempo_Home"].to_numpy(float) + df["AdjTempo_Away"].to_numpy(float)) / 2
+
+    home_ppp = (oe_home + de_away - avg_efficiency) / 100
+    away_ppp = (oe_away + de_home - avg_efficiency) / 100
+    hca = home_court(df, tourney_gm, hca)
+    home_ppp = home_ppp + hca / 2 / possessions
+    away_ppp = away_ppp - hca / 2 / possessions
+    return (possessions.astype(np.float32), home_ppp.astype(np.float32), away_ppp.astype(np.float32))
+
+
+def draw_scores(possessions, home_ppp, away_ppp, n_sims, rng):
+    """
+    Simulated final scores, games x n_sims float32 arrays of whole points.
+
+    Each simulation draws the game's possession count, then each team's
+    points as the sum of that many possessions (normal approximation).
+    """
+    shape = (len(possessions), n_sims)
+    poss = possessions[:, None] + POSSESSION_SD * rng.standard_normal(shape, dtype=np.float32)
+    np.maximum(poss, 1, out=poss)
+    score_sd = POINTS_PER_POSSESSION_SD * np.sqrt(poss)
+
+    home = poss * home_ppp[:, None] + score_sd * rng.standard_normal(shape, dtype=np.float32)
+    away = poss * away_ppp[:, None] + score_sd * rng.standard_normal(shape, dtype=np.float32)
+    return np.rint(home, out=home), np.rint(away, out=away)
+
+
+def simulate_games(df, n_sims=100_000, seed=None, tourney_gm=False, avg_efficiency=AVG_EFFICIENCY):
+    """
+    Monte Carlo cover and total probabilities for every game on a slate.
+
+    Parameters:
+        df (pd.DataFrame): Merged games with REQUIRED_COLUMNS, 'Spread'
+            (positive when the home team is favored) and optionally 'Total'
+        n_sims (int): Simulations per game
+        seed (int): Seed for reproducible results
+        tourney_gm (bool): No home court advantage for any game, as in
+            calc_model_spread (neutral-site games never get it)
+        avg_efficiency (float): League average AdjOE/AdjDE
+
+    Returns:
+        pd.DataFrame indexed like df: Sim_Margin and Sim_Total (means),
+        Home_Cover_Prob, Away_Cover_Prob, Push_Prob, Over_Prob, Under_Prob,
+        and Sim_Side (1 home, -1 away), Cover_Prob and EV (units per unit
+        staked at -110) for the likelier side
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise KeyError(f"Simulation needs columns: {missing}")
+
+    rng = np.random.default_rng(seed)
+    possessions, home_ppp, away_ppp = expected_scoring(df, tourney_gm, avg_efficiency)
+    spread = df["Spread"].to_numpy(np.float32)
+    total_line = df["Total"].to_numpy(np.float32) if "Total" in df.columns else np.full(len(df), np.nan, np.float32)
+
+    n = len(df)
+    out = {name: np.full(n, np.nan) for name in
+           ("Sim_Margin", "Sim_Total", "Home_Cover_Prob", "Away_Cover_Prob", "Push_Prob", "Over_Prob", "Under_Prob")}
+    chunk = max(CHUNK_ELEMENTS // n_sims, 1)
+    valid = np.flatnonzero(~(np.isnan(possessions) | np.isnan(home_ppp) | np.isnan(away_ppp)))
+
+    for start in range(0, len(valid), chunk):
+        idx = valid[start:start + chunk]
+        home, away = draw_scores(possessions[idx], home_ppp[idx], away_ppp[idx], n_sims, rng)
+        margin = home - away
+        total = home + away
+
+        out["Sim_Margin"][idx] = margin.mean(axis=1)
+        out["Sim_Total"][idx] = total.mean(axis=1)
+        # Home covers when it wins by more than the line; spread NaN gives NaN
+        line = spread[idx, None]
+        out["Home_Cover_Prob"][idx] = np.where(np.isnan(spread[idx]), np.nan, (margin > line).mean(axis=1))
+        out["Away_Cover_Prob"][idx] = np.where(np.isnan(spread[idx]), np.nan, (margin < line).mean(axis=1))
+        out["Push_Prob"][idx] = np.where(np.isnan(spread[idx]), np.nan, (margin == line).mean(axis=1))
+
+        line = total_line[idx, None]
+        out["Over_Prob"][idx] = np.where(np.isnan(total_line[idx]), np.nan, (total > line).mean(axis=1))
+        out["Under_Prob"][idx] = np.where(np.isnan(total_line[idx]), np.nan, (total < line).mean(axis=1))
+
+    result = pd.DataFrame(out, index=df.index)
+    home_side = result["Home_Cover_Prob"] >= result["Away_Cover_Prob"]
+    win = np.where(home_side, result["Home_Cover_Prob"], result["Away_Cover_Prob"])
+    loss = np.where(home_side, result["Away_Cover_Prob"], result["Home_Cover_Prob"])
+    result["Sim_Side"] = np.where(result["Home_Cover_Prob"].isna(), 0, np.where(home_side, 1, -1)).astype(np.int8)
+    result["Cover_Prob"] = win
+    result["EV"] = win * WIN_PAYOUT - loss
+    return result
@@ -1,6 +1,10 @@
+import json
+import os
 import re
 from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
 import numpy as np
+import pandas as pd
 
 
 def parse_line_odds_fuzzy(odds_text, away_team, home_team):
@@ -23,6 +27,8 @@ def parse_line_odds_fuzzy(odds_text, away_team, home_team):
         print(f"{away_team} at {home_team}: No Odds found <{odds_text}>")
         return np.nan
     line_info = match.group(1).strip()  # e.g., "DART -1.5"
+    if line_info.upper() in PICKEM_LINES:
+        return 0.0
 
     # 2. Split the extracted text into the team acronym and the odds string
     parts = line_info.split()
@@ -47,4 +53,115 @@ def parse_line_odds_fuzzy(odds_text, away_team, home_team):
         return abs(odds_value)
 
 
+# ---------- BATCH PARSER ----------
 
+LINE_INFO_RE = re.compile(r"Line:\s*(.*?)\s*O/U", re.DOTALL)
+LINE_PARTS_RE = re.compile(r"^(\S+)\s+(\S+)$")
+TOTAL_RE = re.compile(r"O/U:\s*(\d+(?:\.\d+)?)")
+# Lines with no favorite, e.g. "Line: EVEN"; the spread is 0
+PICKEM_LINES = ["EVEN", "PK", "PICK", "PICKEM", "PICK'EM"]
+
+ACRONYM_CACHE_FILE = "odds_acronym_cache.json"
+
+
+class AcronymIndex:
+    """
+    Memo of ESPN line acronyms to the team name they resolved to, persisted
+    between runs so fuzzy matching only runs for acronyms we haven't seen.
+    """
+
+    def __init__(self, path=ACRONYM_CACHE_FILE):
+        self.path = path
+        self.mapping = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                self.mapping = json.load(f)
+
+    def update(self, acronyms, teams):
+        for acronym, team in zip(acronyms, teams):
+            if self.mapping.get(acronym) != team:
+                self.mapping[acronym] = team
+                self._dirty = True
+
+    def save(self):
+        if self.path and self._dirty:
+            # Write a temp file and rename it over the memo, so an interrupted
+            # or concurrent run never leaves a truncated file behind
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.mapping, f, indent=0, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+def parse_odds_column(odds, away_teams, home_teams, index=None):
+    """
+    Parses a whole column of ESPN odds text in one pass.
+
+    Same rules as parse_line_odds_fuzzy: the line is negative when its
+    acronym belongs to the away team, positive for the home team. Acronyms are
+    resolved through the AcronymIndex first; the rest are fuzzy-matched in a
+    single rapidfuzz cdist call. Pick'em lines (PICKEM_LINES) are 0. Malformed
+    rows come back as NaN with a reason instead of raising.
+
+    Parameters:
+        odds (pd.Series): Raw odds text, e.g. "Line: DART -1.5\\nO/U: 161.5"
+        away_teams (pd.Series): Away team full names, aligned with odds
+        home_teams (pd.Series): Home team full names, aligned with odds
+        index (AcronymIndex): Acronym memo; loaded from ACRONYM_CACHE_FILE if None
+
+    Returns:
+        pd.DataFrame: 'Spread' (float), 'Odds_Parse_Error' (None, 'no_line',
+                      'bad_format' or 'bad_value') and the O/U 'Total' (float,
+                      NaN if missing), indexed like odds
+    """
+    if index is None:
+        index = AcronymIndex()
+
+    odds = odds.fillna("").astype(str)
+    line_info = odds.str.extract(LINE_INFO_RE, expand=False).str.strip()
+    parts = line_info.str.extract(LINE_PARTS_RE)
+    acronyms = parts[0].str.upper()
+    values = pd.to_numeric(parts[1], errors="coerce")
+    pickem = line_info.str.upper().isin(PICKEM_LINES).to_numpy()
+
+    errors = pd.Series(None, index=odds.index, dtype=object)
+    errors[line_info.isna()] = "no_line"
+    errors[line_info.notna() & parts[0].isna() & ~pickem] = "bad_format"
+    errors[parts[0].notna() & values.isna()] = "bad_value"
+    # Pick'em rows have no favorite to match
+    ok = errors.isna().to_numpy() & ~pickem
+
+    away_u = away_teams.astype("string").fillna("").str.upper().to_numpy(object)
+    home_u = home_teams.astype("string").fillna("").str.upper().to_numpy(object)
+    acr = acronyms.fillna("").to_numpy()
+
+    # 1. Acronyms we've resolved before, when that team is playing in this game
+    known = acronyms.map(index.mapping).to_numpy()
+    is_away = ok & (known == away_u)
+    is_home = ok & (known == home_u)
+
+    # 2. Everything else: one fuzzy score matrix over the unique names
+    pending = np.flatnonzero(ok & ~is_away & ~is_home)
+    if len(pending):
+        acr_codes, acr_unique = pd.factorize(acr[pending])
+        team_codes, team_unique = pd.factorize(np.concatenate([away_u[pending], home_u[pending]]))
+        scores = cdist(list(acr_unique), list(team_unique), scorer=fuzz.ratio)
+        away_score = scores[acr_codes, team_codes[:len(pending)]]
+        home_score = scores[acr_codes, team_codes[len(pending):]]
+        is_away[pending] = away_score >= home_score
+
+        # Only remember clear winners; ties fall back to the away team as before
+        decided = away_score != home_score
+        winners = np.where(away_score > home_score, away_u[pending], home_u[pending])
+        index.update(acr[pending][decided], winners[decided])
+
+    index.save()
+
+    magnitude = values.abs().to_numpy(dtype=float)
+    spread = np.where(is_away, -magnitude, magnitude)
+    spread[~ok] = np.nan
+    spread[pickem] = 0.0
+    total = pd.to_numeric(odds.str.extract(TOTAL_RE, expand=False), errors="coerce")
+    return pd.DataFrame({"Spread": spread, "Odds_Parse_Error": errors, "Total": total}, index=odds.index)
@@ -0,0 +1,135 @@
+import datetime
+import json
+import os
+
+import pyarrow.feather as feather
+
+
+SNAPSHOT_DIR = "kenpom_snapshots"
+# Microseconds, so two saves in the same second (the background refresh and
+# a manual one) don't overwrite each other
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+# Snapshots written before microseconds were added to the name
+LEGACY_TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S"
+
+
+def current_season(today=None):
+    """KenPom season year for a date: games from November on count toward next year's season."""
+    today = today or datetime.date.today()
+    return today.year + 1 if today.month >= 11 else today.year
+
+
+def _season_dir(season):
+    return os.path.join(SNAPSHOT_DIR, f"season={season}")
+
+
+def save_snapshot(df, season, name="ratings", fetched_at=None):
+    """
+    Writes a ratings frame as a timestamped Arrow IPC (Feather v2) file under
+    kenpom_snapshots/season=YYYY/. Files are uncompressed so they can be
+    memory-mapped on load, and written to a temp file first so a reader never
+    sees a partial snapshot.
+
+    Returns:
+        str: Path of the written snapshot
+    """
+    fetched_at = fetched_at or datetime.datetime.now()
+    os.makedirs(_season_dir(season), exist_ok=True)
+    path = os.path.join(_season_dir(season), f"{name}_{fetched_at.strftime(TIMESTAMP_FORMAT)}.arrow")
+    tmp = f"{path}.tmp"
+    feather.write_feather(df.reset_index(drop=True), tmp, compression="uncompressed")
+    os.replace(tmp, path)
+    return path
+
+
+def _meta_path(season, name):
+    return os.path.join(_season_dir(season), f"{name}_checked.json")
+
+
+def read_meta(season, name="ratings"):
+    """
+    The sidecar kept next to a season's snapshots: when the source was last
+    checked, the content hash of the newest snapshot and the last refresh
+    error. Empty dict if there is none.
+    """
+    try:
+        with open(_meta_path(season, name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_meta(season, meta, name="ratings"):
+    """Replaces the season's sidecar (temp file + rename, like the snapshots)."""
+    os.makedirs(_season_dir(season), exist_ok=True)
+    path = _meta_path(season, name)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _parse_stamp(stamp):
+    # By length: strptime would also read a legacy stamp's seconds as
+    # one digit plus microseconds
+    fmt = LEGACY_TIMESTAMP_FORMAT if len(stamp) == len("YYYYmmddTHHMMSS") else TIMESTAMP_FORMAT
+    try:
+        return datetime.datetime.strptime(stamp, fmt)
+    except ValueError:
+        return None
+
+
+def list_snapshots(season, name="ratings"):
+    """Returns [(fetched_at, path), ...] for a season, oldest first."""
+    season_dir = _season_dir(season)
+    if not os.path.isdir(season_dir):
+        return []
+
+    prefix = f"{name}_"
+    snapshots = []
+    for filename in os.listdir(season_dir):
+        if not (filename.startswith(prefix) and filename.endswith(".arrow")):
+            continue
+        stamp = filename[len(prefix):-len(".arrow")]
+        fetched_at = _parse_stamp(stamp)
+        if fetched_at is None:
+            continue
+        snapshots.append((fetched_at, os.path.join(season_dir, filename)))
+    return sorted(snapshots)
+
+
+def load_snapshot(path):
+    """Memory-maps a snapshot file and returns it as a DataFrame."""
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def load_latest(season, name="ratings"):
+    """
+    Returns:
+        tuple: (DataFrame, fetched_at) for the newest snapshot of the season,
+               or (None, None) if there is none
+    """
+    snapshots = list_snapshots(season, name)
+    if not snapshots:
+        return None, None
+    fetched_at, path = snapshots[-1]
+    return load_snapshot(path), fetched_at
+
+
+def load_as_of(when, season=None, name="ratings"):
+    """
+    Ratings as they stood at a point in time: the newest snapshot fetched at or
+    before `when`. The season defaults to the one `when` falls in.
+
+    Returns:
+        tuple: (DataFrame, fetched_at), or (None, None) if no snapshot is old enough
+    """
+    if isinstance(when, datetime.date) and not isinstance(when, datetime.datetime):
+        when = datetime.datetime.combine(when, datetime.time.max)
+    season = season or current_season(when)
+
+    eligible = [s for s in list_snapshots(season, name) if s[0] <= when]
+    if not eligible:
+        return None, None
+    fetched_at, path = eligible[-1]
+    return load_snapshot(path), fetched_at
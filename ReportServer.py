@@ -0,0 +1,335 @@
+"""
+Long-running local report service: one process holds KenPom ratings and each
+tracked date's ESPN, Torvik and Action Network frames in memory, refreshes
+them in the background on per-source schedules, and answers a local HTTP/JSON
+API from the last built report.
+
+Usage:
+    python ReportServer.py [--port 8765] [--sources espn,kenpom,torvik,action_network]
+
+    GET /report?date=YYYYMMDD       model-edge games (DanPom CSV columns)
+    GET /report/all?date=YYYYMMDD   every game
+    GET /spread?away=Duke&home=North Carolina[&neutral=1][&date=YYYYMMDD]
+    GET /status                     per-source refresh times, errors and row counts
+"""
+import argparse
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import config
+import HttpCache
+from HttpTransport import shared_transport
+from RunDanPom import (FILTER_COLS, MODEL_COLS, SOURCES, SPREAD_MODELS, action_network_client, build_report,
+                       fetch_action_network, fetch_espn, fetch_kenpom, fetch_torvik, load_kenpom_and_registry,
+                       load_override_dict, matchup_frame, parse_sources)
+
+
+HOST = "127.0.0.1"
+PORT = getattr(config, "SERVER_PORT", 8765)
+
+# Seconds between background refreshes. The per-date sources default to their
+# HTTP cache TTL, so every refresh revalidates instead of hitting the cache.
+REFRESH_SECONDS = {
+    "kenpom": 3600,
+    "espn": HttpCache.TTL_SECONDS["espn"],
+    "torvik": HttpCache.TTL_SECONDS["torvik"],
+    "action_network": HttpCache.TTL_SECONDS["action_network"],
+    **getattr(config, "SERVER_REFRESH_SECONDS", {}),
+}
+
+# A date nobody has asked about for this long stops being refreshed
+DATE_IDLE_SECONDS = 24 * 3600
+
+SPREAD_COLS = ['AdjEM_Away', 'AdjEM_Home', 'AdjTempo_Away', 'AdjTempo_Home']
+
+
+class SourceState:
+    """Last good result of one source for one date, and how the last refresh went."""
+
+    def __init__(self):
+        self.data = None
+        self.refreshed_at = None
+        self.seconds = None
+        self.error = None
+
+    def status(self):
+        frame = self.data[0] if isinstance(self.data, tuple) else self.data
+        return {
+            "refreshed_at": self.refreshed_at.isoformat(timespec="seconds") if self.refreshed_at else None,
+            "seconds": round(self.seconds, 3) if self.seconds is not None else None,
+            "rows": len(frame) if frame is not None else None,
+            "error": self.error,
+        }
+
+
+class Slate:
+    """One date's sources and its last built report, pre-serialized for serving."""
+
+    def __init__(self, date_str):
+        self.date_str = date_str
+        self.sources = {}
+        self.merged_df = None
+        self.filtered_df = None
+        self.payloads = {}
+        self.built_at = None
+        self.last_requested = time.monotonic()
+        self.loaded = threading.Event()
+
+
+class ReportService:
+    """
+    Holds the data and the background refresh threads.
+
+    Each source has its own thread and schedule. KenPom is shared by every
+    date; ESPN, Torvik and Action Network are kept per tracked date. A date is
+    tracked from the first request for it (today is tracked from the start)
+    until nobody has asked for it for DATE_IDLE_SECONDS. After any refresh the
+    date's report is rebuilt once and swapped in, so requests only ever read
+    a finished report. A failed refresh keeps the previous data.
+    """
+
+    def __init__(self, sources=SOURCES):
+        self.sources = list(sources)
+        self.override_dict = load_override_dict()
+        self.session = shared_transport()
+        self.client = action_network_client() if "action_network" in self.sources else None
+
+        self.kenpom = SourceState()
+        self.registry = None
+        self.slates = {}
+        self._lock = threading.Lock()          # slates dict and swaps
+        self._build_lock = threading.Lock()    # build_report (registry caches aren't thread-safe)
+        self._stop = threading.Event()
+        self._threads = []
+
+    # ---------- refreshing ----------
+
+    def start(self):
+        """Loads KenPom and today's slate, then starts the refresh threads."""
+        self._refresh_kenpom()
+        self.slate(datetime.now().strftime("%Y%m%d"))
+        for source in self.sources:
+            thread = threading.Thread(target=self._refresh_loop, args=(source,), name=f"refresh-{source}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_loop(self, source):
+        while not self._stop.wait(REFRESH_SECONDS[source]):
+            try:
+                if source == "kenpom":
+                    self._refresh_kenpom()
+                    for date_str in self._tracked_dates():
+                        self._rebuild(date_str)
+                    continue
+                for date_str in self._tracked_dates():
+                    slate = self.slates.get(date_str)
+                    if slate is not None and self._refresh_source(slate, source):
+                        self._rebuild(date_str)
+            except Exception as e:
+                print(f"⚠ {source} refresh failed: {e}")
+
+    def _tracked_dates(self):
+        """Dates still being asked about; idle ones are dropped."""
+        now = time.monotonic()
+        with self._lock:
+            for date_str in [d for d, s in self.slates.items() if now - s.last_requested > DATE_IDLE_SECONDS]:
+                del self.slates[date_str]
+            return list(self.slates)
+
+    def _refresh_kenpom(self):
+        started = time.perf_counter()
+        try:
+            kenpom_df = fetch_kenpom()
+            with self._build_lock:
+                registry = load_kenpom_and_registry(kenpom_df)
+                self.kenpom.data, self.registry = kenpom_df, registry
+            self.kenpom.error = None
+            self.kenpom.refreshed_at = datetime.now()
+        except Exception as e:
+            self.kenpom.error = str(e)
+            if self.kenpom.data is None:
+                raise
+        self.kenpom.seconds = time.perf_counter() - started
+
+    def _fetch(self, source, date_str):
+        if source == "espn":
+            return fetch_espn(date_str, self.override_dict, self.session)
+        if source == "torvik":
+            return fetch_torvik(date_str, self.session)
+        action_df, lines_df = fetch_action_network(date_str, self.client)
+        if action_df is None:
+            raise RuntimeError("no Action Network data")
+        return action_df, lines_df
+
+    def _refresh_source(self, slate, source):
+        """Refetches one source for one date. Returns True if the data was replaced."""
+        state = slate.sources.setdefault(source, SourceState())
+        started = time.perf_counter()
+        try:
+            data = self._fetch(source, slate.date_str)
+        except Exception as e:
+            state.error = str(e)
+            print(f"⚠ {source} {slate.date_str}: {e}")
+            return False
+        finally:
+            state.seconds = time.perf_counter() - started
+        state.data, state.error, state.refreshed_at = data, None, datetime.now()
+        return True
+
+    def _rebuild(self, date_str):
+        with self._lock:
+            slate = self.slates.get(date_str)
+        espn = slate.sources.get("espn") if slate else None
+        if espn is None or espn.data is None:
+            return
+        torvik = slate.sources.get("torvik")
+        action = slate.sources.get("action_network")
+        action_df = action.data[0] if action and action.data is not None else None
+
+        # build_report only reads the source frames, and passing the same
+        # Torvik frame every time lets the join reuse its index
+        with self._build_lock:
+            merged_df, filtered_df = build_report(espn.data, self.kenpom.data,
+                                                  torvik.data if torvik else None, action_df, self.registry)
+        payloads = {
+            "report": filtered_df.reindex(columns=FILTER_COLS).to_json(orient="records").encode(),
+            "all": merged_df.reindex(columns=FILTER_COLS).to_json(orient="records").encode(),
+        }
+        with self._lock:
+            slate.merged_df, slate.filtered_df, slate.payloads = merged_df, filtered_df, payloads
+            slate.built_at = datetime.now()
+
+    # ---------- serving ----------
+
+    def slate(self, date_str):
+        """The date's slate, fetched (once, in the calling thread) the first time it is asked for."""
+        with self._lock:
+            slate = self.slates.get(date_str)
+            first = slate is None
+            if first:
+                slate = self.slates[date_str] = Slate(date_str)
+            slate.last_requested = time.monotonic()
+
+        if first:
+            try:
+                for source in self.sources:
+                    if source != "kenpom":
+                        self._refresh_source(slate, source)
+                self._rebuild(date_str)
+            finally:
+                slate.loaded.set()
+        else:
+            # Another request may still be loading this date
+            slate.loaded.wait()
+        return slate
+
+    def matchup_spreads(self, away, home, neutral=False, date_str=None):
+        """Every model's spread for one game, with the date's Torvik line if Torvik has the game."""
+        torvik = self.slate(date_str or datetime.now().strftime("%Y%m%d")).sources.get("torvik")
+        schedule = matchup_frame([f"{away} vs {home}" if neutral else f"{away}@{home}"], self.override_dict)
+        with self._build_lock:
+            merged_df, _ = build_report(schedule, self.kenpom.data, torvik.data if torvik else None,
+                                        None, self.registry)
+        if merged_df.empty:
+            raise KeyError(f"No KenPom ratings for {away} and/or {home}")
+        cols = MODEL_COLS + SPREAD_COLS + [f'Model_{name}' for name in SPREAD_MODELS]
+        return merged_df[[c for c in cols if c in merged_df.columns and c != 'Spread']].iloc[0]
+
+    def status(self):
+        with self._lock:
+            slates = dict(self.slates)
+        return {
+            "refresh_seconds": {source: REFRESH_SECONDS[source] for source in self.sources},
+            "kenpom": self.kenpom.status(),
+            "dates": {
+                date_str: {
+                    "built_at": slate.built_at.isoformat(timespec="seconds") if slate.built_at else None,
+                    "games": len(slate.merged_df) if slate.merged_df is not None else 0,
+                    "games_with_edge": len(slate.filtered_df) if slate.filtered_df is not None else 0,
+                    "sources": {source: state.status() for source, state in slate.sources.items()},
+                }
+                for date_str, slate in slates.items()
+            },
+            "http_cache": HttpCache.cache_stats(),
+        }
+
+
+class ReportHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the ReportService on self.server.service."""
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        service = self.server.service
+        try:
+            if url.path in ("/report", "/report/all"):
+                slate = service.slate(params.get("date") or datetime.now().strftime("%Y%m%d"))
+                body = slate.payloads.get("all" if url.path.endswith("/all") else "report")
+                if body is None:
+                    return self._send_json(503, {"error": f"No report for {slate.date_str} yet"})
+                return self._send(200, body)
+            if url.path == "/spread":
+                if "away" not in params or "home" not in params:
+                    return self._send_json(400, {"error": "away and home are required"})
+                game = service.matchup_spreads(params["away"], params["home"],
+                                               params.get("neutral", "").lower() in ("1", "true", "yes"),
+                                               params.get("date"))
+                return self._send(200, game.to_json().encode())
+            if url.path == "/status":
+                return self._send_json(200, service.status())
+            return self._send_json(404, {"error": f"Unknown path {url.path}"})
+        except KeyError as e:
+            return self._send_json(404, {"error": str(e).strip("'\"")})
+        except Exception as e:
+            return self._send_json(500, {"error": str(e)})
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, default=str).encode())
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One short line per request instead of the default stderr log
+        print(f"[{datetime.now():%H:%M:%S}] {self.command} {self.path} -> {args[1] if len(args) > 1 else ''}")
+
+
+def serve(host=HOST, port=PORT, sources=SOURCES):
+    service = ReportService(sources)
+    print(f"Loading KenPom and today's slate ({', '.join(service.sources)})...")
+    service.start()
+    server = ThreadingHTTPServer((host, port), ReportHandler)
+    server.service = service
+    print(f"✓ Serving DanPom reports on http://{host}:{port} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        service.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve DanPom reports from memory over local HTTP.")
+    parser.add_argument("--host", default=HOST, help="Interface to bind (default: localhost only)")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--sources", type=parse_sources, default=SOURCES,
+                        help=f"Comma-separated sources to keep fresh (default: {','.join(SOURCES)})")
+    args = parser.parse_args()
+    if "kenpom" not in args.sources or "espn" not in args.sources:
+        parser.error("--sources must include espn and kenpom")
+
+    serve(args.host, args.port, args.sources)
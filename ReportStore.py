@@ -0,0 +1,160 @@
+"""
+Append-only history of daily reports: every run's merged games frame and
+Action Network frame, one Arrow IPC (Feather v2) file per run under
+report_store/<table>/Report_Date=YYYYMMDD/, with a Run_At timestamp.
+
+Usage:
+    python ReportStore.py --start 20251103 --end 20260310 [--team Duke] [--columns Spread Model_Spread]
+"""
+import argparse
+import datetime
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+import config
+
+
+STORE_DIR = getattr(config, "REPORT_STORE_DIR", "report_store")
+TABLES = ("games", "action_network")
+PARTITION = "Report_Date"
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+def _partition_dir(table, date_str):
+    return os.path.join(STORE_DIR, table, f"{PARTITION}={date_str}")
+
+
+def _date_key(value):
+    """'YYYYMMDD' for a date, datetime or date string (either format)."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.strftime("%Y%m%d")
+    return str(value).replace("-", "")
+
+
+def append_run(df, table, date_str, run_at=None):
+    """
+    Adds one run's frame to the store. Object and categorical columns are
+    written as strings so a day where a column is all empty (or categorical)
+    keeps the same schema as the rest.
+    Files are uncompressed so they can be memory-mapped on read, and written
+    to a temp file first so a reader never sees a partial run.
+
+    Returns:
+        str: Path of the written file
+    """
+    run_at = run_at or datetime.datetime.now()
+    frame = df.reset_index(drop=True)
+    for col in frame.select_dtypes(include=["object", "category"]).columns:
+        frame[col] = frame[col].astype("string")
+    frame["Run_At"] = pd.Timestamp(run_at)
+
+    partition_dir = _partition_dir(table, date_str)
+    os.makedirs(partition_dir, exist_ok=True)
+    path = os.path.join(partition_dir, f"run_{run_at.strftime(TIMESTAMP_FORMAT)}.arrow")
+    tmp = f"{path}.tmp"
+    feather.write_feather(frame, tmp, compression="uncompressed")
+    os.replace(tmp, path)
+    return path
+
+
+def store_report(date_str, merged_df, filtered_df, action_df, run_at=None):
+    """Appends a run's games (Edge marks the filtered ones) and Action Network frames."""
+    run_at = run_at or datetime.datetime.now()
+    games = merged_df.assign(Edge=merged_df.index.isin(filtered_df.index))
+    paths = [append_run(games, "games", date_str, run_at)]
+    if action_df is not None:
+        paths.append(append_run(action_df, "action_network", date_str, run_at))
+    return paths
+
+
+def list_runs(table="games", start=None, end=None, latest_only=True):
+    """
+    [(date_str, path), ...] for runs in the date range, oldest first, from the
+    directory names alone. With latest_only, just the newest run of each date.
+    """
+    table_dir = os.path.join(STORE_DIR, table)
+    if not os.path.isdir(table_dir):
+        return []
+    start, end = _date_key(start), _date_key(end)
+
+    runs = []
+    for partition in sorted(os.listdir(table_dir)):
+        key, _, date_str = partition.partition("=")
+        if key != PARTITION or (start and date_str < start) or (end and date_str > end):
+            continue
+        files = sorted(f for f in os.listdir(os.path.join(table_dir, partition))
+                       if f.startswith("run_") and f.endswith(".arrow"))
+        for filename in files[-1:] if latest_only else files:
+            runs.append((date_str, os.path.join(table_dir, partition, filename)))
+    return runs
+
+
+def _read_run(path, date_str, columns):
+    # Memory-mapped, so only the selected columns are ever paged in
+    table = feather.read_table(path, memory_map=True)
+    if columns:
+        table = table.select([c for c in columns if c in table.schema.names])
+    return table.append_column(PARTITION, pa.repeat(pa.scalar(date_str), table.num_rows))
+
+
+def read_reports(table="games", start=None, end=None, teams=None, columns=None, latest_only=True):
+    """
+    Stored runs for a date range as one DataFrame. Dates outside the range
+    are never opened, and within a run only the requested columns (and the
+    team columns, for the team filter) are read.
+
+    Parameters:
+        table (str): 'games' or 'action_network'
+        start, end: First and last report date (inclusive), as YYYYMMDD,
+            YYYY-MM-DD or a date; None for no bound
+        teams (list): Keep games where either team is one of these (names as
+            stored, i.e. ESPN names for games)
+        columns (list): Columns to read; Report_Date and Run_At always come along
+        latest_only (bool): Only the last run of each date
+
+    Returns:
+        pd.DataFrame
+    """
+    runs = list_runs(table, start, end, latest_only)
+    if not runs:
+        return pd.DataFrame(columns=columns or [])
+
+    read_columns = None
+    if columns:
+        read_columns = list(dict.fromkeys(["Run_At", *columns, *(["Away Team", "Home Team"] if teams else [])]))
+
+    # Columns can come and go between runs; missing ones read as null
+    tables = [_read_run(path, date_str, read_columns) for date_str, path in runs]
+    result = pa.concat_tables(tables, promote_options="permissive")
+    if teams:
+        teams = pa.array(list(teams), pa.string())
+        result = result.filter(pc.or_(pc.is_in(result["Away Team"], teams), pc.is_in(result["Home Team"], teams)))
+    if columns:
+        result = result.select([c for c in ["Run_At", *columns, PARTITION] if c in result.schema.names])
+    return result.to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the stored DanPom reports.")
+    parser.add_argument("--table", default="games", choices=TABLES)
+    parser.add_argument("--start", help="First report date (YYYYMMDD)")
+    parser.add_argument("--end", help="Last report date (YYYYMMDD)")
+    parser.add_argument("--team", action="append", help="Only games involving this team (repeatable)")
+    parser.add_argument("--columns", nargs="*", help="Columns to read")
+    parser.add_argument("--all-runs", action="store_true", help="Every run of each date, not just the last")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    df = read_reports(args.table, args.start, args.end, args.team, args.columns, latest_only=not args.all_runs)
+    elapsed = time.perf_counter() - started
+
+    pd.set_option("display.width", 200)
+    print(df)
+    print(f"\n{len(df)} rows from {df[PARTITION].nunique() if len(df) else 0} dates in {elapsed * 1e3:.1f} ms")
@@ -1,151 +1,504 @@
 import pandas as pd
-from GetESPNSchedule import scrape_espn_schedule
-from KenPomAPI import get_cached_pomeroy_ratings
-from ParseOdds import parse_line_odds_fuzzy
-from CalcModelSpread import calc_model_spread
-from GetBartTovik import scrape_barttorvik_schedule, extract_away_team
-from GetActionNetworkClean import get_action_network_sharp_report
+from CalcModelSpread import edge_mask
+from SpreadModels import DEFAULT_MODELS, evaluate_models
+from FetchSources import FetchSource, fetch_all_sources
+from HttpCache import cache_stats, format_cache_stats
+from HttpTransport import shared_transport
+from JoinEngine import join_sources
+from TeamRegistry import TeamRegistry
+from RunMetrics import RunMetrics, cache_stats_delta
+from Schemas import apply_schema
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import cProfile
+import os
+import pstats
 import re
+import sys
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta
 import config
 
+# Source scrapers, odds parsing, the simulator and the report store are
+# imported where they are used, so a run only loads what its sources need
+# (a run without Torvik never loads the Chromium stack).
+
+
+OUTPUT_DIR = getattr(config, "OUTPUT_DIR", "/home/dconde/Documents/DanPom")
+
+# Select columns for output
+FILTER_COLS = ['Away Team', 'Home Team', 'Time', 'TV', 'Odds', 'AdjEM_Away', 'AdjEM_Home', 'Model_Spread', 'Spread',
+               'Crossover', 'Abs. Diff', 'Bart Tovik', 'AdjOE_Away', 'AdjOE_Home', 'AdjDE_Away', 'AdjDE_Home']
+
+# Monte Carlo probabilities per game, written to their own CSV (the DanPom CSV
+# columns are fixed by the Google Sheets template). Set MONTE_CARLO_SIMS = 0
+# in config.py to skip the simulation.
+SIM_COLS = ['Away Team', 'Home Team', 'Model_Spread', 'Spread', 'Total', 'Sim_Margin', 'Sim_Total', 'Sim_Side',
+            'Home_Cover_Prob', 'Away_Cover_Prob', 'Push_Prob', 'Cover_Prob', 'Over_Prob', 'Under_Prob', 'EV']
+# Spread models compared on every run (registered names or 'module:function');
+# the primary one fills Model_Spread, every one gets a Model_<name> column
+SPREAD_MODELS = getattr(config, "SPREAD_MODELS", DEFAULT_MODELS)
+PRIMARY_SPREAD_MODEL = getattr(config, "PRIMARY_SPREAD_MODEL", "kenpom")
+MODEL_COLS = ['Away Team', 'Home Team', 'Neutral', 'Spread', 'Model_Spread']
+
+MONTE_CARLO_SIMS = getattr(config, "MONTE_CARLO_SIMS", 100_000)
+MONTE_CARLO_SEED = getattr(config, "MONTE_CARLO_SEED", 0)
+
+TORVIK_URL = "https://www.barttorvik.com/schedule.php"
+
+# Sources a run can fetch (--sources); KenPom is always needed for the model
+SOURCES = ["espn", "kenpom", "torvik", "action_network"]
+# --matchup 'Away@Home' for a home game, 'Away vs Home' for a neutral site
+MATCHUP_RE = re.compile(r"^\s*(?P<away>.+?)\s*(?:(?P<home_site>@)|\s(?P<neutral>vs\.?)\s)\s*(?P<home>.+?)\s*$",
+                        re.IGNORECASE)
+
 
 def clean_team_name(team_name):
     """Removes leading numbers, spaces, and special characters (@) from the team name."""
     return re.sub(r"^[0-9\s@]+", "", team_name)
 
-# Get today's date in YYYYMMDD format
-today = datetime.now()
-date_str = today.strftime("%Y%m%d")
-
-print(f"=== DanPom Report for {date_str} ===\n")
-
-# Load the override mapping file
-override_file = "Ken Pom ESPN Mapping.csv"
-override_df = pd.read_csv(override_file)
-override_dict = dict(zip(override_df['ESPN'], override_df['KenPom']))
-
-# Scrape ESPN schedule with today's date
-print("Fetching ESPN schedule...")
-url = f"https://www.espn.com/mens-college-basketball/schedule/_/date/{date_str}"
-espn_df = scrape_espn_schedule(url)
-
-# Apply cleaning function to both columns
-espn_df["Away Team"] = espn_df["Away Team"].apply(clean_team_name)
-espn_df["Home Team"] = espn_df["Home Team"].apply(clean_team_name)
-
-# Replace team names in ESPN DataFrame
-espn_df['Away Team'] = espn_df['Away Team'].replace(override_dict)
-espn_df['Home Team'] = espn_df['Home Team'].replace(override_dict)
-
-# Get KenPom efficiency stats
-print("Fetching KenPom ratings...")
-kenpom_df = get_cached_pomeroy_ratings()
-
-# Get Bart Torvik schedule
-print("Fetching Bart Torvik data...")
-url_tovik = "https://www.barttorvik.com/schedule.php"
-df_tovik = scrape_barttorvik_schedule(url_tovik)
-
-# Create a new column 'Away Team' using the extract_away_team function
-if 'Matchup' in df_tovik.columns:
-    df_tovik['Away Team'] = df_tovik['Matchup'].apply(extract_away_team)
-else:
-    raise Exception("The 'Matchup' column was not found in the BartTovik scraped data.")
-
-if 'Time' in df_tovik.columns:
-    df_tovik.drop(columns=['Time'], inplace=True)
-
-if 'T-Rank Line' in df_tovik.columns:
-    df_tovik.rename(columns={'T-Rank Line': 'Bart Tovik'}, inplace=True)
-
-# Get Action Network sharp money data with error handling
-print("Fetching Action Network sharp money data...")
-action_df = None
-try:
-    action_df = get_action_network_sharp_report(
-        config.ACTION_NETWORK_EMAIL,
-        config.ACTION_NETWORK_PASSWORD,
-        date_str
+
+def load_override_dict():
+    # Load the override mapping file
+    override_file = "Ken Pom ESPN Mapping.csv"
+    override_df = pd.read_csv(override_file)
+    return dict(zip(override_df['ESPN'], override_df['KenPom']))
+
+
+def fetch_espn(date_str, override_dict, session=None):
+    from GetESPNSchedule import scrape_espn_schedule
+
+    # Scrape ESPN schedule for the date
+    url = f"https://www.espn.com/mens-college-basketball/schedule/_/date/{date_str}"
+    return clean_espn_frame(scrape_espn_schedule(url, session=session), override_dict)
+
+
+def clean_espn_frame(espn_df, override_dict):
+    # Apply cleaning function to both columns
+    espn_df["Away Team"] = espn_df["Away Team"].apply(clean_team_name)
+    espn_df["Home Team"] = espn_df["Home Team"].apply(clean_team_name)
+
+    # Replace team names in ESPN DataFrame
+    espn_df['Away Team'] = espn_df['Away Team'].replace(override_dict)
+    espn_df['Home Team'] = espn_df['Home Team'].replace(override_dict)
+    return apply_schema(espn_df, "espn")
+
+
+def matchup_frame(matchups, override_dict):
+    """
+    Schedule frame for games given on the command line instead of ESPN's
+    schedule: 'Away@Home' or 'Away vs Home' (neutral site).
+    """
+    games = []
+    for matchup in matchups:
+        match = MATCHUP_RE.match(matchup)
+        if not match:
+            raise ValueError(f"Can't read matchup '{matchup}' (use 'Away@Home' or 'Away vs Home')")
+        games.append({"Away Team": match["away"], "Home Team": match["home"], "Neutral": bool(match["neutral"])})
+    return clean_espn_frame(pd.DataFrame(games), override_dict)
+
+
+def fetch_kenpom():
+    from KenPomAPI import get_cached_pomeroy_ratings
+
+    # Get KenPom efficiency stats
+    return apply_schema(get_cached_pomeroy_ratings(), "kenpom")
+
+
+def fetch_torvik(date_str, session=None):
+    from GetBartTovik import scrape_barttorvik_schedule
+
+    # Get Bart Torvik schedule for the date
+    return clean_torvik_frame(scrape_barttorvik_schedule(TORVIK_URL, params={'date': date_str}, session=session))
+
+
+def clean_torvik_frame(df_tovik):
+    if 'Time' in df_tovik.columns:
+        df_tovik.drop(columns=['Time'], inplace=True)
+
+    if 'T-Rank Line' in df_tovik.columns:
+        df_tovik.rename(columns={'T-Rank Line': 'Bart Tovik'}, inplace=True)
+    return apply_schema(df_tovik, "torvik")
+
+
+def action_network_client():
+    from GetActionNetworkClean import ActionNetworkClient
+
+    return ActionNetworkClient(config.ACTION_NETWORK_EMAIL, config.ACTION_NETWORK_PASSWORD)
+
+
+def fetch_action_network(date_str, client):
+    # Get Action Network sharp money data and every book's lines from one
+    # report; failures are non-fatal
+    try:
+        data = client.get_sharp_report(date_str)
+        return apply_schema(client.parse_sharp_report_to_df(data), "action_network"), client.parse_market_lines_long(data)
+    except Exception as e:
+        print(f"Error fetching Action Network data: {e}")
+        return None, None
+
+
+def build_report(espn_df, kenpom_df, df_tovik, action_df, registry, metrics=None):
+    """
+    Merges one date's sources and applies the model. Stage times, odds parse
+    failures and dropped games are recorded in `metrics` if one is given.
+    df_tovik and action_df may be None when those sources were skipped, and a
+    schedule without an Odds column (--matchup) gets no Spread.
+
+    Returns:
+        tuple: (merged_df with every game, filtered_df with the model-edge games)
+    """
+    metrics = metrics or RunMetrics("build_report")
+    with metrics.stage("merge"):
+        merged_df = join_sources(espn_df, kenpom_df, df_tovik, action_df, registry)
+
+    # Parse odds
+    if 'Odds' in merged_df.columns:
+        from ParseOdds import parse_odds_column
+
+        with metrics.stage("odds_parse"):
+            parsed_odds = parse_odds_column(merged_df['Odds'], merged_df['Away Team'], merged_df['Home Team'])
+        merged_df['Spread'] = parsed_odds['Spread']
+        merged_df['Odds_Parse_Error'] = parsed_odds['Odds_Parse_Error']
+        merged_df['Total'] = parsed_odds['Total']
+
+        odds_failures = merged_df['Odds_Parse_Error'].value_counts()
+        if len(odds_failures):
+            print(f"⚠ Odds not parsed for {odds_failures.sum()} games: {odds_failures.to_dict()}")
+        for reason, n in odds_failures.items():
+            metrics.count(f"odds_parse_failures.{reason}", n)
+    else:
+        merged_df['Spread'] = np.nan
+        merged_df['Total'] = np.nan
+
+    with metrics.stage("model"):
+        merged_df, filtered_df = _apply_model(merged_df, metrics)
+
+    if MONTE_CARLO_SIMS and merged_df['Spread'].notna().any():
+        from MonteCarlo import simulate_games
+
+        with metrics.stage("simulate"):
+            sims = simulate_games(merged_df, MONTE_CARLO_SIMS, seed=MONTE_CARLO_SEED, tourney_gm=config.TOURNEY_GM,
+                                  avg_efficiency=float(kenpom_df['AdjOE'].mean()))
+        merged_df = merged_df.join(sims)
+        filtered_df = filtered_df.join(sims)
+    metrics.count("games_analyzed", len(merged_df))
+    metrics.count("games_with_edge", len(filtered_df))
+    return merged_df, filtered_df
+
+
+def _apply_model(merged_df, metrics):
+    # Every spread model in one pass, home court per game from ESPN's neutral-site flag
+    models = list(dict.fromkeys([PRIMARY_SPREAD_MODEL, *SPREAD_MODELS]))
+    spreads = evaluate_models(merged_df, models, config.TOURNEY_GM)
+    for name, n in spreads.attrs["sparse_models"].items():
+        metrics.count(f"model_missing.{name}", n)
+    merged_df['Model_Spread'] = spreads[PRIMARY_SPREAD_MODEL]
+    merged_df = merged_df.join(spreads.add_prefix('Model_'))
+    games_before_drop = len(merged_df)
+    merged_df = merged_df.dropna(subset=['Model_Spread'])
+    if len(merged_df) < games_before_drop:
+        print(f"⚠ Dropped {games_before_drop - len(merged_df)} games without KenPom ratings for both teams")
+    metrics.count("games_dropped_no_ratings", games_before_drop - len(merged_df))
+
+    # CROSSOVER - identify games where one team is above average and one is below
+    merged_df['Crossover'] = np.where(
+        ((merged_df['AdjEM_Home'] < 0) & (merged_df['AdjEM_Away'] > 0)) |
+        ((merged_df['AdjEM_Home'] > 0) & (merged_df['AdjEM_Away'] < 0)),
+        "YES",
+        "NO"
     )
+
+    # Create a new column "Abs. Diff" as the absolute difference between Model_Spread and Spread
+    merged_df['Abs. Diff'] = abs(merged_df['Model_Spread'] - merged_df['Spread'])
+
+    # Sort the DataFrame highest to lowest based on "Abs. Diff"
+    merged_df = merged_df.sort_values(by='Abs. Diff', ascending=False)
+
+    # Filter the DataFrame using the condition:
+    # (Model_Spread > Spread and AdjEM_Home > 0) OR (Model_Spread < Spread and AdjEM_Away > 0)
+    mask = edge_mask(merged_df['Model_Spread'], merged_df['Spread'],
+                     merged_df['AdjEM_Home'], merged_df['AdjEM_Away'])
+
+    return merged_df, merged_df[mask].copy()
+
+
+def write_outputs(date_str, merged_df, filtered_df, action_df, lines_df=None):
+    # Save Action Network data to separate file
     if action_df is not None:
-        print(f"✓ Got sharp money data for {len(action_df)} games")
-        # Save Action Network data to separate file
-        action_output = rf"/home/dconde/Documents/DanPom/ActionNetwork_{date_str}.csv"
+        action_output = os.path.join(OUTPUT_DIR, f"ActionNetwork_{date_str}.csv")
         action_df.to_csv(action_output, index=False)
         print(f"✓ Saved Action Network data to: {action_output}")
-    else:
+
+    # Best line and consensus per game/market/side across every book
+    if lines_df is not None and len(lines_df):
+        from GetActionNetworkClean import line_shopping_table
+
+        lines_output = os.path.join(OUTPUT_DIR, f"ActionNetworkLines_{date_str}.csv")
+        line_shopping_table(lines_df).to_csv(lines_output, index=False)
+        print(f"✓ Saved line shopping table to: {lines_output}")
+
+    # Save to CSV
+    output_file = os.path.join(OUTPUT_DIR, f"DanPom_{date_str}.csv")
+    output_file_all = os.path.join(OUTPUT_DIR, f"DanPom_all_{date_str}.csv")
+
+    # Skipped sources leave their columns blank rather than dropping them
+    filtered_df.reindex(columns=FILTER_COLS).to_csv(output_file, index=False)
+    merged_df.reindex(columns=FILTER_COLS).to_csv(output_file_all, index=False)
+
+    print(f"✓ Saved filtered results to: {output_file}")
+    print(f"✓ Saved all games to: {output_file_all}")
+
+    model_output = os.path.join(OUTPUT_DIR, f"DanPomModels_{date_str}.csv")
+    model_cols = MODEL_COLS + [f'Model_{name}' for name in SPREAD_MODELS if f'Model_{name}' in merged_df.columns]
+    merged_df[[c for c in model_cols if c in merged_df.columns]].to_csv(model_output, index=False)
+    print(f"✓ Saved spread model comparison to: {model_output}")
+
+    if 'Cover_Prob' in merged_df.columns:
+        sim_output = os.path.join(OUTPUT_DIR, f"DanPomSim_{date_str}.csv")
+        merged_df.sort_values('EV', ascending=False)[SIM_COLS].to_csv(sim_output, index=False)
+        print(f"✓ Saved simulation results to: {sim_output}")
+
+
+def store_run(date_str, merged_df, filtered_df, action_df, metrics):
+    """Appends the run to the report store unless REPORT_STORE_DIR is None."""
+    import ReportStore
+
+    if not ReportStore.STORE_DIR:
+        return
+    with metrics.stage("store"):
+        ReportStore.store_report(date_str, merged_df, filtered_df, action_df, metrics.started_at)
+    print(f"✓ Appended run to report store: {ReportStore.STORE_DIR}")
+
+
+def load_kenpom_and_registry(kenpom_df):
+    registry = TeamRegistry.from_kenpom(kenpom_df)
+    kenpom_df['Team_ID'] = registry.resolve(kenpom_df['TeamName'], 'kenpom')
+    return registry
+
+
+def count_rows(metrics, sources):
+    """
+    Rows fetched per source, as 'rows.<source>' counters, and values the
+    ingest schema could not convert, as 'schema_failures.<source>.<column>'.
+    """
+    for name, result in sources.items():
+        frames = result if isinstance(result, tuple) else (result,)
+        metrics.count(f"rows.{name}", len(frames[0]) if frames[0] is not None else 0)
+        if frames[0] is not None:
+            for col, n in frames[0].attrs.get("schema_failures", {}).items():
+                metrics.count(f"schema_failures.{name}.{col}", n)
+
+
+def finish_manifest(metrics, registry, cache_before, path):
+    """Adds run-wide cache, Torvik render and name resolution facts, then writes the manifest."""
+    metrics.detail("http_cache", cache_stats_delta(cache_before, cache_stats()))
+    # Only there if Torvik ran
+    if "GetBartTovik" in sys.modules:
+        metrics.detail("torvik_render", sys.modules["GetBartTovik"].render_stats())
+    unresolved = {source: sorted(names) for source, names in registry.unresolved.items()}
+    metrics.detail("unresolved_names", unresolved)
+    metrics.count("unresolved_names", sum(len(names) for names in unresolved.values()))
+    return metrics.write_manifest(path)
+
+
+def date_sources(date_str, sources, override_dict, client, session=None):
+    """FetchSources for the selected per-date sources (everything but KenPom)."""
+    fetches = []
+    if "espn" in sources:
+        fetches.append(FetchSource("ESPN", lambda: fetch_espn(date_str, override_dict, session), timeout=60))
+    if "torvik" in sources:
+        fetches.append(FetchSource("Bart Torvik", lambda: fetch_torvik(date_str, session), timeout=90))
+    if "action_network" in sources:
+        fetches.append(FetchSource("Action Network", lambda: fetch_action_network(date_str, client), timeout=60,
+                                   required=False))
+    return fetches
+
+
+def run(date_str, sources=SOURCES, matchups=None):
+    """
+    Builds and writes the report for one date, plus its run manifest.
+
+    Only the given sources are fetched (KenPom is always needed). With
+    matchups ('Away@Home' / 'Away vs Home'), those games replace ESPN's
+    schedule and their model spreads are printed instead of written.
+    """
+    print(f"=== DanPom Report for {date_str} ===\n")
+    metrics = RunMetrics(date_str)
+    cache_before = cache_stats()
+    override_dict = load_override_dict()
+    client = action_network_client() if "action_network" in sources else None
+
+    # Fetch all sources at once; the slowest one sets the run time.
+    fetches = [FetchSource("KenPom", fetch_kenpom, timeout=60)]
+    fetches += date_sources(date_str, set(sources) - ({"espn"} if matchups else set()), override_dict, client)
+    print(f"Fetching {', '.join(fetch.name for fetch in fetches)}...")
+    with metrics.stage("fetch"):
+        results = fetch_all_sources(fetches, metrics)
+    count_rows(metrics, results)
+    action_df, lines_df = results.get("Action Network") or (None, None)
+
+    # Action Network failures are non-fatal
+    if action_df is not None:
+        print(f"✓ Got sharp money data for {len(action_df)} games")
+    elif "action_network" in sources:
         print("⚠ Action Network data unavailable")
-except Exception as e:
-    print(f"⚠ Error fetching Action Network data: {e}")
-    print("  Continuing without sharp money data...")
-
-# Merge ESPN schedule with KenPom stats
-merged_df = espn_df.merge(kenpom_df, left_on=['Away Team'], right_on=['TeamName'], how='left')
-merged_df = merged_df.merge(kenpom_df, left_on=['Home Team'], right_on=['TeamName'], how='left', suffixes=('_Away', '_Home'))
-merged_df = merged_df.merge(df_tovik, how='left', on='Away Team', suffixes=('_KenPom', '_BartTovik'))
-
-# Handle edge case when Ken Pom Home Team name doesn't match Bart Tovik
-if 'Home Team_KenPom' in merged_df.columns:
-    merged_df.rename(columns={'Home Team_KenPom':'Home Team'}, inplace=True)
-
-# Parse odds
-merged_df['Spread'] = merged_df.apply(
-    lambda row: parse_line_odds_fuzzy(row['Odds'], row['Away Team'], row['Home Team']),
-    axis=1
-)
-
-print(merged_df[['Away Team', 'Home Team', 'Odds', 'Spread']].head())
-
-# Calculate model spread
-merged_df['Model_Spread'] = calc_model_spread(merged_df, config.TOURNEY_GM)
-merged_df = merged_df.dropna(subset=['Model_Spread'])
-merged_df['Model_Spread'] = pd.to_numeric(merged_df['Model_Spread'], errors='coerce')
-merged_df['Spread'] = pd.to_numeric(merged_df['Spread'], errors='coerce')
-merged_df['AdjEM_Home'] = pd.to_numeric(merged_df['AdjEM_Home'], errors='coerce')
-merged_df['AdjEM_Away'] = pd.to_numeric(merged_df['AdjEM_Away'], errors='coerce')
-
-# CROSSOVER - identify games where one team is above average and one is below
-merged_df['Crossover'] = np.where(
-    ((merged_df['AdjEM_Home'] < 0) & (merged_df['AdjEM_Away'] > 0)) |
-    ((merged_df['AdjEM_Home'] > 0) & (merged_df['AdjEM_Away'] < 0)),
-    "YES",
-    "NO"
-)
-
-# Create a new column "Abs. Diff" as the absolute difference between Model_Spread and Spread
-merged_df['Abs. Diff'] = abs(merged_df['Model_Spread'] - merged_df['Spread'])
-
-# Sort the DataFrame highest to lowest based on "Abs. Diff"
-merged_df = merged_df.sort_values(by='Abs. Diff', ascending=False)
-
-# Filter the DataFrame using the condition:
-# (Model_Spread > Spread and AdjEM_Home > 0) OR (Model_Spread < Spread and AdjEM_Away > 0)
-mask = (
-    ((merged_df['Model_Spread'] > merged_df['Spread']) & (merged_df['AdjEM_Home'] > 0)) |
-    ((merged_df['Model_Spread'] < merged_df['Spread']) & (merged_df['AdjEM_Away'] > 0))
-)
-
-filtered_df = merged_df[mask].copy()
+        print("  Continuing without sharp money data...")
 
-# Select columns for output
-filter_cols = ['Away Team', 'Home Team', 'Time', 'TV', 'Odds', 'AdjEM_Away', 'AdjEM_Home', 'Model_Spread', 'Spread',
-                 'Crossover', 'Abs. Diff', 'Bart Tovik', 'AdjOE_Away', 'AdjOE_Home', 'AdjDE_Away', 'AdjDE_Home']
+    kenpom_df = results["KenPom"]
+    with metrics.stage("registry"):
+        registry = load_kenpom_and_registry(kenpom_df)
+    schedule_df = matchup_frame(matchups, override_dict) if matchups else results["ESPN"]
+    merged_df, filtered_df = build_report(schedule_df, kenpom_df, results.get("Bart Torvik"), action_df, registry,
+                                          metrics)
+    print(registry.unresolved_report())
+
+    if matchups:
+        model_cols = MODEL_COLS + [f'Model_{name}' for name in SPREAD_MODELS]
+        print(merged_df[[c for c in model_cols if c in merged_df.columns and c != 'Spread']].to_string(index=False))
+        return
+
+    print(merged_df.reindex(columns=['Away Team', 'Home Team', 'Odds', 'Spread']).head())
+
+    print("\n=== FILTERED RESULTS (Games with Model Edge) ===")
+    print(filtered_df.reindex(columns=FILTER_COLS))
+    print()
+
+    with metrics.stage("write_outputs"):
+        write_outputs(date_str, merged_df, filtered_df, action_df, lines_df)
+    store_run(date_str, merged_df, filtered_df, action_df, metrics)
+    print(f"\nTotal games analyzed: {len(merged_df)}")
+    print(f"Games with model edge: {len(filtered_df)}")
+    print(f"\n{format_cache_stats()}")
+
+    manifest = finish_manifest(metrics, registry, cache_before,
+                               os.path.join(OUTPUT_DIR, f"DanPom_manifest_{date_str}.json"))
+    print(f"\n{metrics.summary()}")
+    print(f"✓ Saved run manifest to: {manifest}")
+
+
+def run_batch(dates, max_workers=4, sources=SOURCES):
+    """
+    Builds and writes the report for every date in `dates`, fetching only
+    the given sources.
 
-result = filtered_df[filter_cols]
+    KenPom ratings, the team registry, the HTTP session and the Action Network
+    login are set up once and shared; each date's ESPN, Torvik and Action
+    Network fetches run concurrently, several dates at a time. A date whose
+    required sources fail is reported and skipped.
 
-print("\n=== FILTERED RESULTS (Games with Model Edge) ===")
-print(result)
+    Each date gets its own run manifest; the batch manifest adds the shared
+    KenPom load, HTTP cache counts and unresolved names.
+    """
+    print(f"=== DanPom Batch Report for {dates[0]}..{dates[-1]} ({len(dates)} dates) ===\n")
+    batch_metrics = RunMetrics(f"{dates[0]}-{dates[-1]}")
+    cache_before = cache_stats()
+    override_dict = load_override_dict()
+    session = shared_transport()
+    client = action_network_client() if "action_network" in sources else None
+    with batch_metrics.stage("kenpom"):
+        kenpom_df = fetch_kenpom()
+    with batch_metrics.stage("registry"):
+        registry = load_kenpom_and_registry(kenpom_df)
 
-# Save to CSV
-output_file = rf"/home/dconde/Documents/DanPom/DanPom_{date_str}.csv"
-output_file_all = rf"/home/dconde/Documents/DanPom/DanPom_all_{date_str}.csv"
+    def fetch_date(date_str, metrics):
+        with metrics.stage("fetch"):
+            results = fetch_all_sources(date_sources(date_str, sources, override_dict, client, session), metrics)
+        count_rows(metrics, results)
+        return results
 
-result.to_csv(output_file, index=False)
-merged_df[filter_cols].to_csv(output_file_all, index=False)
+    written = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="date") as executor:
+        date_metrics = {date_str: RunMetrics(date_str) for date_str in dates}
+        futures = {date_str: executor.submit(fetch_date, date_str, date_metrics[date_str]) for date_str in dates}
+        for date_str, future in futures.items():
+            metrics = date_metrics[date_str]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"⚠ {date_str}: skipped ({e})")
+                batch_metrics.count("dates_skipped")
+                continue
+
+            action_df, lines_df = results.get("Action Network") or (None, None)
+            merged_df, filtered_df = build_report(results["ESPN"], kenpom_df, results.get("Bart Torvik"),
+                                                  action_df, registry, metrics)
+            with metrics.stage("write_outputs"):
+                write_outputs(date_str, merged_df, filtered_df, action_df, lines_df)
+            store_run(date_str, merged_df, filtered_df, action_df, metrics)
+            metrics.write_manifest(os.path.join(OUTPUT_DIR, f"DanPom_manifest_{date_str}.json"))
+            print(f"{date_str}: {len(merged_df)} games analyzed, {len(filtered_df)} with model edge\n")
+            written += 1
+            batch_metrics.count("dates_written")
+
+    print(registry.unresolved_report())
+    print(f"\nWrote reports for {written} of {len(dates)} dates")
+    print(f"\n{format_cache_stats()}")
+
+    manifest = finish_manifest(batch_metrics, registry, cache_before,
+                               os.path.join(OUTPUT_DIR, f"DanPom_manifest_{dates[0]}_{dates[-1]}.json"))
+    print(f"✓ Saved batch manifest to: {manifest}")
+
+
+def date_range(start, end):
+    """YYYYMMDD strings from start to end inclusive."""
+    day = datetime.strptime(start, "%Y%m%d")
+    last = datetime.strptime(end, "%Y%m%d")
+    dates = []
+    while day <= last:
+        dates.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+    return dates
+
+
+def parse_sources(value):
+    """--sources: comma-separated names from SOURCES."""
+    sources = [name.strip().lower().replace("-", "_") for name in value.split(",") if name.strip()]
+    unknown = [name for name in sources if name not in SOURCES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown sources {unknown} (choose from {', '.join(SOURCES)})")
+    return sources
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the DanPom report.")
+    parser.add_argument("--date", help="Report date (YYYYMMDD, default today)")
+    parser.add_argument("--start", help="First date of a batch run (YYYYMMDD)")
+    parser.add_argument("--end", help="Last date of a batch run (YYYYMMDD, defaults to --start)")
+    parser.add_argument("--sources", type=parse_sources, default=SOURCES,
+                        help=f"Comma-separated sources to fetch (default: {','.join(SOURCES)}). kenpom is required; "
+                             "skipped sources leave their columns blank.")
+    parser.add_argument("--matchup", action="append", metavar="'AWAY@HOME'",
+                        help="Print model spreads for this game instead of ESPN's schedule "
+                             "(repeatable; 'Away vs Home' for a neutral site), e.g. --sources kenpom --matchup Duke@UNC")
+    parser.add_argument("--workers", type=int, default=4, help="Dates fetched at once in batch mode")
+    parser.add_argument("--profile", nargs="?", const="", metavar="PATH",
+                        help="cProfile the run and save the stats (default: DanPom_<date>.prof in OUTPUT_DIR). "
+                             "Fetch worker threads show up as waits on the main thread.")
+    args = parser.parse_args()
+    if "kenpom" not in args.sources:
+        parser.error("--sources must include kenpom")
+    if "espn" not in args.sources and not args.matchup:
+        parser.error("without espn in --sources, give the games with --matchup")
+    if args.matchup and args.start:
+        parser.error("--matchup is for a single date, not --start/--end")
+
+    profiler = cProfile.Profile() if args.profile is not None else None
+    if profiler:
+        profiler.enable()
+
+    if args.start:
+        label = args.start if not args.end else f"{args.start}_{args.end}"
+        run_batch(date_range(args.start, args.end or args.start), max_workers=args.workers, sources=args.sources)
+    else:
+        # Default to today's date in YYYYMMDD format
+        label = args.date or datetime.now().strftime("%Y%m%d")
+        run(label, sources=args.sources, matchups=args.matchup)
 
-print(f"\n✓ Saved filtered results to: {output_file}")
-print(f"✓ Saved all games to: {output_file_all}")
-print(f"\nTotal games analyzed: {len(merged_df)}")
-print(f"Games with model edge: {len(result)}")
+    if profiler:
+        profiler.disable()
+        profile_path = args.profile or os.path.join(OUTPUT_DIR, f"DanPom_{label}.prof")
+        profiler.dump_stats(profile_path)
+        print("\n=== Profile (top 20 by cumulative time) ===")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+        print(f"✓ Saved profile to: {profile_path} (open with: python -m pstats {profile_path})")
@@ -0,0 +1,98 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """Process high-water resident memory in MB (None where unavailable)."""
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class RunMetrics:
+    """
+    Stage timings and counters for one report run, written out as a JSON
+    manifest next to the CSVs.
+
+    Stage memory is the process high-water RSS when the stage ended and how
+    much the stage raised it. Sources fetch concurrently, so their per-source
+    entries only carry wall time.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.details = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            rss_after = peak_rss_mb()
+            growth = rss_after - rss_before if rss_after is not None else None
+            self.record_time(name, seconds, peak_rss_mb=rss_after, rss_growth_mb=growth)
+
+    def record_time(self, name, seconds, **extra):
+        with self._lock:
+            self.stages[name] = {"seconds": round(seconds, 4), **extra}
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def detail(self, name, value):
+        """Non-numeric facts for the manifest (lists of names, per-source stats)."""
+        with self._lock:
+            self.details[name] = value
+
+    def manifest(self):
+        return {
+            "label": self.label,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "wall_seconds": round(time.perf_counter() - self._started, 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": self.stages,
+            "counters": self.counters,
+            **self.details,
+        }
+
+    def write_manifest(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.manifest(), f, indent=2, default=str)
+        os.replace(tmp, path)
+        return path
+
+    def summary(self):
+        """One line per stage, slowest first."""
+        lines = ["Stage timings:"]
+        for name, stage in sorted(self.stages.items(), key=lambda kv: -kv[1]["seconds"]):
+            lines.append(f"  {name}: {stage['seconds']:.2f}s")
+        return "\n".join(lines)
+
+
+def cache_stats_delta(before, after):
+    """Per-source HTTP cache counts accumulated between two cache_stats() calls."""
+    delta = {}
+    for source, counts in after.items():
+        previous = before.get(source, {})
+        delta[source] = {k: v - previous.get(k, 0) for k, v in counts.items()}
+    return delta
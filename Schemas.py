@@ -0,0 +1,111 @@
+"""
+Declared dtypes for every source frame, applied once when the frame is
+fetched: float32 ratings and lines, nullable integer ranks and counts,
+categorical team names, conferences and TV networks, and ESPN's tip time
+parsed into a tz-aware Tip_Time. The merge, the spread models and the
+outputs then use the columns as they are instead of converting them again.
+"""
+import pandas as pd
+
+import config
+
+
+# ESPN's schedule page lists tip times in this zone
+ESPN_TIMEZONE = getattr(config, "ESPN_TIMEZONE", "America/New_York")
+TIP_TIME_FORMAT = "%I:%M %p"
+# ESPN Time values that mean "no tip time" rather than a parse failure
+TIP_TIME_PLACEHOLDERS = {"TBD", "TBA", "LIVE", "POSTPONED", "CANCELED", "CANCELLED", "SUSPENDED"}
+
+TEAM_COLUMNS = {"Away Team": "category", "Home Team": "category"}
+
+KENPOM_FLOAT_COLUMNS = ["AdjEM", "AdjOE", "AdjDE", "AdjTempo", "OE", "DE", "Tempo", "Pythag", "Luck",
+                        "SOS", "SOSO", "SOSD", "NCSOS"]
+KENPOM_RANK_COLUMNS = [f"Rank{col}" for col in KENPOM_FLOAT_COLUMNS]
+
+# source -> {column: dtype}. Columns a frame doesn't have are skipped, and
+# columns not listed keep whatever dtype the parser gave them.
+SCHEMAS = {
+    "espn": {**TEAM_COLUMNS, "Neutral": "bool", "TV": "category"},
+    "kenpom": {"TeamName": "category", "ConfShort": "category", "Season": "Int16", "Wins": "Int16",
+               "Losses": "Int16", **{col: "float32" for col in KENPOM_FLOAT_COLUMNS},
+               **{col: "Int16" for col in KENPOM_RANK_COLUMNS}},
+    "torvik": {**TEAM_COLUMNS, "Torvik_Spread": "float32", "TTQ": "float32"},
+    "action_network": {**TEAM_COLUMNS},
+}
+
+
+def _convert(values, dtype):
+    """(converted column, number of present values that could not be converted)"""
+    if dtype == "category":
+        return values.astype("category"), 0
+    if dtype == "bool":
+        return values.fillna(False).astype(bool), 0
+
+    # Blank strings are missing values, not failures
+    present = values.notna() & (values.astype(str).str.strip() != "")
+    converted = pd.to_numeric(values, errors="coerce")
+    if pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype)):
+        converted = converted.where(converted % 1 == 0)
+    failed = int((present & converted.isna()).sum())
+    return converted.astype(dtype), failed
+
+
+def tip_times(df, tz=ESPN_TIMEZONE):
+    """
+    Tip-off of each ESPN game as a tz-aware timestamp, from the section Date
+    and the 'h:mm PM' Time. Placeholders such as TBD or LIVE give NaT
+    without counting as failures.
+
+    Returns:
+        tuple: (pd.Series of datetime64[ns, tz], number of unparsed times)
+    """
+    times = df["Time"].astype("string").str.strip()
+    clock = pd.to_datetime(times, format=TIP_TIME_FORMAT, errors="coerce")
+    offset = pd.to_timedelta(clock.dt.hour * 3600 + clock.dt.minute * 60, unit="s")
+    dates = df["Date"] if "Date" in df.columns else pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    tips = (dates.dt.normalize() + offset).dt.tz_localize(tz, ambiguous="NaT", nonexistent="NaT")
+
+    present = times.notna() & (times != "") & ~times.str.upper().isin(TIP_TIME_PLACEHOLDERS)
+    return tips, int((present & clock.isna()).sum())
+
+
+# source -> {derived column: function(df) -> (column, failures)}
+DERIVED_COLUMNS = {
+    "espn": {"Tip_Time": tip_times},
+}
+
+
+def apply_schema(df, source):
+    """
+    Converts a source frame's columns to SCHEMAS[source] and adds the
+    source's derived columns. Values that can't be converted become missing;
+    the count per column is printed and kept in df.attrs['schema_failures']
+    (RunDanPom records it in the run manifest).
+
+    Parameters:
+        df (pd.DataFrame): Frame as the source's parser returned it
+        source (str): 'espn', 'kenpom', 'torvik' or 'action_network'
+
+    Returns:
+        pd.DataFrame: df, converted in place
+    """
+    failures = {}
+    for col, dtype in SCHEMAS[source].items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        df[col], failed = _convert(df[col], dtype)
+        if failed:
+            failures[col] = failed
+
+    for col, derive in DERIVED_COLUMNS.get(source, {}).items():
+        try:
+            df[col], failed = derive(df)
+        except KeyError:
+            continue
+        if failed:
+            failures[col] = failed
+
+    if failures:
+        print(f"⚠ {source}: values not converted at ingest: {failures}")
+    df.attrs["schema_failures"] = failures
+    return df
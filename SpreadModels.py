@@ -0,0 +1,132 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+
+import config
+from CalcModelSpread import home_court
+
+
+# Share of the KenPom spread in the blended model (the rest is Torvik's line)
+BLEND_WEIGHT = getattr(config, "BLEND_WEIGHT", 0.5)
+
+DEFAULT_MODELS = ["kenpom", "torvik", "blended"]
+
+# A model with no prediction for more than this share of the games is
+# flagged; usually one of its input columns didn't join
+MAX_MISSING_SHARE = 0.5
+
+# name -> function(inputs, hca) returning one home spread per game
+MODELS = {}
+
+
+def register_model(name):
+    """
+    Decorator adding a spread model to the registry. A model takes a
+    ModelInputs and the per-game home court points (numpy array) and returns
+    a float array of home spreads (positive when the home team is favored),
+    NaN where it has no opinion.
+
+        @register_model("efficiency_only")
+        def efficiency_only(inputs, hca):
+            return inputs["AdjEM_Home"] - inputs["AdjEM_Away"] + hca
+    """
+    def decorator(func):
+        MODELS[name] = func
+        return func
+    return decorator
+
+
+class ModelInputs:
+    """
+    The merged frame as float arrays, each converted once no matter how many
+    models read it, plus other models' results so one model can build on
+    another without recomputing it.
+    """
+
+    def __init__(self, df, hca):
+        self.df = df
+        self.hca = hca
+        self._columns = {}
+        self._results = {}
+
+    def __len__(self):
+        return len(self.df)
+
+    def __getitem__(self, column):
+        if column not in self._columns:
+            if column in self.df.columns and pd.api.types.is_numeric_dtype(self.df[column]):
+                # Typed at ingest (Schemas.py); only widened to float64 here
+                values = self.df[column].to_numpy(float, na_value=np.nan)
+            elif column in self.df.columns:
+                # A column no schema declares, e.g. one a custom model adds
+                values = pd.to_numeric(self.df[column], errors="coerce").to_numpy(float)
+            else:
+                values = np.full(len(self.df), np.nan)
+            self._columns[column] = values
+        return self._columns[column]
+
+    def model(self, name):
+        if name not in self._results:
+            self._results[name] = np.asarray(resolve_model(name)(self, self.hca), dtype=float)
+        return self._results[name]
+
+
+def resolve_model(name):
+    """Registered model by name, or a user function given as 'module:function'."""
+    if name in MODELS:
+        return MODELS[name]
+    if ":" in name:
+        module, func = name.split(":", 1)
+        return getattr(importlib.import_module(module), func)
+    raise KeyError(f"Unknown spread model '{name}' (registered: {sorted(MODELS)})")
+
+
+@register_model("kenpom")
+def kenpom_tempo_adjusted(inputs, hca):
+    # AdjEM difference scaled to the game's average tempo, as in calc_model_spread
+    return (inputs["AdjEM_Home"] - inputs["AdjEM_Away"]) * (inputs["AdjTempo_Home"] + inputs["AdjTempo_Away"]) / 200 + hca
+
+
+@register_model("torvik")
+def torvik_line(inputs, hca):
+    # Torvik's own projection already accounts for the venue
+    return inputs["Torvik_Spread"]
+
+
+@register_model("blended")
+def blended(inputs, hca):
+    # Weighted KenPom/Torvik average; KenPom alone where Torvik has no line
+    kenpom, torvik = inputs.model("kenpom"), inputs.model("torvik")
+    return np.where(np.isnan(torvik), kenpom, BLEND_WEIGHT * kenpom + (1 - BLEND_WEIGHT) * torvik)
+
+
+def evaluate_models(df, models=None, tourney_gm=False):
+    """
+    Runs every model over the merged frame in one pass.
+
+    Parameters:
+        df (pd.DataFrame): Merged games (KenPom _Home/_Away columns,
+            Torvik_Spread, Neutral)
+        models (list): Model names, registered or 'module:function'
+            (default DEFAULT_MODELS)
+        tourney_gm (bool): Treat every game as neutral site
+
+    Returns:
+        pd.DataFrame: games x models matrix of home spreads, indexed like df.
+            attrs['sparse_models'] maps each model missing more than
+            MAX_MISSING_SHARE of the games to its number of missing games.
+    """
+    models = list(models or DEFAULT_MODELS)
+    inputs = ModelInputs(df, home_court(df, tourney_gm))
+    matrix = np.empty((len(df), len(models)))
+    for j, name in enumerate(models):
+        matrix[:, j] = inputs.model(name)
+    spreads = pd.DataFrame(matrix, index=df.index, columns=models)
+
+    missing = spreads.isna().sum()
+    sparse = {name: int(n) for name, n in missing.items() if n > MAX_MISSING_SHARE * len(df)}
+    for name, n in sparse.items():
+        print(f"⚠ Spread model '{name}' has no prediction for {n} of {len(df)} games")
+    spreads.attrs["sparse_models"] = sparse
+    return spreads
@@ -0,0 +1,127 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+ESPN_MAPPING_FILE = "Ken Pom ESPN Mapping.csv"
+ACTION_NETWORK_MAPPING_FILE = "Action Network Mapping.csv"
+
+# Minimum fuzz.ratio (0-100) for a fuzzy match to count. Kept high: a wrong
+# match silently puts the wrong ratings on a game.
+FUZZY_CUTOFF = 90
+
+UNRESOLVED_ID = -1
+
+
+def normalize_name(name):
+    """Lowercase, 'State' -> 'st', punctuation dropped, whitespace collapsed."""
+    name = name.lower().replace("&", " and ")
+    name = re.sub(r"\bstate\b", "st", name)
+    name = re.sub(r"[.'()\-]", " ", name)
+    return " ".join(name.split())
+
+
+class TeamRegistry:
+    """
+    Maps every source's team name variants to one integer team ID.
+
+    Canonical names are KenPom's. A name resolves through, in order: the
+    source's own alias table (the mapping CSVs), the normalized canonical
+    names, and a cached fuzzy match. Names that still don't resolve get
+    UNRESOLVED_ID and are kept for unresolved_report().
+    """
+
+    def __init__(self, canonical_names, aliases=None):
+        self.names = np.array(sorted(set(canonical_names)), dtype=object)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self._normalized = {}
+        for name, team_id in self.ids.items():
+            self._normalized.setdefault(normalize_name(name), team_id)
+        self._normalized_keys = list(self._normalized)
+
+        # source -> {alias: team_id}
+        self._aliases = {}
+        for source, mapping in (aliases or {}).items():
+            self._aliases[source] = {
+                alias: self.ids[canonical] for alias, canonical in mapping.items()
+                if canonical in self.ids
+            }
+
+        self._fuzzy_cache = {}
+        self.unresolved = {}
+
+    @classmethod
+    def from_kenpom(cls, kenpom_df, espn_mapping=ESPN_MAPPING_FILE,
+                    action_network_mapping=ACTION_NETWORK_MAPPING_FILE):
+        """Registry over KenPom's TeamName column with the repo's mapping CSVs as aliases."""
+        espn = pd.read_csv(espn_mapping)
+        action = pd.read_csv(action_network_mapping)
+        return cls(kenpom_df["TeamName"], aliases={
+            "espn": dict(zip(espn["ESPN"], espn["KenPom"])),
+            "action_network": dict(zip(action["ActionNetwork"], action["DanPom"])),
+        })
+
+    def _resolve_one(self, name, source):
+        team_id = self.ids.get(name)
+        if team_id is None:
+            team_id = self._aliases.get(source, {}).get(name)
+        if team_id is not None:
+            return team_id
+
+        key = normalize_name(name)
+        team_id = self._normalized.get(key)
+        if team_id is not None:
+            return team_id
+
+        if key not in self._fuzzy_cache:
+            # Most runs resolve every name exactly, so rapidfuzz loads on first use
+            from rapidfuzz import fuzz, process
+
+            match = process.extractOne(key, self._normalized_keys, scorer=fuzz.ratio,
+                                       score_cutoff=FUZZY_CUTOFF)
+            self._fuzzy_cache[key] = self._normalized[match[0]] if match else UNRESOLVED_ID
+        return self._fuzzy_cache[key]
+
+    def resolve(self, names, source):
+        """
+        Team IDs for a column of names from one source.
+
+        Parameters:
+            names (pd.Series): Team names as the source spells them
+            source (str): 'kenpom', 'espn', 'torvik' or 'action_network'
+
+        Returns:
+            np.ndarray: int32 team IDs, UNRESOLVED_ID where no match was found
+        """
+        codes, unique = pd.factorize(names)
+        unique_ids = np.array([self._resolve_one(str(n), source) for n in unique] + [UNRESOLVED_ID],
+                              dtype=np.int32)
+        # factorize marks missing names with -1, which picks the trailing UNRESOLVED_ID
+        ids = unique_ids[codes]
+
+        missed = [n for n, i in zip(unique, unique_ids) if i == UNRESOLVED_ID]
+        if missed:
+            self.unresolved.setdefault(source, set()).update(missed)
+        return ids
+
+    def name_of(self, ids):
+        """Canonical names for an array of IDs (None for unresolved)."""
+        ids = np.asarray(ids)
+        out = np.full(len(ids), None, dtype=object)
+        found = ids != UNRESOLVED_ID
+        out[found] = self.names[ids[found]]
+        return out
+
+    def unresolved_report(self):
+        if not self.unresolved:
+            return "All team names resolved"
+        lines = ["Unresolved team names:"]
+        for source, names in sorted(self.unresolved.items()):
+            lines.append(f"  {source} ({len(names)}): {', '.join(sorted(names))}")
+        return "\n".join(lines)
+
+
+def game_keys(away_ids, home_ids):
+    """Order-independent (low, high) team ID pair for joining on a matchup."""
+    return np.minimum(away_ids, home_ids), np.maximum(away_ids, home_ids)
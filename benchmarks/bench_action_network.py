@@ -0,0 +1,290 @@
+"""
+Action Network pro-report parse benchmark: the original row-dict parser vs.
+the columnar one in GetActionNetworkClean.
+
+Runs on a recorded payload (--payload, e.g. a saved get_sharp_report
+response) or on a synthetic slate of --games games with the same shape.
+
+Usage:
+    python benchmarks/bench_action_network.py [--payload FILE] [--games 2000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+import orjson
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from GetActionNetworkClean import ActionNetworkClient  # noqa: E402
+
+BOOK_IDS = ['15', '30', '1006', '1548', '974', '939', '1005', '972', '1902', '1903', '2194']
+
+
+# ---------- BASELINE: parser as it was before the columnar rewrite ----------
+
+def _parse_market_percentages(markets, book_id='15'):
+    """
+    Extract spread and total ticket/money percentages from the markets field.
+    Uses book_id 15 (DraftKings) as the consensus source. Falls back to the
+    first available book if 15 is not present.
+    """
+    result = {
+        'Spread_Tickets_Away': None, 'Spread_Money_Away': None,
+        'Spread_Tickets_Home': None, 'Spread_Money_Home': None,
+        'Total_Tickets_Over': None, 'Total_Money_Over': None,
+        'Total_Tickets_Under': None, 'Total_Money_Under': None,
+        'Total_Line': None,
+    }
+
+    book_data = markets.get(book_id) or next(iter(markets.values()), {})
+    bets = book_data.get('event', {})
+
+    for bet_type, entries in bets.items():
+        for e in entries:
+            side = e.get('side')
+            tickets_pct = e.get('bet_info', {}).get('tickets', {}).get('percent')
+            money_pct = e.get('bet_info', {}).get('money', {}).get('percent')
+
+            if 'spread' in bet_type:
+                if side == 'away':
+                    result['Spread_Tickets_Away'] = tickets_pct
+                    result['Spread_Money_Away'] = money_pct
+                elif side == 'home':
+                    result['Spread_Tickets_Home'] = tickets_pct
+                    result['Spread_Money_Home'] = money_pct
+
+            elif 'team_score' in bet_type or 'total' in bet_type:
+                if side == 'over':
+                    result['Total_Tickets_Over'] = tickets_pct
+                    result['Total_Money_Over'] = money_pct
+                    result['Total_Line'] = e.get('value')
+                elif side == 'under':
+                    result['Total_Tickets_Under'] = tickets_pct
+                    result['Total_Money_Under'] = money_pct
+
+    return result
+
+def legacy_parse_sharp_report_to_df(data):
+    """Parse sharp report JSON to DataFrame."""
+    games_data = []
+
+    for game in data.get('games', []):
+        # Use away_team_id and home_team_id to correctly identify teams
+        away_team_id = game.get('away_team_id')
+        home_team_id = game.get('home_team_id')
+
+        # Find the correct team names by matching IDs
+        away_team = None
+        home_team = None
+        for team in game['teams']:
+            if team['id'] == away_team_id:
+                away_team = team['display_name']
+            elif team['id'] == home_team_id:
+                home_team = team['display_name']
+
+        # Fallback to old behavior if IDs not found (shouldn't happen)
+        if not away_team or not home_team:
+            away_team = game['teams'][0]['display_name']
+            home_team = game['teams'][1]['display_name']
+
+        pro_report = game.get('pro_report', {})
+
+        # --- PRO REPORT SIGNALS (flagged by Action Network) ---
+        spread_data = pro_report.get('spread', {})
+        total_data = pro_report.get('total', {})
+
+        sharp_on_away = False
+        sharp_on_home = False
+        steam_moves_away = 0
+        steam_moves_home = 0
+        big_bets_flagged_away = False
+        big_bets_flagged_home = False
+        power_edge_away = 0.0
+        power_edge_home = 0.0
+        sharp_on_over = False
+        sharp_on_under = False
+        steam_moves_over = 0
+        steam_moves_under = 0
+
+        for signal in spread_data.get('away', []):
+            t = signal.get('signal_type')
+            if t == 'sharp_money':
+                sharp_on_away = True
+                steam_moves_away = signal.get('meta', {}).get('steam_moves', 0)
+            elif t == 'big_bets':
+                big_bets_flagged_away = True
+            elif t == 'power_rating_edge':
+                power_edge_away = signal.get('meta', {}).get('edge', 0.0)
+
+        for signal in spread_data.get('home', []):
+            t = signal.get('signal_type')
+            if t == 'sharp_money':
+                sharp_on_home = True
+                steam_moves_home = signal.get('meta', {}).get('steam_moves', 0)
+            elif t == 'big_bets':
+                big_bets_flagged_home = True
+            elif t == 'power_rating_edge':
+                power_edge_home = signal.get('meta', {}).get('edge', 0.0)
+
+        for signal in total_data.get('over', []):
+            if signal.get('signal_type') == 'sharp_money':
+                sharp_on_over = True
+                steam_moves_over = signal.get('meta', {}).get('steam_moves', 0)
+
+        for signal in total_data.get('under', []):
+            if signal.get('signal_type') == 'sharp_money':
+                sharp_on_under = True
+                steam_moves_under = signal.get('meta', {}).get('steam_moves', 0)
+
+        # --- RAW BET/MONEY PERCENTAGES from markets (all games, not just flagged) ---
+        market_pcts = _parse_market_percentages(game.get('markets', {}))
+
+        # Money differential: positive = more money than tickets (sharp indicator)
+        spread_money_diff_away = (
+            (market_pcts['Spread_Money_Away'] or 0) - (market_pcts['Spread_Tickets_Away'] or 0)
+        )
+        spread_money_diff_home = (
+            (market_pcts['Spread_Money_Home'] or 0) - (market_pcts['Spread_Tickets_Home'] or 0)
+        )
+
+        total_money_diff_over = (
+            (market_pcts['Total_Money_Over'] or 0) - (market_pcts['Total_Tickets_Over'] or 0)
+        )
+
+        game_info = {
+            'Away Team': away_team,
+            'Home Team': home_team,
+            # Raw spread percentages (every game)
+            'Spread_Tickets_Away': market_pcts['Spread_Tickets_Away'],
+            'Spread_Money_Away': market_pcts['Spread_Money_Away'],
+            'Spread_Tickets_Home': market_pcts['Spread_Tickets_Home'],
+            'Spread_Money_Home': market_pcts['Spread_Money_Home'],
+            # Money vs tickets differential for spread (key sharp indicator)
+            'Money_Diff_Away': spread_money_diff_away,
+            'Money_Diff_Home': spread_money_diff_home,
+            # Raw total percentages (every game)
+            'Total_Line': market_pcts['Total_Line'],
+            'Total_Tickets_Over': market_pcts['Total_Tickets_Over'],
+            'Total_Money_Over': market_pcts['Total_Money_Over'],
+            'Total_Tickets_Under': market_pcts['Total_Tickets_Under'],
+            'Total_Money_Under': market_pcts['Total_Money_Under'],
+            # Money vs tickets differential for totals
+            'Total_Money_Diff_Over': total_money_diff_over,
+            # PRO flagged signals
+            'Sharp_on_Away': sharp_on_away,
+            'Steam_Moves_Away': steam_moves_away,
+            'Sharp_on_Home': sharp_on_home,
+            'Steam_Moves_Home': steam_moves_home,
+            'Big_Bets_Flagged_Away': big_bets_flagged_away,
+            'Big_Bets_Flagged_Home': big_bets_flagged_home,
+            'Power_Edge_Away': power_edge_away,
+            'Power_Edge_Home': power_edge_home,
+            'Sharp_on_Over': sharp_on_over,
+            'Steam_Moves_Over': steam_moves_over,
+            'Sharp_on_Under': sharp_on_under,
+            'Steam_Moves_Under': steam_moves_under,
+            'Start_Time': game['start_time']
+        }
+
+        games_data.append(game_info)
+
+    return pd.DataFrame(games_data)
+
+
+# ---------- SYNTHETIC PAYLOAD ----------
+
+def _entry(side, value, rng):
+    return {'side': side, 'value': value, 'odds': rng.choice([-115, -110, -105, 100]),
+            'bet_info': {'tickets': {'percent': rng.randint(0, 100)},
+                         'money': {'percent': rng.randint(0, 100)}}}
+
+
+def synthetic_payload(n_games, seed=0):
+    """A pro-report payload with n_games games, every book priced and some signals flagged."""
+    rng = random.Random(seed)
+    games = []
+    for g in range(n_games):
+        away_id, home_id = 2 * g + 1, 2 * g + 2
+        line = rng.choice([x / 2 for x in range(-40, 41)])
+        total = rng.choice([x / 2 for x in range(260, 340)])
+        markets = {
+            book: {'event': {
+                'spread': [_entry('away', line, rng), _entry('home', -line, rng)],
+                'total': [_entry('over', total, rng), _entry('under', total, rng)],
+                'moneyline': [_entry('away', None, rng), _entry('home', None, rng)],
+            }} for book in BOOK_IDS
+        }
+        pro_report = {'spread': {'away': [], 'home': []}, 'total': {'over': [], 'under': []}}
+        if rng.random() < 0.3:
+            pro_report['spread'][rng.choice(['away', 'home'])].append(
+                {'signal_type': 'sharp_money', 'meta': {'steam_moves': rng.randint(0, 4)}})
+        if rng.random() < 0.2:
+            pro_report['spread'][rng.choice(['away', 'home'])].append({'signal_type': 'big_bets'})
+        if rng.random() < 0.2:
+            pro_report['spread'][rng.choice(['away', 'home'])].append(
+                {'signal_type': 'power_rating_edge', 'meta': {'edge': round(rng.uniform(0, 6), 1)}})
+        if rng.random() < 0.2:
+            pro_report['total'][rng.choice(['over', 'under'])].append(
+                {'signal_type': 'sharp_money', 'meta': {'steam_moves': rng.randint(0, 3)}})
+        games.append({
+            'away_team_id': away_id, 'home_team_id': home_id,
+            'teams': [{'id': home_id, 'display_name': f'Home {g}'}, {'id': away_id, 'display_name': f'Away {g}'}],
+            'start_time': '2026-01-17T00:00:00.000Z',
+            'pro_report': pro_report,
+            'markets': markets,
+        })
+    return {'games': games}
+
+
+def _best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payload", help="Recorded pro-report JSON file")
+    parser.add_argument("--games", type=int, default=2000, help="Synthetic slate size")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, "rb") as f:
+            raw = f.read()
+    else:
+        raw = orjson.dumps(synthetic_payload(args.games))
+    print(f"Payload: {len(raw) / 1e6:.1f} MB")
+
+    t_json, data = _best_of(lambda: json.loads(raw), args.repeat)
+    t_orjson, _ = _best_of(lambda: orjson.loads(raw), args.repeat)
+
+    client = ActionNetworkClient("", "")
+    t_legacy, legacy_df = _best_of(lambda: legacy_parse_sharp_report_to_df(data), args.repeat)
+    t_columnar, columnar_df = _best_of(lambda: client.parse_sharp_report_to_df(data), args.repeat)
+
+    # Same values, modulo dtypes (float32 and NaN for missing percentages)
+    pd.testing.assert_frame_equal(
+        legacy_df.apply(pd.to_numeric, errors='ignore').astype(float, errors='ignore'),
+        columnar_df.astype({c: float for c in columnar_df.select_dtypes('number').columns}),
+        check_dtype=False, atol=1e-4,
+    )
+
+    print(f"{'stage':<22}{'before (ms)':>12}{'after (ms)':>12}{'speedup':>9}")
+    print(f"{'decode':<22}{t_json * 1e3:>12.1f}{t_orjson * 1e3:>12.1f}{t_json / t_orjson:>8.1f}x")
+    print(f"{'parse':<22}{t_legacy * 1e3:>12.1f}{t_columnar * 1e3:>12.1f}{t_legacy / t_columnar:>8.1f}x")
+    print(f"{'frame memory (KB)':<22}{legacy_df.memory_usage(deep=True).sum() / 1e3:>12.0f}"
+          f"{columnar_df.memory_usage(deep=True).sum() / 1e3:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+ESPN schedule parse benchmark: the original BeautifulSoup/html.parser scraper
+vs. the lxml one in GetESPNSchedule.
+
+Runs on recorded schedule pages (--pages, e.g. benchmarks/fixtures/*/espn.html
+saved by run_benchmarks.py --record) or on a synthetic page of --games games.
+The original only read the first table on the page, so it also reports how
+many games each parser found.
+
+Usage:
+    python benchmarks/bench_espn.py [--pages FILE ...] [--games 200] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from GetESPNSchedule import parse_espn_schedule_html  # noqa: E402
+from fixtures import synthetic_slate  # noqa: E402
+
+
+# ---------- BASELINE: parser as it was before the lxml rewrite ----------
+
+def legacy_parse_espn_schedule_html(page_html):
+    soup = BeautifulSoup(page_html, 'html.parser')
+    schedule_table = soup.find('table', {'class': 'Table'})
+
+    if not schedule_table:
+        raise Exception("No schedule table found on the page")
+
+    games = []
+    for row in schedule_table.find_all('tr')[1:]:  # Skip header row
+        cols = row.find_all('td')
+        if len(cols) < 6:
+            continue  # Skip rows that don't have enough data
+
+        games.append({
+            "Away Team": cols[0].text.strip(),
+            "Home Team": cols[1].text.strip(),
+            "Time": cols[2].text.strip() if len(cols) > 2 else "N/A",
+            "TV": cols[3].text.strip() if len(cols) > 3 else "N/A",
+            "Tickets": cols[4].text.strip() if len(cols) > 4 else "N/A",
+            "Location": cols[5].text.strip() if len(cols) > 5 else "N/A",
+            "Odds": cols[6].text.strip() if len(cols) > 6 else "N/A",
+        })
+
+    return pd.DataFrame(games)
+
+
+def _best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", nargs="*", default=[], help="Recorded ESPN schedule pages")
+    parser.add_argument("--games", type=int, default=200, help="Synthetic page size")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = {}
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            pages[path] = f.read()
+    if not pages:
+        pages[f"synthetic ({args.games} games)"] = synthetic_slate(args.games)["espn"]
+
+    print(f"{'page':<40}{'before (ms)':>12}{'after (ms)':>12}{'speedup':>9}{'games before/after':>20}")
+    for name, page in pages.items():
+        t_legacy, legacy_df = _best_of(lambda: legacy_parse_espn_schedule_html(page), args.repeat)
+        t_lxml, lxml_df = _best_of(lambda: parse_espn_schedule_html(page), args.repeat)
+
+        # Same odds text for the games both parsers found
+        shared = min(len(legacy_df), len(lxml_df))
+        assert list(legacy_df["Odds"][:shared]) == list(lxml_df["Odds"][:shared])
+
+        print(f"{name[-40:]:<40}{t_legacy * 1e3:>12.1f}{t_lxml * 1e3:>12.1f}{t_legacy / t_lxml:>8.1f}x"
+              f"{f'{len(legacy_df)}/{len(lxml_df)}':>20}")
+
+
+if __name__ == "__main__":
+    main()
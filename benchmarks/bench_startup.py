@@ -0,0 +1,143 @@
+"""
+Startup benchmark: import time, --help time and an offline ESPN + KenPom
+report, each in a fresh interpreter, checked against a baseline and against
+the modules each one is allowed to load.
+
+Importing RunDanPom must not load any source scraper, odds parsing, the
+simulator or the report store, and a run without Torvik must never load the
+Chromium stack. Times are the best of --repeat fresh processes, including
+interpreter startup; memory is the process peak RSS.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--save-baseline] [--importtime]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from run_benchmarks import DEFAULT_THRESHOLD, compare
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCH_DIR, "startup_baseline.json")
+
+# Loaded only when the source or step that needs them runs
+LAZY_MODULES = ["GetESPNSchedule", "GetBartTovik", "GetActionNetworkClean", "KenPomAPI", "ParseOdds",
+                "MonteCarlo", "ReportStore", "lxml", "rapidfuzz", "bs4", "requests_html", "pyppeteer"]
+CHROMIUM_MODULES = ["GetBartTovik", "requests_html", "pyppeteer"]
+
+_REPORT = f"""
+import os, tempfile
+import orjson, pandas as pd
+sys.path.insert(0, {BENCH_DIR!r})
+from fixtures import synthetic_slate
+import RunDanPom
+from GetESPNSchedule import parse_espn_schedule_html
+from Schemas import apply_schema
+from TeamRegistry import ACTION_NETWORK_MAPPING_FILE, ESPN_MAPPING_FILE, TeamRegistry
+RunDanPom.MONTE_CARLO_SIMS = 0
+slate = synthetic_slate(60)
+espn = RunDanPom.clean_espn_frame(parse_espn_schedule_html(slate["espn"]), RunDanPom.load_override_dict())
+kenpom = apply_schema(pd.DataFrame(orjson.loads(slate["kenpom"])), "kenpom")
+registry = TeamRegistry.from_kenpom(kenpom, ESPN_MAPPING_FILE, ACTION_NETWORK_MAPPING_FILE)
+kenpom["Team_ID"] = registry.resolve(kenpom["TeamName"], "kenpom")
+# Keep synthetic acronyms out of the real odds memo
+os.chdir(tempfile.mkdtemp())
+RunDanPom.build_report(espn, kenpom, None, None, registry)
+"""
+
+# name -> (code run after 'import sys', modules it must not load)
+SCENARIOS = {
+    "import": ("import RunDanPom", LAZY_MODULES),
+    "help": ("import runpy; sys.argv = ['RunDanPom.py', '--help']\n"
+             "try:\n    runpy.run_path('RunDanPom.py', run_name='__main__')\nexcept SystemExit:\n    pass",
+             LAZY_MODULES),
+    "report_espn_kenpom": (_REPORT, CHROMIUM_MODULES),
+}
+
+_REPORT_BACK = """
+import json, resource
+print(json.dumps({"loaded": sorted(sys.modules), "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+"""
+
+
+def run_scenario(code):
+    """Runs code in a fresh interpreter; returns (seconds, peak MB, loaded modules)."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", f"import sys\n{code}\n{_REPORT_BACK}"], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    seconds = time.perf_counter() - start
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return seconds, report["peak_mb"], set(report["loaded"])
+
+
+def import_profile(top=15):
+    """Slowest cumulative imports of RunDanPom, from python -X importtime."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import RunDanPom"], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown/growth vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--importtime", action="store_true", help="Also list the slowest imports")
+    args = parser.parse_args()
+
+    results, leaks = {}, []
+    for name, (code, forbidden) in SCENARIOS.items():
+        runs = [run_scenario(code) for _ in range(args.repeat)]
+        results[name] = {"seconds": min(r[0] for r in runs), "peak_mb": min(r[1] for r in runs)}
+        leaked = sorted(set(forbidden) & runs[0][2])
+        if leaked:
+            leaks.append((name, leaked))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'scenario':<24}{'time (ms)':>11}{'base (ms)':>11}{'peak (MB)':>11}{'base (MB)':>11}")
+    for name, values in results.items():
+        base = baseline.get(name)
+        base_ms = f"{base['seconds'] * 1e3:>11.1f}" if base else f"{'-':>11}"
+        base_mb = f"{base['peak_mb']:>11.1f}" if base else f"{'-':>11}"
+        print(f"{name:<24}{values['seconds'] * 1e3:>11.1f}{base_ms}{values['peak_mb']:>11.1f}{base_mb}")
+
+    if args.importtime:
+        print("\nSlowest imports of RunDanPom (cumulative ms):")
+        for micros, module in import_profile():
+            print(f"  {micros / 1e3:>8.1f}  {module}")
+
+    for name, leaked in leaks:
+        print(f"✗ {name} loaded {', '.join(leaked)}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({**baseline, **results}, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline to {args.baseline}")
+        return 1 if leaks else 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, metric, before, after in regressions:
+        print(f"✗ {key} {metric}: {before:.4g} -> {after:.4g} (+{(after / before - 1) * 100:.0f}%)")
+    if regressions or leaks:
+        return 1
+    print(f"\n✓ No lazy module loaded early{' and no regression' if baseline else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Bart Torvik scrape benchmark: full Chromium render vs. the plain-HTTP fast path.
+
+Each mode runs in its own subprocess so peak RSS is measured in isolation.
+Peak RSS is the whole process tree (Chromium's memory lives in its child
+processes), summed from psutil samples taken while scraping. Without psutil
+it falls back to getrusage, whose RUSAGE_CHILDREN covers only the largest
+child that has already exited, so it is printed as a lower bound ('>=').
+
+Usage:
+    python benchmarks/bench_torvik.py [--runs 3] [--url URL]
+"""
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_URL = "https://www.barttorvik.com/schedule.php"
+
+
+def _render_once(url):
+    """The pre-fast-path scraper: new HTMLSession and render on every call."""
+    from requests_html import HTMLSession
+    from GetBartTovik import parse_schedule_html
+
+    session = HTMLSession()
+    try:
+        response = session.get(url)
+        response.html.render(timeout=30, sleep=2)
+        return parse_schedule_html(response.html.html)
+    finally:
+        session.close()
+
+
+def _fast_once(url):
+    """The plain-HTTP fast path, downloading the page on every call (no response cache)."""
+    from GetBartTovik import TORVIK_HEADERS, add_line_column, add_team_columns, parse_schedule_html
+    from HttpTransport import shared_transport
+
+    response = shared_transport().get(url, headers=TORVIK_HEADERS)
+    response.raise_for_status()
+    return add_line_column(add_team_columns(parse_schedule_html(response.text)))
+
+
+# Seconds between process tree samples
+SAMPLE_INTERVAL = 0.05
+
+
+class TreeRssSampler:
+    """Peak summed RSS of this process and all its descendants, sampled in a thread."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        me = psutil.Process()
+        total = 0
+        for proc in [me, *me.children(recursive=True)]:
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.peak_bytes = max(self.peak_bytes, total)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def _rusage_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (own + children) / 1024
+
+
+def _child(mode, url, runs):
+    scrape = _render_once if mode == "render" else _fast_once
+    timings = []
+    rows = 0
+    sampler = TreeRssSampler() if psutil is not None else contextlib.nullcontext()
+    with sampler:
+        for _ in range(runs):
+            start = time.perf_counter()
+            rows = len(scrape(url))
+            timings.append(time.perf_counter() - start)
+    if psutil is not None:
+        peak_mb, lower_bound = sampler.peak_bytes / 2**20, False
+    else:
+        peak_mb, lower_bound = _rusage_rss_mb(), True
+    print(json.dumps({"mode": mode, "timings": timings, "rows": rows,
+                      "peak_rss_mb": peak_mb, "rss_lower_bound": lower_bound}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--child", choices=["render", "fast"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.url, args.runs)
+        return
+
+    print(f"{'mode':<8}{'rows':>6}{'first (s)':>12}{'median (s)':>12}{'peak RSS (MB)':>16}")
+    for mode in ("render", "fast"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--runs", str(args.runs), "--url", args.url],
+            capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings = sorted(result["timings"])
+        median = timings[len(timings) // 2]
+        peak = f"{'>=' if result['rss_lower_bound'] else ''}{result['peak_rss_mb']:.0f}"
+        print(f"{mode:<8}{result['rows']:>6}{result['timings'][0]:>12.2f}{median:>12.2f}{peak:>16}")
+
+
+if __name__ == "__main__":
+    main()
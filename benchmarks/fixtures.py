@@ -0,0 +1,212 @@
+"""
+Fixtures for the offline benchmarks: one slate's raw ESPN HTML, Torvik HTML,
+Action Network JSON and KenPom JSON.
+
+Synthetic slates mimic the real pages closely enough to go through the same
+parsers. Recorded slates are real responses saved with record_fixtures() and
+are never committed (Action Network and KenPom data are paid).
+"""
+import html
+import os
+import random
+import sys
+
+import orjson
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_action_network import synthetic_payload  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURE_FILES = {
+    "espn": "espn.html",
+    "torvik": "torvik.html",
+    "action_network": "action_network.json",
+    "kenpom": "kenpom.json",
+}
+
+# Torvik's matchup regexes only accept letters and . & ' - in names
+_PLACES = [
+    "Alder", "Ashford", "Bayview", "Bellmont", "Birch", "Brook", "Cedar", "Clay", "Cliff", "Coast",
+    "Cross", "Crown", "Dale", "Delta", "Eagle", "East", "Elm", "Fair", "Fall", "Fern", "Ford", "Forest",
+    "Glen", "Gold", "Granite", "Green", "Grove", "Harbor", "Hart", "Haven", "Hill", "Holly", "Iron",
+    "Isle", "Kings", "Lake", "Laurel", "Lee", "Lime", "Lynn", "Maple", "Marsh", "Meadow", "Mill",
+    "Mount", "North", "Oak", "Ocean", "Park", "Pine", "Pleasant", "Port", "Prairie", "Quarry", "Rain",
+    "Raven", "Red", "Ridge", "River", "Rock", "Rose", "Sage", "Salem", "Sand", "Shore", "Silver",
+    "South", "Spring", "Stone", "Summit", "Sun", "Thorn", "Timber", "Union", "Vale", "Valley",
+    "West", "Willow", "Wolf", "Wood", "York", "Zion",
+]
+_SUFFIXES = ["", " St.", " Tech", " A&M", " Col."]
+_NETWORKS = ["ESPN", "ESPN2", "ESPNU", "ESPN+", "FS1", "CBSSN", "BTN", "SECN", "ACCN"]
+
+
+def team_pool(n_teams=362):
+    """Distinct team names, KenPom-sized by default."""
+    names = [place + suffix for suffix in _SUFFIXES for place in _PLACES]
+    return names[:n_teams]
+
+
+def _acronym(team):
+    return team.split()[0][:4].upper()
+
+
+def synthetic_slate(n_games, seed=0, teams=None):
+    """
+    Raw responses for an n_games slate.
+
+    Returns:
+        dict: 'espn' and 'torvik' HTML (str), 'action_network' and 'kenpom'
+              JSON (bytes), keyed like FIXTURE_FILES
+    """
+    rng = random.Random(seed)
+    teams = teams or team_pool()
+    picks = rng.sample(teams, min(2 * n_games, len(teams)))
+    while len(picks) < 2 * n_games:
+        picks.append(rng.choice(teams))
+    games = [(picks[2 * i], picks[2 * i + 1]) for i in range(n_games)]
+    lines = [rng.choice([x / 2 for x in range(-40, 41)]) for _ in games]
+    totals = [rng.choice([x / 2 for x in range(260, 340)]) for _ in games]
+
+    return {
+        "espn": _espn_html(games, lines, totals, rng),
+        "torvik": _torvik_html(games, lines, rng),
+        "action_network": _action_network_json(games, seed),
+        "kenpom": _kenpom_json(teams, rng),
+    }
+
+
+def _espn_html(games, lines, totals, rng):
+    # ESPN splits the page into day sections; late games land in the next day's table
+    split = len(games) - len(games) // 8
+    sections = []
+    for title, start, stop in (("Saturday, January 10, 2026", 0, split), ("Sunday, January 11, 2026", split, len(games))):
+        if start == stop:
+            continue
+        rows = [_espn_row(g, games[g], lines[g], totals[g], rng) for g in range(start, stop)]
+        sections.append(f'<div class="Table__Title">{title}</div>'
+                        f'<div class="ResponsiveTable"><table class="Table">{_ESPN_HEADER}'
+                        f'<tbody class="Table__TBODY">{"".join(rows)}</tbody></table></div>')
+    return f'<html><body><div class="ScheduleTables">{"".join(sections)}</div></body></html>'
+
+
+_ESPN_HEADER = ('<thead class="Table__THEAD"><tr class="Table__sub-header Table__TR"><th class="Table__TH">MATCHUP</th>'
+                '<th class="Table__TH"></th><th class="Table__TH">TIME</th><th class="Table__TH">TV</th>'
+                '<th class="Table__TH">tickets</th><th class="Table__TH">location</th>'
+                '<th class="Table__TH">odds by <img alt="ESPN BET"/></th></tr></thead>')
+
+
+def _espn_row(g, teams, line, total, rng):
+    away, home = teams
+    fav = away if line < 0 else home
+    rank = f'<span class="pr2">{rng.randint(1, 25)}</span>' if rng.random() < 0.15 else ""
+    marker = "vs" if rng.random() < 0.1 else "@"
+    odds = f"Line: {_acronym(fav)} {-abs(line)}" if line else "Line: EVEN"
+    return (
+        '<tr class="Table__TR Table__TR--sm Table__even">'
+        f'<td class="events__col Table__TD"><span class="Table__Team away">{rank}'
+        f'<a class="AnchorLink" href="/mens-college-basketball/team/_/id/{2 * g + 1}">{html.escape(away)}</a></span></td>'
+        f'<td class="colspan__col Table__TD"><span class="at">{marker}</span><span class="Table__Team">'
+        f'<a class="AnchorLink" href="/mens-college-basketball/team/_/id/{2 * g + 2}">{html.escape(home)}</a></span></td>'
+        f'<td class="date__col Table__TD"><a class="AnchorLink" href="/mens-college-basketball/game/_/gameId/{401800000 + g}">'
+        f'{rng.randint(1, 10)}:{rng.choice(["00", "30"])} PM</a></td>'
+        f'<td class="broadcast__col Table__TD">{rng.choice(_NETWORKS)}</td>'
+        '<td class="tickets__col Table__TD"><a class="AnchorLink">Tickets as low as $12</a></td>'
+        f'<td class="location__col Table__TD"><div>{html.escape(home)} Arena, Anytown</div></td>'
+        f'<td class="odds__col Table__TD"><div>{odds}</div><div>O/U: {total}</div></td>'
+        '</tr>'
+    )
+
+
+def _torvik_html(games, lines, rng):
+    rows = []
+    for (away, home), line in zip(games, lines):
+        fav = away if line < 0 else home
+        rows.append(
+            f"<tr><td>{rng.randint(6, 10)}:00 PM</td>"
+            f"<td>{rng.randint(1, 362)} {html.escape(away)} at {rng.randint(1, 362)} {html.escape(home)} "
+            f"{rng.choice(_NETWORKS)}</td>"
+            f"<td>{html.escape(fav)} -{abs(line)}, {rng.randint(60, 85)}-{rng.randint(55, 80)} "
+            f"({rng.randint(50, 99)}%)</td>"
+            f"<td>{rng.randint(0, 100)}</td></tr>"
+        )
+    return ("<html><body><table><thead><tr><th>Time</th><th>Matchup</th><th>T-Rank Line</th><th>TTQ</th></tr></thead>"
+            f"<tbody>{''.join(rows)}</tbody></table></body></html>")
+
+
+def _action_network_json(games, seed):
+    payload = synthetic_payload(len(games), seed=seed)
+    for game, (away, home) in zip(payload["games"], games):
+        game["teams"][0]["display_name"] = home
+        game["teams"][1]["display_name"] = away
+    return orjson.dumps(payload)
+
+
+def _kenpom_json(teams, rng):
+    ratings = []
+    for rank, team in enumerate(teams, 1):
+        adj_oe, adj_de = rng.gauss(106, 6), rng.gauss(106, 6)
+        ratings.append({
+            "Season": 2026, "TeamName": team, "ConfShort": rng.choice(["ACC", "B10", "SEC", "B12", "BE", "MWC"]),
+            "Wins": rng.randint(0, 20), "Losses": rng.randint(0, 20), "AdjEM": adj_oe - adj_de,
+            "RankAdjEM": rank, "AdjOE": adj_oe, "RankAdjOE": rank, "AdjDE": adj_de, "RankAdjDE": rank,
+            "Tempo": rng.gauss(67, 3), "AdjTempo": rng.gauss(67, 3), "RankAdjTempo": rank,
+            "Luck": rng.gauss(0, 0.03), "SOS": rng.gauss(0, 5), "NCSOS": rng.gauss(0, 5),
+        })
+    return orjson.dumps(ratings)
+
+
+def check_joined(merged_df, min_fraction=0.5):
+    """
+    Raises AssertionError when the join dropped a source: fewer than
+    min_fraction of the games got Torvik's line or the home team's KenPom
+    ratings. Every synthetic game is in every source.
+    """
+    for col in ("Bart Tovik", "Torvik_Spread", "AdjEM_Home"):
+        filled = merged_df[col].notna().mean() if col in merged_df.columns and len(merged_df) else 0.0
+        assert filled >= min_fraction, f"{col} filled for {filled:.0%} of {len(merged_df)} games after the join"
+
+
+def load_fixtures(path):
+    """A recorded slate directory, in the same shape as synthetic_slate()."""
+    slate = {}
+    for source, filename in FIXTURE_FILES.items():
+        with open(os.path.join(path, filename), "rb") as f:
+            raw = f.read()
+        slate[source] = raw.decode("utf-8") if filename.endswith(".html") else raw
+    return slate
+
+
+def record_fixtures(date_str, out_dir=None):
+    """
+    Saves one date's live responses as a fixture directory, bypassing the
+    HTTP cache. Action Network and KenPom need credentials in config.py.
+
+    Returns:
+        str: The fixture directory
+    """
+    import config
+    from GetActionNetworkClean import ActionNetworkClient
+    from GetBartTovik import TORVIK_HEADERS
+    from HttpCache import cached_get
+    from KenPomAPI import KenPomAPI
+    from RatingsStore import current_season
+
+    out_dir = out_dir or os.path.join(FIXTURE_DIR, date_str)
+    os.makedirs(out_dir, exist_ok=True)
+
+    espn_url = f"https://www.espn.com/mens-college-basketball/schedule/_/date/{date_str}"
+    responses = {
+        "espn": cached_get(espn_url, "espn", headers={"User-Agent": "Mozilla/5.0"}, ttl=0).content,
+        "torvik": cached_get("https://www.barttorvik.com/schedule.php", "torvik", params={"date": date_str},
+                             headers=TORVIK_HEADERS, ttl=0).content,
+    }
+    client = ActionNetworkClient(config.ACTION_NETWORK_EMAIL, config.ACTION_NETWORK_PASSWORD)
+    responses["action_network"] = orjson.dumps(client.get_sharp_report(date_str))
+    kp = KenPomAPI(config.KENPOM_API_KEY)
+    responses["kenpom"] = orjson.dumps(kp._get({"endpoint": "ratings", "y": current_season()}))
+
+    for source, raw in responses.items():
+        with open(os.path.join(out_dir, FIXTURE_FILES[source]), "wb") as f:
+            f.write(raw)
+    return out_dir
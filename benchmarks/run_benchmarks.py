@@ -0,0 +1,224 @@
+"""
+Offline benchmark suite: every parser, the source join and the model stages
+RunDanPom runs after it, driven by fixtures, with time and peak memory per
+stage checked against a baseline.
+
+Sizes are synthetic slates (1 game, a 60-game slate, a 200-game stress
+slate, a 120-date season of 60-game slates) plus any recorded fixture
+directories passed with --fixtures. Each stage's time is the best of
+--repeat runs (a single run for the season, which is long enough to be
+stable); peak memory comes from one extra run under tracemalloc.
+
+A stage fails when it is more than --threshold slower (or bigger) than the
+baseline, ignoring differences below MIN_DELTA_SECONDS / MIN_DELTA_MB.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 1,slate,stress,season] [--repeat 5]
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --fixtures benchmarks/fixtures/20260110
+    python benchmarks/run_benchmarks.py --record 20260110
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+import orjson
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from GetActionNetworkClean import ActionNetworkClient  # noqa: E402
+from GetBartTovik import add_line_column, add_team_columns, parse_schedule_html  # noqa: E402
+from GetESPNSchedule import parse_espn_schedule_html  # noqa: E402
+from JoinEngine import join_sources  # noqa: E402
+from MonteCarlo import simulate_games  # noqa: E402
+from ParseOdds import AcronymIndex, parse_odds_column  # noqa: E402
+from Schemas import apply_schema  # noqa: E402
+from RunDanPom import clean_espn_frame, clean_torvik_frame, load_override_dict  # noqa: E402
+from SpreadModels import evaluate_models  # noqa: E402
+from TeamRegistry import ACTION_NETWORK_MAPPING_FILE, ESPN_MAPPING_FILE, TeamRegistry  # noqa: E402
+from fixtures import check_joined, load_fixtures, record_fixtures, synthetic_slate  # noqa: E402
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# (games per slate, number of slates)
+SIZES = {
+    "1": (1, 1),
+    "slate": (60, 1),
+    "stress": (200, 1),
+    "season": (60, 120),
+}
+
+STAGES = ["espn_parse", "torvik_parse", "torvik_teams", "action_network_parse", "action_network_lines",
+          "kenpom_registry", "merge", "odds_parse", "model_spread", "simulate"]
+
+# Simulations per game in the simulate stage (timed apart from merge)
+BENCH_SIMS = 10_000
+
+DEFAULT_THRESHOLD = 0.25
+# Differences below these are noise, whatever the ratio
+MIN_DELTA_SECONDS = 0.0005
+MIN_DELTA_MB = 1.0
+
+
+class StageRecorder:
+    """Accumulates time, or tracemalloc peak, per stage across slates."""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.seconds = defaultdict(float)
+        self.peak_mb = defaultdict(float)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        self.seconds[name] += time.perf_counter() - start
+        if self.trace_memory:
+            peak = (tracemalloc.get_traced_memory()[1] - base) / 1e6
+            self.peak_mb[name] = max(self.peak_mb[name], peak)
+
+
+def run_pipeline(slates, override_dict, recorder):
+    """RunDanPom's per-date work from raw responses, one stage at a time."""
+    client = ActionNetworkClient("", "")
+
+    # Ratings and the registry are loaded once per run, as in batch mode
+    with recorder.stage("kenpom_registry"):
+        kenpom_df = apply_schema(pd.DataFrame(orjson.loads(slates[0]["kenpom"])), "kenpom")
+        registry = TeamRegistry.from_kenpom(kenpom_df, os.path.join(ROOT, ESPN_MAPPING_FILE),
+                                            os.path.join(ROOT, ACTION_NETWORK_MAPPING_FILE))
+        kenpom_df["Team_ID"] = registry.resolve(kenpom_df["TeamName"], "kenpom")
+
+    for slate in slates:
+        with recorder.stage("espn_parse"):
+            espn_df = clean_espn_frame(parse_espn_schedule_html(slate["espn"]), override_dict)
+        with recorder.stage("torvik_parse"):
+            df_tovik = parse_schedule_html(slate["torvik"])
+        with recorder.stage("torvik_teams"):
+            df_tovik = clean_torvik_frame(add_line_column(add_team_columns(df_tovik)))
+        with recorder.stage("action_network_parse"):
+            data = orjson.loads(slate["action_network"])
+            action_df = apply_schema(client.parse_sharp_report_to_df(data), "action_network")
+        with recorder.stage("action_network_lines"):
+            client.parse_market_lines_long(data)
+        # Only the join; build_report's odds parse and model are the next stages
+        with recorder.stage("merge"):
+            merged_df = join_sources(espn_df, kenpom_df, df_tovik, action_df, registry)
+        check_joined(merged_df)
+        with recorder.stage("odds_parse"):
+            parsed_odds = parse_odds_column(merged_df["Odds"], merged_df["Away Team"], merged_df["Home Team"],
+                                            index=AcronymIndex(path=None))
+        merged_df["Spread"], merged_df["Total"] = parsed_odds["Spread"], parsed_odds["Total"]
+        with recorder.stage("model_spread"):
+            evaluate_models(merged_df)
+        with recorder.stage("simulate"):
+            simulate_games(merged_df, BENCH_SIMS, seed=0)
+
+
+def measure(slates, override_dict, repeat):
+    """Best-of-repeat seconds and tracemalloc peak MB for every stage."""
+    best = {}
+    for _ in range(repeat):
+        recorder = StageRecorder()
+        run_pipeline(slates, override_dict, recorder)
+        for name, seconds in recorder.seconds.items():
+            best[name] = min(best.get(name, seconds), seconds)
+
+    recorder = StageRecorder(trace_memory=True)
+    tracemalloc.start()
+    try:
+        run_pipeline(slates, override_dict, recorder)
+    finally:
+        tracemalloc.stop()
+    return {name: {"seconds": best[name], "peak_mb": recorder.peak_mb[name]} for name in STAGES}
+
+
+def compare(results, baseline, threshold):
+    """Returns [(key, metric, baseline, current)] for every regression."""
+    regressions = []
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+        for metric, floor in (("seconds", MIN_DELTA_SECONDS), ("peak_mb", MIN_DELTA_MB)):
+            before, after = baseline[key][metric], current[metric]
+            if after - before > floor and after > before * (1 + threshold):
+                regressions.append((key, metric, before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(SIZES), help="Comma-separated synthetic sizes")
+    parser.add_argument("--fixtures", nargs="*", default=[], help="Recorded fixture directories")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown/growth vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--record", metavar="YYYYMMDD", help="Record live fixtures for a date and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        print(f"Recorded fixtures to {record_fixtures(args.record)}")
+        return 0
+
+    os.chdir(ROOT)
+    override_dict = load_override_dict()
+    runs = {}
+    for size in filter(None, args.sizes.split(",")):
+        n_games, n_slates = SIZES[size]
+        runs[size] = [synthetic_slate(n_games, seed=i) for i in range(n_slates)]
+    for path in args.fixtures:
+        runs[f"recorded:{os.path.basename(os.path.normpath(path))}"] = [load_fixtures(path)]
+
+    results = {}
+    for size, slates in runs.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            stages = measure(slates, override_dict, args.repeat if len(slates) == 1 else 1)
+        for name, values in stages.items():
+            results[f"{name}/{size}"] = values
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'stage/size':<36}{'time (ms)':>11}{'base (ms)':>11}{'peak (MB)':>11}{'base (MB)':>11}")
+    for key, values in results.items():
+        base = baseline.get(key)
+        base_ms = f"{base['seconds'] * 1e3:>11.1f}" if base else f"{'-':>11}"
+        base_mb = f"{base['peak_mb']:>11.2f}" if base else f"{'-':>11}"
+        print(f"{key:<36}{values['seconds'] * 1e3:>11.1f}{base_ms}{values['peak_mb']:>11.2f}{base_mb}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({**baseline, **results}, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("\nNo baseline yet; run with --save-baseline to store one")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, metric, before, after in regressions:
+        print(f"✗ {key} {metric}: {before:.4g} -> {after:.4g} (+{(after / before - 1) * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"\n✓ No stage regressed more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,5 +14,43 @@ ACTION_NETWORK_PASSWORD = "your_password_here"
 # Get your API key from: https://kenpom.com/api
 KENPOM_API_KEY = "your_kenpom_api_key_here"
 
-# Tournament mode: Set to True for neutral-site tournament games (removes 3.5 home court advantage)
+# Tournament mode: Set to True to treat every game as neutral site (removes 3.5 home court advantage).
+# Games ESPN lists as neutral site never get it.
 TOURNEY_GM = False
+
+# Spread models compared in DanPomModels_YYYYMMDD.csv ("module:function" for your own),
+# the one used for Model_Spread, and KenPom's share of the blended model
+SPREAD_MODELS = ["kenpom", "torvik", "blended"]
+PRIMARY_SPREAD_MODEL = "kenpom"
+BLEND_WEIGHT = 0.5
+
+# Monte Carlo simulations per game for Cover_Prob / Over_Prob / EV (0 to skip),
+# and the seed that makes them reproducible
+MONTE_CARLO_SIMS = 100000
+MONTE_CARLO_SEED = 0
+
+# Folder the daily CSVs are written to
+OUTPUT_DIR = "/home/dconde/Documents/DanPom"
+
+# Folder every run's games and Action Network frames are appended to (None to turn off)
+REPORT_STORE_DIR = "report_store"
+
+# Folder of the bulk KenPom archive written by KenPomIngest.py
+# KENPOM_ARCHIVE_DIR = "kenpom_archive"
+
+# Optional: seconds to reuse a cached HTTP response before revalidating it
+# (defaults: espn 300, torvik 600, action_network 60)
+# HTTP_CACHE_TTL = {"espn": 300, "torvik": 600, "action_network": 60}
+
+# Optional: HTTP timeouts as (connect, read) seconds, and per-host rate limits
+# as (requests per second, burst). See HttpTransport.py for the defaults.
+# HTTP_TIMEOUT = (5, 30)
+# HTTP_RATE_LIMITS = {"kenpom.com": (1, 2)}
+
+# Optional: time zone of ESPN's schedule tip times (for the parsed Tip_Time)
+# ESPN_TIMEZONE = "America/New_York"
+
+# Optional: port of ReportServer.py and seconds between its background refreshes
+# (defaults: kenpom 3600, the HTTP cache TTL for espn/torvik/action_network)
+# SERVER_PORT = 8765
+# SERVER_REFRESH_SECONDS = {"espn": 300, "action_network": 60}
@@ -0,0 +1,49 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import Backtest
+from CalcModelSpread import HOME_COURT_ADVANTAGE
+
+
+@pytest.fixture
+def panel(monkeypatch):
+    ratings = pd.DataFrame({"TeamName": ["Duke", "Yale"], "AdjEM": [20.0, 10.0], "AdjTempo": [70.0, 70.0]})
+    monkeypatch.setattr(Backtest, "list_snapshots", lambda season: [(datetime.datetime(2025, 11, 1), "snap")])
+    monkeypatch.setattr(Backtest, "load_snapshot", lambda path: ratings)
+    return Backtest.RatingsPanel(2026)
+
+
+def games(**site):
+    return pd.DataFrame({"Date": ["2026-01-10", "2026-01-10"], "Away Team": ["Yale", "Yale"],
+                         "Home Team": ["Duke", "Duke"], "Away Score": [60, 60], "Home Score": [70, 70],
+                         "Spread": [5.0, 5.0], **site})
+
+
+def test_neutral_game_gets_no_home_court(panel):
+    results = Backtest.run_backtest(games(Neutral=[False, True]), panel)
+    # (20 - 10) * (70 + 70) / 200 = 7 points before home court
+    np.testing.assert_allclose(results["Model_Spread"], [7.0 + HOME_COURT_ADVANTAGE, 7.0])
+
+
+def test_site_column_marks_neutral_games(panel):
+    results = Backtest.run_backtest(games(Site=["H", "Neutral"]), panel)
+    np.testing.assert_allclose(results["Model_Spread"], [7.0 + HOME_COURT_ADVANTAGE, 7.0])
+
+
+def test_tourney_gm_drops_home_court_everywhere(panel):
+    results = Backtest.run_backtest(games(), panel, tourney_gm=True)
+    np.testing.assert_allclose(results["Model_Spread"], [7.0, 7.0])
+
+
+def test_panel_falls_back_to_archived_ratings(monkeypatch):
+    archived = pd.DataFrame({"Season": [2019, 2019], "TeamName": ["Duke", "Yale"],
+                             "AdjEM": [20.0, 10.0], "AdjTempo": [70.0, 70.0]})
+    monkeypatch.setattr(Backtest, "list_snapshots", lambda season: [])
+    monkeypatch.setattr(Backtest, "read_archive", lambda endpoint, seasons, columns: archived)
+    panel = Backtest.RatingsPanel(2019)
+
+    ratings = panel.lookup(pd.to_datetime(["2018-11-10", "2019-03-01"]), ["Duke", "Yale"])
+    np.testing.assert_allclose(ratings["AdjEM"], [20.0, 10.0])
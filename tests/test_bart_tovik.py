@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from GetBartTovik import add_line_column, add_team_columns, extract_away_team, extract_home_team, parse_schedule_html
+
+PAGE = """<html><body><table>
+<thead><tr><th>Time</th><th>Matchup</th><th>T-Rank Line</th><th>TTQ</th></tr></thead>
+<tbody>
+<tr><td>7:00 PM</td><td>41 Florida Atlantic at 12 Saint Mary's ESPN2</td><td>Saint Mary's -6.5, 74-67 (72%)</td><td>55</td></tr>
+<tr><td>8:00 PM</td><td>88 Texas A&amp;M-Corpus Christi vs 130 Nevada ESPN+</td><td>Texas A&amp;M-Corpus Christi -1, 70-69 (53%)</td><td>20</td></tr>
+<tr><td>9:00 PM</td><td>5 Saint Mary's at 200 Central Arkansas</td><td>Saint Mary's -15, 80-65 (91%)</td><td>10</td></tr>
+</tbody></table></body></html>"""
+
+
+def test_multi_word_teams_parse_whole():
+    df = add_line_column(add_team_columns(parse_schedule_html(PAGE)))
+
+    assert df["Away Team"].tolist() == ["Florida Atlantic", "Texas A&M-Corpus Christi", "Saint Mary's"]
+    assert df["Home Team"].tolist() == ["Saint Mary's", "Nevada", "Central Arkansas"]
+    assert df["Torvik_Spread"].tolist() == [6.5, -1.0, -15.0]
+
+
+@pytest.mark.parametrize("matchup, away, home", [
+    ("41 Florida Atlantic at 12 Saint Mary's ESPN2", "Florida Atlantic", "Saint Mary's"),
+    ("3 Kansas St. vs 9 Vanderbilt", "Kansas St.", "Vanderbilt"),
+])
+def test_row_extractors(matchup, away, home):
+    assert extract_away_team(matchup) == away
+    assert extract_home_team(matchup) == home
+
+
+def test_missing_matchup_gives_no_teams():
+    df = add_team_columns(pd.DataFrame({"Matchup": [None]}))
+    assert df["Away Team"].isna().all() and df["Home Team"].isna().all()